@@ -0,0 +1,227 @@
+"""Hot-path latency benchmark over synthetic catalogs (offline).
+
+For every combination of catalog size, layout (flat / namespaced) and engine,
+a fresh subprocess generates a synthetic skills tree, builds the index and
+times build_index, should_reindex, search_skills, load_skill, list_skills and
+read_skill_file. Results (p50/p95/p99 in ms, peak RSS in MB) are emitted as JSON.
+
+Engines:
+    none    lancedb backend, embedding_provider=none (FTS only)
+    fake    lancedb backend with a deterministic fake OpenAI client, so the real
+            batching/cache/vector/hybrid code runs without network access
+    local   lancedb backend with embedding_provider=local (hashed n-gram vectors)
+    memory  in-process BM25 backend (index_backend=memory)
+
+    python benchmarks/latency.py --sizes 100,1000 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import WORDS, generate_catalog
+
+ENGINES = ("none", "fake", "local", "memory")
+LAYOUTS = ("flat", "namespaced")
+FAKE_DIMENSIONS = 64
+
+
+# --- fake embeddings -----------------------------------------------------
+class _FakeEmbeddingItem:
+    def __init__(self, index: int, embedding: list[float]):
+        self.index = index
+        self.embedding = embedding
+
+
+class _FakeEmbeddings:
+    """Stands in for ``OpenAI().embeddings``: bag-of-words hashed into unit vectors."""
+
+    def create(self, *, input: list[str], model: str):  # noqa: A002 - OpenAI signature
+        data = [_FakeEmbeddingItem(i, fake_vector(text)) for i, text in enumerate(input)]
+        return type("FakeResponse", (), {"data": data})()
+
+
+class FakeOpenAIClient:
+    embeddings = _FakeEmbeddings()
+
+
+def fake_vector(text: str) -> list[float]:
+    vec = [0.0] * FAKE_DIMENSIONS
+    for word in text.lower().split():
+        digest = hashlib.blake2b(word.encode("utf-8"), digest_size=4).digest()
+        bucket = int.from_bytes(digest, "little")
+        vec[bucket % FAKE_DIMENSIONS] += 1.0 if bucket & 0x80000000 else -1.0
+    norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+    return [v / norm for v in vec]
+
+
+def install_fake_openai() -> None:
+    from skillport.modules.indexing.internal import embeddings
+
+    embeddings._openai_client = lambda *args: FakeOpenAIClient()
+
+
+# --- measurement ---------------------------------------------------------
+def percentiles(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+    return {
+        "n": len(ordered),
+        "p50": round(statistics.median(ordered), 3),
+        "p95": round(pick(0.95), 3),
+        "p99": round(pick(0.99), 3),
+    }
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_case(size: int, layout: str, engine: str, iterations: int, seed: int) -> dict:
+    from skillport.modules.indexing import build_index, should_reindex
+    from skillport.modules.skills import list_skills, load_skill, read_skill_file, search_skills
+    from skillport.shared.config import Config
+
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory(prefix="skillport-bench-") as tmp:
+        root = Path(tmp)
+        ids = generate_catalog(root / "skills", size, namespaced=layout == "namespaced", seed=seed)
+        overrides: dict = {}
+        if engine == "fake":
+            install_fake_openai()
+            overrides = {"embedding_provider": "openai", "openai_api_key": "fake"}
+        elif engine == "local":
+            overrides = {"embedding_provider": "local"}
+        elif engine == "memory":
+            overrides = {"index_backend": "memory"}
+        config = Config(
+            skills_dir=root / "skills",
+            db_path=root / "index" / "skills.lancedb",
+            **overrides,
+        )
+
+        results: dict[str, dict] = {}
+        build_ms = timed(build_index, config=config, force=True)
+        results["build_index"] = percentiles([build_ms])
+        results["should_reindex"] = percentiles(
+            [timed(should_reindex, config=config) for _ in range(max(3, iterations // 10))]
+        )
+
+        queries = [" ".join(rng.sample(WORDS, rng.randint(1, 3))) for _ in range(iterations)]
+        results["search_skills"] = percentiles(
+            [timed(search_skills, q, limit=10, config=config) for q in queries]
+        )
+        results["search_skills_repeat"] = percentiles(
+            [timed(search_skills, q, limit=10, config=config) for q in queries]
+        )
+
+        sample_ids = [rng.choice(ids) for _ in range(iterations)]
+        results["load_skill"] = percentiles(
+            [timed(load_skill, skill_id, config=config) for skill_id in sample_ids]
+        )
+        results["list_skills"] = percentiles(
+            [timed(list_skills, config=config, limit=100) for _ in range(max(3, iterations // 10))]
+        )
+        with_files = [skill_id for skill_id in ids if skill_id.endswith("0")] or ids[:1]
+        results["read_skill_file"] = percentiles(
+            [
+                timed(
+                    read_skill_file, rng.choice(with_files), "templates/config.yaml", config=config
+                )
+                for _ in range(iterations)
+            ]
+        )
+
+    return {
+        "size": size,
+        "layout": layout,
+        "engine": engine,
+        "latency_ms": results,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated sizes")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS))
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--iterations", type=int, default=100, help="Samples per operation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write JSON results here as well")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # internal: size:layout:engine
+    args = parser.parse_args(argv)
+
+    if args.case:
+        size, layout, engine = args.case.split(":")
+        result = run_case(int(size), layout, engine, args.iterations, args.seed)
+        print(json.dumps(result))
+        return 0
+
+    cases = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        for layout in args.layouts.split(","):
+            for engine in args.engines.split(","):
+                # Each case runs in its own process so peak RSS and caches are per case.
+                proc = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--case",
+                        f"{size}:{layout}:{engine}",
+                        "--iterations",
+                        str(args.iterations),
+                        "--seed",
+                        str(args.seed),
+                    ],
+                    capture_output=True,
+                    text=True,
+                )
+                if proc.returncode != 0:
+                    print(proc.stderr[-2000:], file=sys.stderr)
+                    return proc.returncode
+                case = json.loads(proc.stdout.strip().splitlines()[-1])
+                summary = ", ".join(
+                    f"{op}={stats['p50']}ms" for op, stats in case["latency_ms"].items()
+                )
+                print(f"[{size} {layout} {engine}] {summary}", file=sys.stderr)
+                cases.append(case)
+
+    report = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "cases": cases,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+"""Startup cost of the CLI and the MCP server, with a baseline regression check.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime`` against a
+small synthetic catalog (HOME is redirected to a temp dir). Per scenario we record
+the median wall time, the median total import time, the slowest top-level
+packages, and the set of non-stdlib top-level packages imported. Packages the
+interpreter loads on its own (site hooks, ``.pth`` imports; measured with a bare
+``python -c pass``) are not held against skillport, so a baseline recorded on one
+Python installation can be checked on another.
+
+    python benchmarks/startup.py                    # print results as JSON
+    python benchmarks/startup.py --check            # compare with the baseline
+    python benchmarks/startup.py --update-baseline  # rewrite the baseline
+
+--check fails when a scenario's import time exceeds the baseline by more than
+--tolerance (relative) plus --slack-ms, or when it imports a top-level package
+the baseline did not (e.g. an eager ``import lancedb`` in the CLI path).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from synthetic import generate_catalog
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "startup.json"
+CATALOG_SIZE = 50
+# Names that only reflect how the interpreter is set up: site customization hooks
+# and the stdlib's Jython probe (``from org.python.core import ...`` in pickle).
+INTERPRETER_MODULES = frozenset({"sitecustomize", "usercustomize", "org"})
+
+_CLI = "import sys\nsys.argv = {argv!r}\nfrom skillport.interfaces.cli.app import run\nrun()\n"
+
+# Transport start is the readiness point: the fake run() exits right there.
+# The background index warm-up is disabled so it cannot race the measurement.
+_MCP_READY = """
+import os, sys
+import fastmcp
+from skillport.interfaces.mcp import warmup
+warmup.IndexWarmup.start = lambda self: self
+def _ready(self, *args, **kwargs):
+    sys.stderr.flush()
+    os._exit(0)
+fastmcp.FastMCP.run = _ready
+from skillport.interfaces.mcp.cli import main
+sys.argv = ["skillport-mcp"]
+main()
+"""
+
+SCENARIOS: dict[str, str] = {
+    "cli --version": _CLI.format(argv=["skillport", "--version"]),
+    "cli list": _CLI.format(argv=["skillport", "list", "--limit", "1000"]),
+    "cli show": _CLI.format(argv=["skillport", "show", "skill-00001"]),
+    "mcp ready": _MCP_READY,
+}
+
+
+def parse_importtime(stderr: str) -> tuple[float, dict[str, float]]:
+    """Return (total import ms, self ms per top-level package) from -X importtime output."""
+    per_package: dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        package = parts[2].strip().split(".")[0]
+        per_package[package] += int(parts[0]) / 1000
+    return sum(per_package.values()), dict(per_package)
+
+
+def _is_third_party(package: str) -> bool:
+    return (
+        not package.startswith("_")
+        and package not in sys.stdlib_module_names
+        and package not in INTERPRETER_MODULES
+    )
+
+
+def interpreter_packages(env: dict[str, str]) -> list[str]:
+    """Non-stdlib top-level packages a bare interpreter imports before running any code."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return sorted(p for p in parse_importtime(proc.stderr)[1] if _is_third_party(p))
+
+
+def run_scenario(code: str, env: dict[str, str], runs: int) -> dict:
+    walls: list[float] = []
+    imports: list[float] = []
+    packages: dict[str, float] = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        walls.append((time.perf_counter() - start) * 1000)
+        if proc.returncode != 0:
+            raise RuntimeError(f"scenario failed ({proc.returncode}):\n{proc.stderr[-2000:]}")
+        total, packages = parse_importtime(proc.stderr)
+        imports.append(total)
+
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:10]
+    return {
+        "wall_ms": round(statistics.median(walls), 1),
+        "import_ms": round(statistics.median(imports), 1),
+        "slowest_packages": {name: round(ms, 1) for name, ms in slowest},
+        "packages": sorted(p for p in packages if _is_third_party(p)),
+    }
+
+
+def measure(runs: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="skillport-startup-") as tmp:
+        home = Path(tmp)
+        skills_dir = home / "skills"
+        generate_catalog(skills_dir, CATALOG_SIZE, body_lines=(5, 20))
+        env = {
+            **os.environ,
+            "HOME": str(home),
+            "USERPROFILE": str(home),
+            "SKILLPORT_SKILLS_DIR": str(skills_dir),
+        }
+        env.pop("SKILLPORT_DB_PATH", None)
+        startup = interpreter_packages(env)
+        results = {name: run_scenario(code, env, runs) for name, code in SCENARIOS.items()}
+    return {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "runs": runs,
+        "interpreter_packages": startup,
+        "scenarios": results,
+    }
+
+
+def check(current: dict, baseline: dict, *, tolerance: float, slack_ms: float) -> list[str]:
+    failures: list[str] = []
+    startup = set(current.get("interpreter_packages", ()))
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        limit = base["import_ms"] * (1 + tolerance) + slack_ms
+        if result["import_ms"] > limit:
+            failures.append(
+                f"{name}: import time {result['import_ms']}ms exceeds {limit:.1f}ms "
+                f"(baseline {base['import_ms']}ms)"
+            )
+        new_packages = sorted(set(result["packages"]) - set(base["packages"]) - startup)
+        if new_packages:
+            failures.append(f"{name}: new top-level imports: {', '.join(new_packages)}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per scenario (median)")
+    parser.add_argument("--check", action="store_true", help="Fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true", help="Rewrite baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative growth")
+    parser.add_argument("--slack-ms", type=float, default=50.0, help="Allowed absolute growth")
+    args = parser.parse_args(argv)
+
+    current = measure(args.runs)
+    print(json.dumps(current, indent=2))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if args.check:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run --update-baseline", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        failures = check(current, baseline, tolerance=args.tolerance, slack_ms=args.slack_ms)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
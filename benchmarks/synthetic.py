@@ -0,0 +1,70 @@
+"""Deterministic synthetic skill trees for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+WORDS = (
+    "pdf text extract table chart report summary git commit review branch docker image "
+    "deploy cloud bucket sql query schema migrate test unit coverage lint format python "
+    "node script api client auth token cache queue worker email calendar slide deck "
+    "spreadsheet csv json yaml parse validate translate image resize audio video"
+).split()
+CATEGORIES = ("docs", "dev", "data", "ops", "media", "office")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def generate_catalog(
+    root: Path,
+    count: int,
+    *,
+    namespaced: bool = False,
+    body_lines: tuple[int, int] = (20, 200),
+    seed: int = 0,
+) -> list[str]:
+    """Write ``count`` skills under ``root`` and return their ids.
+
+    Namespaced trees spread skills over ``ns-00``..``ns-NN`` (about 50 per namespace).
+    Bodies vary between ``body_lines`` lines so file sizes are uneven, like real catalogs.
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    namespaces = max(1, count // 50)
+    ids: list[str] = []
+
+    for i in range(count):
+        name = f"skill-{i:05d}"
+        skill_id = f"ns-{i % namespaces:02d}/{name}" if namespaced else name
+        skill_dir = root / skill_id
+        skill_dir.mkdir(parents=True, exist_ok=True)
+
+        tags = ", ".join(rng.sample(WORDS, 3))
+        body = "\n".join(_sentence(rng, 12) for _ in range(rng.randint(*body_lines)))
+        (skill_dir / "SKILL.md").write_text(
+            "---\n"
+            f"name: {name}\n"
+            f"description: {_sentence(rng, 10)}\n"
+            "metadata:\n"
+            "  skillport:\n"
+            f"    category: {rng.choice(CATEGORIES)}\n"
+            f"    tags: [{tags}]\n"
+            f"    alwaysApply: {'true' if i % 97 == 0 else 'false'}\n"
+            "---\n"
+            f"# {name}\n\n{body}\n",
+            encoding="utf-8",
+        )
+        if i % 10 == 0:
+            (skill_dir / "templates").mkdir(exist_ok=True)
+            (skill_dir / "templates" / "config.yaml").write_text(
+                "\n".join(f"key_{j}: {_sentence(rng, 4)}" for j in range(50)),
+                encoding="utf-8",
+            )
+        ids.append(skill_id)
+    return ids
+
+
+__all__ = ["WORDS", "generate_catalog"]
@@ -16,6 +16,11 @@ from pathlib import Path
 import typer
 
 from skillport.shared.config import Config
+from skillport.shared.frontmatter import (
+    FRONTMATTER_CACHE_FILENAME,
+    load_frontmatter_cache,
+    save_frontmatter_cache,
+)
 
 from .commands.add import add
 from .commands.doc import doc
@@ -81,6 +86,12 @@ def main(
     config = Config(**overrides) if overrides else Config()
     ctx.obj = config
 
+    # Reuse frontmatter parsed by earlier runs (entries are validated by mtime/size).
+    if config.frontmatter_cache:
+        cache_path = config.meta_dir / FRONTMATTER_CACHE_FILENAME
+        load_frontmatter_cache(cache_path)
+        ctx.call_on_close(lambda: save_frontmatter_cache(cache_path))
+
 
 # Register commands with enhanced help
 app.command(
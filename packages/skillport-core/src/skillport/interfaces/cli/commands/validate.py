@@ -8,20 +8,19 @@ import typer
 from rich.panel import Panel
 
 from skillport.modules.skills.internal.validation import validate_skill_record
-from skillport.shared.utils import parse_frontmatter, resolve_inside
+from skillport.shared.frontmatter import split_frontmatter
+from skillport.shared.scan import is_scannable
+from skillport.shared.utils import resolve_inside
 
 from ..context import get_config
 from ..theme import console, print_error, print_success, print_warning
 
-# Directories to exclude from scanning (matching tracking.py)
-SCAN_EXCLUDE_NAMES = {"__pycache__", "node_modules"}
-
 
 def _scan_skills_from_path(target_path: Path) -> list[dict]:
     """Scan skills from a path (single skill dir or parent dir with multiple skills).
 
-    Uses rglob to recursively find all SKILL.md files, matching the behavior
-    of the indexing logic in tracking.py.
+    Uses rglob to find SKILL.md files at any depth (the path may be an arbitrary
+    source tree, not a skills_dir), skipping the same directories as the scanner.
     """
     skills = []
 
@@ -33,13 +32,13 @@ def _scan_skills_from_path(target_path: Path) -> list[dict]:
     if skill_md.exists():
         skills.append(_load_skill_from_path(target_path))
     else:
-        # Recursively scan for all SKILL.md files (matching tracking.py behavior)
+        # Recursively scan for all SKILL.md files
         for skill_md_path in sorted(target_path.rglob("SKILL.md")):
             skill_dir = skill_md_path.parent
             rel_parts = skill_dir.relative_to(target_path).parts
 
             # Skip hidden directories and excluded directories
-            if any(part.startswith(".") or part in SCAN_EXCLUDE_NAMES for part in rel_parts):
+            if not all(is_scannable(part) for part in rel_parts):
                 continue
 
             skills.append(_load_skill_from_path(skill_dir))
@@ -50,10 +49,10 @@ def _scan_skills_from_path(target_path: Path) -> list[dict]:
 def _load_skill_from_path(skill_dir: Path) -> dict:
     """Load skill data from a directory path."""
     skill_md = skill_dir / "SKILL.md"
-    meta, body = parse_frontmatter(skill_md)
-
-    # Count lines
-    lines = len(skill_md.read_text(encoding="utf-8").splitlines())
+    # One read serves both the metadata and the line count.
+    data = skill_md.read_bytes()
+    meta, _body = split_frontmatter(data)
+    lines = len(data.decode("utf-8").splitlines())
 
     return {
         "id": meta.get("name", skill_dir.name),
@@ -42,6 +42,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip automatic reindex check.",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch the skills directory and refresh the index while running.",
+    )
     parser.add_argument(
         "--skills-dir",
         type=Path,
@@ -54,8 +59,10 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--embedding-provider",
-        choices=["none", "openai"],
-        help="Embedding provider (overrides SKILLPORT_EMBEDDING_PROVIDER).",
+        help=(
+            "Embedding provider: none, openai, local, or an installed plugin "
+            "(overrides SKILLPORT_EMBEDDING_PROVIDER)."
+        ),
     )
     parser.add_argument(
         "--openai-api-key",
@@ -65,6 +72,10 @@ def _build_parser() -> argparse.ArgumentParser:
         "--openai-embedding-model",
         help="OpenAI embedding model (overrides OPENAI_EMBEDDING_MODEL).",
     )
+    parser.add_argument(
+        "--openai-base-url",
+        help="OpenAI-compatible API base URL (overrides OPENAI_BASE_URL).",
+    )
     return parser
 
 
@@ -80,6 +91,8 @@ def _build_config(args: argparse.Namespace) -> Config:
         overrides["openai_api_key"] = args.openai_api_key
     if args.openai_embedding_model:
         overrides["openai_embedding_model"] = args.openai_embedding_model
+    if args.openai_base_url:
+        overrides["openai_base_url"] = args.openai_base_url
     return Config(**overrides) if overrides else Config()
 
 
@@ -106,6 +119,7 @@ def main(argv: list[str] | None = None) -> None:
         port=args.port,
         force_reindex=args.reindex,
         skip_auto_reindex=args.skip_auto_reindex,
+        watch=args.watch,
     )
 
 
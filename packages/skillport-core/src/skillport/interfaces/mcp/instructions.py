@@ -14,7 +14,11 @@ def _escape_xml(text: str) -> str:
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
-def build_xml_instructions(config: Config, registered_tools: list[str] | None = None) -> str:
+def build_xml_instructions(
+    config: Config,
+    registered_tools: list[str] | None = None,
+    core_skills: list[dict] | None = None,
+) -> str:
     """Build XML-structured instructions for MCP server.
 
     Dynamically generates instructions based on registered tools.
@@ -24,6 +28,7 @@ def build_xml_instructions(config: Config, registered_tools: list[str] | None =
         config: Application configuration.
         registered_tools: List of registered tool names. If None, defaults to
             ["search_skills", "load_skill"] (Local Mode behavior).
+        core_skills: Core skill rows to list. If None, they are read from the index.
 
     Returns:
         XML-formatted instructions string with <skills_system> root element.
@@ -32,6 +37,7 @@ def build_xml_instructions(config: Config, registered_tools: list[str] | None =
         registered_tools = ["search_skills", "load_skill"]
 
     has_file_read = "read_skill_file" in registered_tools
+    has_batch_load = "load_skills" in registered_tools
 
     lines = ["<skills_system>", "", "<usage>"]
     lines.append("SkillPort provides Agent Skills that load on demand.")
@@ -51,6 +57,8 @@ def build_xml_instructions(config: Config, registered_tools: list[str] | None =
     lines.append("## Tools")
     lines.append('- `search_skills(query)` — Find skills. Use "" to list all.')
     lines.append("- `load_skill(id)` — Get instructions and path.")
+    if has_batch_load:
+        lines.append("- `load_skills(ids)` — Load several skills in one call.")
     if has_file_read:
         lines.append("- `read_skill_file(id, file)` — Read files (text or base64).")
     lines.append("")
@@ -60,6 +68,10 @@ def build_xml_instructions(config: Config, registered_tools: list[str] | None =
     if has_file_read:
         lines.append('- Text: encoding="utf-8", Binary: encoding="base64"')
         lines.append('- mime_type indicates file type (e.g., "image/png")')
+        lines.append("- Large files arrive in chunks: pass next_token back as continuation_token")
+        lines.append(
+            "- Re-reading a file: pass its etag as if_none_match to skip unchanged content"
+        )
     else:
         lines.append("- Use your native Read for full capabilities (images, PDFs)")
         lines.append("- Replace `{path}` with actual path from load_skill")
@@ -68,7 +80,7 @@ def build_xml_instructions(config: Config, registered_tools: list[str] | None =
     lines.append("</usage>")
 
     # Core Skills section (only if core skills exist)
-    core = get_core_skills(config=config)
+    core = core_skills if core_skills is not None else get_core_skills(config=config)
     if core:
         lines.append("")
         lines.append("<core_skills>")
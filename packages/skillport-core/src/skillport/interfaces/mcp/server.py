@@ -1,14 +1,20 @@
+from __future__ import annotations
+
 import sys
+from collections.abc import Callable
+from contextlib import asynccontextmanager
 from importlib.metadata import PackageNotFoundError, version
-from typing import Literal
-
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING, Literal
 
 from skillport.interfaces.mcp.instructions import build_xml_instructions
-from skillport.interfaces.mcp.tools import register_tools
-from skillport.modules.indexing import build_index, should_reindex
+from skillport.interfaces.mcp.tools import ToolPool, register_tools
+from skillport.interfaces.mcp.warmup import IndexWarmup
+from skillport.modules.skills.public.catalog import get_core_skills_fs
 from skillport.shared.config import Config
 
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
 BANNER = r"""
 ░██████╗██╗░░██╗██╗██╗░░░░░██╗░░░░░██████╗░░█████╗░██████╗░████████╗
 ██╔════╝██║░██╔╝██║██║░░░░░██║░░░░░██╔══██╗██╔══██╗██╔══██╗╚══██╔══╝
@@ -42,11 +48,16 @@ def _get_registered_tools_list(is_remote: bool) -> list[str]:
     """
     tools = ["search_skills", "load_skill"]
     if is_remote:
-        tools.append("read_skill_file")
+        tools.extend(["load_skills", "read_skill_file"])
     return tools
 
 
-def create_mcp_server(*, config: Config, is_remote: bool = False) -> FastMCP:
+def create_mcp_server(
+    *,
+    config: Config,
+    is_remote: bool = False,
+    index_ready: Callable[[], bool] | None = None,
+) -> FastMCP:
     """Create a configured FastMCP server instance.
 
     This factory function creates the server without starting it, enabling:
@@ -56,15 +67,32 @@ def create_mcp_server(*, config: Config, is_remote: bool = False) -> FastMCP:
     Args:
         config: Application configuration.
         is_remote: True for Remote mode (HTTP), False for Local mode (stdio).
+        index_ready: Index readiness probe (see register_tools). While it returns
+            False, core skills and tool results come from the filesystem.
 
     Returns:
         Configured FastMCP instance with tools registered.
     """
+    # Imported here so argument parsing and the banner don't wait for fastmcp.
+    from fastmcp import FastMCP
+
     registered_tools = _get_registered_tools_list(is_remote)
-    instructions = build_xml_instructions(config, registered_tools)
+    core_skills = None
+    if index_ready is not None and not index_ready():
+        core_skills = get_core_skills_fs(config=config)
+    instructions = build_xml_instructions(config, registered_tools, core_skills)
+
+    pool = ToolPool()
 
-    mcp = FastMCP("skillport", version=__version__, instructions=instructions)
-    register_tools(mcp, config, is_remote=is_remote)
+    @asynccontextmanager
+    async def lifespan(_server):
+        try:
+            yield {}
+        finally:
+            pool.shutdown()
+
+    mcp = FastMCP("skillport", version=__version__, instructions=instructions, lifespan=lifespan)
+    register_tools(mcp, config, is_remote=is_remote, index_ready=index_ready, pool=pool)
 
     return mcp
 
@@ -77,9 +105,13 @@ def run_server(
     port: int = 8000,
     force_reindex: bool = False,
     skip_auto_reindex: bool = False,
+    watch: bool = False,
 ):
     """Run the MCP server.
 
+    The transport starts right away; the reindex check and build run in the
+    background and tools fall back to the filesystem catalog until they finish.
+
     Args:
         config: Application configuration.
         transport: Transport protocol ("stdio" for local, "http" for remote).
@@ -87,18 +119,25 @@ def run_server(
         port: HTTP server port (only used with transport="http").
         force_reindex: Force reindex before starting.
         skip_auto_reindex: Skip automatic reindex check.
+        watch: Watch skills_dir and refresh the index incrementally while running.
     """
     print(BANNER, file=sys.stderr)
 
-    decision = should_reindex(config=config)
-    if force_reindex:
-        print("[INFO] Reindexing (force)", file=sys.stderr)
-        build_index(config=config, force=True)
-    elif not skip_auto_reindex and decision.need:
-        print(f"[INFO] Reindexing (reason={decision.reason})", file=sys.stderr)
-        build_index(config=config, force=False)
-    else:
-        print(f"[INFO] Skipping reindex (reason={decision.reason})", file=sys.stderr)
+    watchers = []
+
+    def _start_watcher() -> None:
+        from skillport.modules.indexing import watch_index
+
+        watcher = watch_index(config=config)
+        watchers.append(watcher)
+        print(f"[INFO] Watching {config.skills_dir} ({watcher.mode})", file=sys.stderr)
+
+    warmup = IndexWarmup(
+        config,
+        force=force_reindex,
+        skip_auto=skip_auto_reindex,
+        on_ready=_start_watcher if watch else None,
+    )
 
     # Transport determines mode: HTTP = Remote, stdio = Local
     is_remote = transport == "http"
@@ -107,12 +146,17 @@ def run_server(
     print(f"[INFO] Mode: {mode} (transport: {transport})", file=sys.stderr)
     print(f"[INFO] Tools: {', '.join(_get_registered_tools_list(is_remote))}", file=sys.stderr)
 
-    mcp = create_mcp_server(config=config, is_remote=is_remote)
-
-    if transport == "http":
-        mcp.run(transport="http", host=host, port=port)
-    else:
-        mcp.run()
+    mcp = create_mcp_server(config=config, is_remote=is_remote, index_ready=warmup.is_ready)
+    warmup.start()
+
+    try:
+        if transport == "http":
+            mcp.run(transport="http", host=host, port=port)
+        else:
+            mcp.run()
+    finally:
+        for watcher in watchers:
+            watcher.stop()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,92 @@
-from typing import Any
+from __future__ import annotations
 
-from fastmcp import FastMCP
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from skillport.modules.skills import load_skill, read_skill_file, search_skills
+from skillport.modules.indexing import aembed_query
+from skillport.modules.skills import load_skill, load_skills, read_skill_file, search_skills
+from skillport.modules.skills.public.catalog import load_skill_fs, search_skills_fs
+from skillport.modules.skills.public.read import read_file_in_skill_dir
 from skillport.shared.config import Config
+from skillport.shared.exceptions import SkillPortError
 
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
-def register_tools(mcp: FastMCP, config: Config, *, is_remote: bool = False) -> list[str]:
+# Worker threads per server for blocking work (index queries, file reads), so one
+# slow call does not stall the event loop that serves every other client.
+TOOL_MAX_WORKERS = 8
+# Upper bound on ids per load_skills call (keeps responses a sane size).
+LOAD_SKILLS_MAX_IDS = 20
+
+T = TypeVar("T")
+
+
+class ToolPool:
+    """Worker threads for blocking tool work, started on first use.
+
+    The server lifespan calls shutdown(); a later call starts a fresh pool, so a
+    server instance can be run (or connected to in-memory) more than once.
+    """
+
+    def __init__(self, max_workers: int = TOOL_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="skillport-tool"
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _detail_dict(detail) -> dict[str, Any]:
+    return {
+        "id": detail.id,
+        "name": detail.name,
+        "description": detail.description,
+        "instructions": detail.instructions,
+        "path": detail.path,
+    }
+
+
+def _load_skills_fs(skill_ids: list[str], *, config: Config) -> list:
+    results = []
+    for skill_id in skill_ids:
+        try:
+            results.append(load_skill_fs(skill_id, config=config))
+        except SkillPortError as exc:
+            results.append(exc)
+    return results
+
+
+def _read_file_fs(skill_id: str, file_path: str, *, config: Config, **ranges: Any):
+    skill_dir = Path(load_skill_fs(skill_id, config=config).path)
+    return read_file_in_skill_dir(skill_dir, file_path, config=config, **ranges)
+
+
+def register_tools(
+    mcp: FastMCP,
+    config: Config,
+    *,
+    is_remote: bool = False,
+    index_ready: Callable[[], bool] | None = None,
+    pool: ToolPool | None = None,
+) -> list[str]:
     """Register MCP tools based on transport mode.
 
     Args:
@@ -14,14 +94,25 @@ def register_tools(mcp: FastMCP, config: Config, *, is_remote: bool = False) ->
         config: Application configuration.
         is_remote: True for HTTP transport (Remote mode), False for stdio (Local mode).
             Remote mode enables read_skill_file tool for agents without file access.
+        index_ready: Returns False while the index is still building; tools then
+            answer from the filesystem catalog. None means the index is always used.
+        pool: Worker threads for blocking calls; the caller owns its shutdown.
 
     Returns:
         List of registered tool names.
     """
     registered: list[str] = []
+    pool = pool or ToolPool()
+
+    def use_index() -> bool:
+        return index_ready is None or index_ready()
+
+    async def offload(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool.get(), partial(fn, *args, **kwargs))
 
     @mcp.tool(name="search_skills")
-    def search_skills_tool(query: str) -> dict[str, Any]:
+    async def search_skills_tool(query: str) -> dict[str, Any]:
         """Find skills relevant to a task description.
 
         Use this to discover skills. If you already have a skill_id, skip to load_skill.
@@ -34,7 +125,20 @@ def register_tools(mcp: FastMCP, config: Config, *, is_remote: bool = False) ->
             skills: Top matches as {id, description, score}. Higher score = better match.
             total: Total matching skills. If high, use a more specific query.
         """
-        result = search_skills(query, limit=config.search_limit, config=config)
+        if use_index():
+            # Remote embedding runs on the async client; the worker thread only searches.
+            vector = await aembed_query(query, config=config)
+            result = await offload(
+                search_skills,
+                query,
+                limit=config.search_limit,
+                config=config,
+                query_vector=vector,
+            )
+        else:
+            result = await offload(
+                search_skills_fs, query, limit=config.search_limit, config=config
+            )
         skills_list = []
         for s in result.skills:
             item: dict[str, Any] = {
@@ -51,7 +155,7 @@ def register_tools(mcp: FastMCP, config: Config, *, is_remote: bool = False) ->
     registered.append("search_skills")
 
     @mcp.tool(name="load_skill")
-    def load_skill_tool(skill_id: str) -> dict[str, Any]:
+    async def load_skill_tool(skill_id: str) -> dict[str, Any]:
         """Load a skill's instructions and absolute filesystem path.
 
         Call this after selecting an id from search_skills. The returned `path` is
@@ -63,48 +167,114 @@ def register_tools(mcp: FastMCP, config: Config, *, is_remote: bool = False) ->
         Returns:
             id, name, description, instructions, path (absolute directory).
         """
-        detail = load_skill(skill_id, config=config)
-        return {
-            "id": detail.id,
-            "name": detail.name,
-            "description": detail.description,
-            "instructions": detail.instructions,
-            "path": detail.path,
-        }
+        detail = await offload(
+            load_skill if use_index() else load_skill_fs, skill_id, config=config
+        )
+        return _detail_dict(detail)
 
     registered.append("load_skill")
 
-    # Remote mode only: read_skill_file (for agents without direct file access)
+    # Remote mode only: load_skills and read_skill_file (each call is a network round trip)
     if is_remote:
 
+        @mcp.tool(name="load_skills")
+        async def load_skills_tool(skill_ids: list[str]) -> dict[str, Any]:
+            """Load several skills in one call (same fields as load_skill).
+
+            Prefer this over repeated load_skill calls when you need more than one skill.
+
+            Args:
+                skill_ids: Skill identifiers from search_skills (at most 20).
+
+            Returns:
+                skills: Loaded skills, in request order, as {id, name, description,
+                    instructions, path}.
+                errors: {id, error} for ids that could not be loaded.
+            """
+            if len(skill_ids) > LOAD_SKILLS_MAX_IDS:
+                raise ValueError(f"load_skills accepts at most {LOAD_SKILLS_MAX_IDS} ids")
+            load = load_skills if use_index() else _load_skills_fs
+            results = await offload(load, skill_ids, config=config)
+            skills: list[dict[str, Any]] = []
+            errors: list[dict[str, str]] = []
+            for skill_id, result in zip(skill_ids, results):
+                if isinstance(result, SkillPortError):
+                    errors.append({"id": skill_id, "error": str(result)})
+                else:
+                    skills.append(_detail_dict(result))
+            return {"skills": skills, "errors": errors}
+
+        registered.append("load_skills")
+
         @mcp.tool(name="read_skill_file")
-        def read_skill_file_tool(skill_id: str, file_path: str) -> dict[str, Any]:
-            """Read a file inside a skill directory.
+        async def read_skill_file_tool(
+            skill_id: str,
+            file_path: str,
+            offset: int = 0,
+            length: int | None = None,
+            start_line: int | None = None,
+            end_line: int | None = None,
+            continuation_token: str | None = None,
+            if_none_match: str | None = None,
+        ) -> dict[str, Any]:
+            """Read a file inside a skill directory, whole or in chunks.
 
             Handles both text and binary files:
             - Text: encoding="utf-8", content is plain text
             - Binary: encoding="base64", content is base64-encoded
 
             The mime_type field indicates the file type (e.g., "image/png", "application/pdf").
+            Large files are returned in chunks: while next_token is set, call again with
+            continuation_token=next_token to get the rest. To re-read a file you already
+            have, pass its etag as if_none_match: an unchanged file comes back as
+            {"not_modified": true, "etag": ...} without content.
 
             Args:
                 skill_id: Skill identifier from load_skill.
                 file_path: Relative path (e.g., "templates/config.yaml").
+                offset: First byte to read (default 0).
+                length: Number of bytes to read (default: to end of file).
+                start_line: First line to read, 1-based (overrides offset/length).
+                end_line: Last line to read, inclusive.
+                continuation_token: next_token from the previous call.
+                if_none_match: etag from an earlier read of this file.
 
             Returns:
                 content: File content (text or base64)
                 path: Absolute path
-                size: Size in bytes
+                size: File size in bytes
                 encoding: "utf-8" or "base64"
                 mime_type: MIME type of the file
+                offset: Byte offset of this chunk
+                length: Bytes in this chunk
+                next_token: Token for the next chunk, or null when done
+                etag: Content hash of the whole file
             """
-            result = read_skill_file(skill_id, file_path, config=config)
+            read = read_skill_file if use_index() else _read_file_fs
+            result = await offload(
+                read,
+                skill_id,
+                file_path,
+                config=config,
+                offset=offset,
+                length=length,
+                start_line=start_line,
+                end_line=end_line,
+                continuation_token=continuation_token,
+                if_none_match=if_none_match,
+            )
+            if result.not_modified:
+                return {"path": result.path, "etag": result.etag, "not_modified": True}
             return {
                 "content": result.content,
                 "path": result.path,
                 "size": result.size,
                 "encoding": result.encoding,
                 "mime_type": result.mime_type,
+                "offset": result.offset,
+                "length": result.length,
+                "next_token": result.next_token,
+                "etag": result.etag,
             }
 
         registered.append("read_skill_file")
@@ -112,4 +282,4 @@ def register_tools(mcp: FastMCP, config: Config, *, is_remote: bool = False) ->
     return registered
 
 
-__all__ = ["register_tools"]
+__all__ = ["ToolPool", "register_tools"]
@@ -0,0 +1,93 @@
+"""Background index warm-up so the MCP transport can start immediately.
+
+The reindex check and build (which import lancedb, pyarrow and possibly openai)
+run on a daemon thread. Until they finish, tools answer from the filesystem
+catalog instead of the index; if they fail, tools keep doing so.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Callable
+
+from skillport.shared.config import Config
+
+
+class IndexWarmup:
+    """Runs the startup reindex decision + build off the main thread."""
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        force: bool = False,
+        skip_auto: bool = False,
+        on_ready: Callable[[], None] | None = None,
+    ):
+        self.config = config
+        self.force = force
+        self.skip_auto = skip_auto
+        self.on_ready = on_ready
+        self._ready = threading.Event()
+        self._done = threading.Event()
+        self.error: str | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> IndexWarmup:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="skillport-index-warmup", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the warm-up to finish; True only if the index became ready."""
+        self._done.wait(timeout)
+        return self.is_ready()
+
+    def _run(self) -> None:
+        try:
+            self._reindex()
+        except Exception as exc:  # keep serving from the filesystem rather than crash
+            self.error = str(exc) or type(exc).__name__
+            print(
+                f"[WARN] Startup reindex failed, serving from the filesystem: {self.error}",
+                file=sys.stderr,
+            )
+            return
+        finally:
+            self._done.set()
+
+        self._ready.set()
+        print("[INFO] Index ready", file=sys.stderr)
+        if self.on_ready is not None:
+            try:
+                self.on_ready()
+            except Exception as exc:
+                print(f"[WARN] Index ready callback failed: {exc}", file=sys.stderr)
+
+    def _reindex(self) -> None:
+        from skillport.modules.indexing import build_index, should_reindex
+
+        config = self.config
+        if self.force:
+            print("[INFO] Reindexing (force)", file=sys.stderr)
+            result = build_index(config=config, force=True)
+        else:
+            decision = should_reindex(config=config)
+            if self.skip_auto or not decision.need:
+                print(f"[INFO] Skipping reindex (reason={decision.reason})", file=sys.stderr)
+                return
+            print(f"[INFO] Reindexing (reason={decision.reason})", file=sys.stderr)
+            result = build_index(config=config, force=False)
+        # build_index reports failures instead of raising.
+        if not result.success:
+            raise RuntimeError(result.message)
+
+
+__all__ = ["IndexWarmup"]
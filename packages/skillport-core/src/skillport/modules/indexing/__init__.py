@@ -1,15 +1,30 @@
 """Public API for the indexing module."""
 
 from .public.index import build_index, should_reindex
-from .public.query import get_by_id, get_core_skills, list_all, search
+from .public.query import (
+    aembed_query,
+    count,
+    count_matches,
+    get_by_id,
+    get_core_skills,
+    get_many,
+    list_all,
+    search,
+)
 from .public.types import IndexBuildResult, ReindexDecision
+from .public.watch import watch_index
 
 __all__ = [
     "build_index",
     "should_reindex",
+    "watch_index",
     "search",
+    "aembed_query",
     "get_by_id",
+    "get_many",
     "list_all",
+    "count",
+    "count_matches",
     "get_core_skills",
     "IndexBuildResult",
     "ReindexDecision",
@@ -1,8 +1,41 @@
 """Internal indexing components (not part of public API)."""
 
-from .embeddings import get_embedding
-from .lancedb import IndexStore
-from .search_service import SearchService
-from .state import IndexStateStore
+from importlib import import_module
 
-__all__ = ["IndexStore", "get_embedding", "IndexStateStore", "SearchService"]
+# Resolved on first access so importing a light component (state, watcher,
+# memory backend) does not pull in lancedb.
+_EXPORTS = {
+    "IndexStore": ".lancedb",
+    "MemoryIndexStore": ".memory",
+    "get_embedding": ".embeddings",
+    "get_embeddings": ".embeddings",
+    "aget_embedding": ".embeddings",
+    "aget_embeddings": ".embeddings",
+    "EmbeddingProvider": ".providers",
+    "get_provider": ".providers",
+    "IndexStateStore": ".state",
+    "SearchService": ".search_service",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "IndexStore",
+    "MemoryIndexStore",
+    "get_embedding",
+    "get_embeddings",
+    "aget_embedding",
+    "aget_embeddings",
+    "EmbeddingProvider",
+    "get_provider",
+    "IndexStateStore",
+    "SearchService",
+]
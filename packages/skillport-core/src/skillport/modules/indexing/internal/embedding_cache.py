@@ -0,0 +1,160 @@
+"""Content-addressed embedding cache shared by indexing and query paths.
+
+Vectors are keyed by sha256(provider signature, normalized text) and persisted
+in a small SQLite file next to index_state.json. A bounded in-memory LRU sits in
+front of it so repeated queries never touch disk; their recency is written back
+in batches so eviction on disk stays least-recently-used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+CACHE_FILENAME = "embedding_cache.sqlite"
+MEMORY_ENTRIES = 1024
+# Memory hits whose last_used is written back to SQLite in one batch.
+TOUCH_BATCH = 256
+
+
+def normalize_text(text: str) -> str:
+    """Collapse all whitespace (including newlines) to single spaces."""
+    return " ".join(text.split())
+
+
+def cache_key(signature: dict[str, Any], text: str) -> str:
+    """Key for ``text`` embedded by the provider described by ``signature``.
+
+    ``signature`` is EmbeddingProvider.signature() (provider, model and extras
+    such as the endpoint or dimensions), so differently configured providers
+    never share vectors.
+    """
+    payload = f"{json.dumps(signature, sort_keys=True, default=str)}\0{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Size-bounded LRU cache of embedding vectors (SQLite + in-memory front)."""
+
+    def __init__(self, path: Path, *, max_entries: int, memory_entries: int = MEMORY_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.memory_entries = min(memory_entries, max_entries)
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        # Keys served from memory since their last_used was last written.
+        self._touched: set[str] = set()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON embeddings(last_used)")
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error as exc:
+            print(f"Embedding cache disabled ({path}): {exc}", file=sys.stderr)
+
+    # --- memory LRU ---
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touched(self, now: float) -> None:
+        """Write last_used for memory hits (caller holds the lock and commits)."""
+        if self._touched and self._conn is not None:
+            self._conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                [(now, key) for key in self._touched],
+            )
+        self._touched.clear()
+
+    # --- public ---
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                vec = self._memory.get(key)
+                if vec is not None:
+                    self._memory.move_to_end(key)
+                    if self._conn is not None:
+                        self._touched.add(key)
+                    found[key] = vec
+
+            missing = [k for k in dict.fromkeys(keys) if k not in found]
+            if self._conn is None or (not missing and len(self._touched) < TOUCH_BATCH):
+                return found
+
+            try:
+                now = time.time()
+                self._flush_touched(now)
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vec = array("f", blob).tolist()
+                        found[key] = vec
+                        self._remember(key, vec)
+                    if rows:
+                        self._conn.executemany(
+                            "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                            [(now, key) for key, _ in rows],
+                        )
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                print(f"Embedding cache read failed: {exc}", file=sys.stderr)
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        if not items:
+            return
+        with self._lock:
+            for key, vec in items.items():
+                self._remember(key, vec)
+            if self._conn is None:
+                return
+            try:
+                now = time.time()
+                # Recency first, so eviction below sees which vectors are hot.
+                self._flush_touched(now)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    [(key, array("f", vec).tobytes(), now) for key, vec in items.items()],
+                )
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+                if count > self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM embeddings WHERE key IN ("
+                        " SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                print(f"Embedding cache write failed: {exc}", file=sys.stderr)
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return len(self._memory)
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return count
+
+
+__all__ = ["CACHE_FILENAME", "EmbeddingCache", "cache_key", "normalize_text"]
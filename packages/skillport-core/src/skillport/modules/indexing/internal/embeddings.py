@@ -1,43 +1,266 @@
-"""Embedding provider abstraction."""
+"""Embedding pipeline (batching, caching, retries) and the built-in OpenAI provider."""
 
 from __future__ import annotations
 
+import asyncio
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
 
 from skillport.shared.config import Config
 
+from .embedding_cache import CACHE_FILENAME, EmbeddingCache, cache_key, normalize_text
+from .providers import EmbeddingProvider, get_provider
 
-def get_embedding(text: str, config: Config) -> list[float] | None:
-    """Fetch embedding according to provider; returns None when provider='none'."""
-    provider = config.embedding_provider
-    text = text.replace("\n", " ")
+# Inputs per embeddings request (capped by the provider's max_batch_size).
+EMBEDDING_BATCH_SIZE = 256
+# Upper bound on batches in flight at once.
+EMBEDDING_MAX_CONCURRENCY = 4
+# Attempts per batch before giving up (exponential backoff between attempts).
+EMBEDDING_MAX_ATTEMPTS = 3
+EMBEDDING_RETRY_BASE_DELAY = 0.5
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str | None, base_url: str | None = None):
+    """Return a pooled OpenAI client (one per key/URL), or None for legacy SDKs."""
+    # Prefer OpenAI v1+/v2 client; fall back to legacy SDK if unavailable.
+    try:
+        from openai import OpenAI  # type: ignore
+    except Exception:
+        return None
+    # Retries are handled per batch in _with_retries.
+    return OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+
+
+@lru_cache(maxsize=4)
+def _async_openai_client(api_key: str | None, base_url: str | None = None):
+    try:
+        from openai import AsyncOpenAI  # type: ignore
+    except Exception:
+        return None
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """embedding_provider='openai': OpenAI or any OpenAI-compatible server (openai_base_url)."""
+
+    # Inputs per request accepted by the embeddings endpoint.
+    max_batch_size = 2048
+
+    @property
+    def model(self) -> str:
+        return self.config.openai_embedding_model
+
+    def signature(self) -> dict[str, Any]:
+        # Another endpoint may serve different vectors under the same model name.
+        return {**super().signature(), "openai_base_url": self.config.openai_base_url}
+
+    def _client_args(self) -> tuple[str, str | None]:
+        # Local OpenAI-compatible servers usually ignore the key, but the SDK requires one.
+        return self.config.openai_api_key or "unused", self.config.openai_base_url
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        client = _openai_client(*self._client_args())
+        if client is not None:
+            resp = client.embeddings.create(input=texts, model=self.model)
+            return [item.embedding for item in sorted(resp.data, key=lambda d: d.index)]
+
+        import openai  # lazy import for legacy <1.x
+
+        openai.api_key = self.config.openai_api_key
+        resp = openai.Embedding.create(input=texts, model=self.model)
+        return [item["embedding"] for item in sorted(resp["data"], key=lambda d: d["index"])]
+
+    async def aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        client = _async_openai_client(*self._client_args())
+        if client is None:
+            return await super().aembed_batch(texts)
+        resp = await client.embeddings.create(input=texts, model=self.model)
+        return [item.embedding for item in sorted(resp.data, key=lambda d: d.index)]
+
+    def is_transient(self, exc: Exception) -> bool:
+        try:
+            from openai import APIConnectionError  # type: ignore  # includes APITimeoutError
+        except Exception:
+            return super().is_transient(exc)
+        return isinstance(exc, APIConnectionError) or super().is_transient(exc)
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    delay = EMBEDDING_RETRY_BASE_DELAY * (2**attempt)
+    print(f"Embedding batch failed ({exc}); retrying in {delay:.1f}s", file=sys.stderr)
+    return delay
+
+
+def _with_retries(provider: EmbeddingProvider, texts: list[str]) -> list[list[float]]:
+    for attempt in range(EMBEDDING_MAX_ATTEMPTS):
+        try:
+            return provider.embed_batch(texts)
+        except Exception as exc:
+            if attempt == EMBEDDING_MAX_ATTEMPTS - 1 or not provider.is_transient(exc):
+                raise
+            time.sleep(_retry_delay(exc, attempt))
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+async def _awith_retries(provider: EmbeddingProvider, texts: list[str]) -> list[list[float]]:
+    for attempt in range(EMBEDDING_MAX_ATTEMPTS):
+        try:
+            return await provider.aembed_batch(texts)
+        except Exception as exc:
+            if attempt == EMBEDDING_MAX_ATTEMPTS - 1 or not provider.is_transient(exc):
+                raise
+            await asyncio.sleep(_retry_delay(exc, attempt))
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+@lru_cache(maxsize=8)
+def _cache_at(path: Path, max_entries: int) -> EmbeddingCache:
+    return EmbeddingCache(path, max_entries=max_entries)
+
+
+def _cache_for(config: Config) -> EmbeddingCache | None:
+    """Process-wide cache stored next to index_state.json (None when disabled)."""
+    if config.embedding_cache_size <= 0:
+        return None
+    return _cache_at(config.db_path.parent / CACHE_FILENAME, config.embedding_cache_size)
+
+
+def _batches(cleaned: list[str], provider: EmbeddingProvider) -> list[list[str]]:
+    size = max(1, min(EMBEDDING_BATCH_SIZE, provider.max_batch_size))
+    return [cleaned[i : i + size] for i in range(0, len(cleaned), size)]
+
+
+def _checked(provider: EmbeddingProvider, vectors: list[list[float]]) -> list[list[float]]:
+    expected = provider.dimensions
+    if expected is not None and any(len(vec) != expected for vec in vectors):
+        raise ValueError(f"Embedding provider returned vectors not of length {expected}")
+    return vectors
+
+
+def _embed_uncached(cleaned: list[str], provider: EmbeddingProvider) -> list[list[float]]:
+    if provider.local:
+        return _checked(provider, provider.embed_batch(cleaned))
+
+    batches = _batches(cleaned, provider)
+    if len(batches) == 1:
+        return _checked(provider, _with_retries(provider, batches[0]))
+
+    workers = min(EMBEDDING_MAX_CONCURRENCY, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda batch: _with_retries(provider, batch), batches))
+    return _checked(provider, [vec for batch in results for vec in batch])
+
+
+async def _aembed_uncached(cleaned: list[str], provider: EmbeddingProvider) -> list[list[float]]:
+    if provider.local:
+        return _checked(provider, await provider.aembed_batch(cleaned))
+
+    gate = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+
+    async def run(batch: list[str]) -> list[list[float]]:
+        async with gate:
+            return await _awith_retries(provider, batch)
+
+    results = await asyncio.gather(*(run(batch) for batch in _batches(cleaned, provider)))
+    return _checked(provider, [vec for batch in results for vec in batch])
+
+
+def _split_cached(
+    cleaned: list[str], provider: EmbeddingProvider, cache: EmbeddingCache
+) -> tuple[list[str], dict[str, list[float]], list[str]]:
+    """Return (cache keys per input, vectors found, keys still to embed)."""
+    signature = provider.signature()
+    keys = [cache_key(signature, t) for t in cleaned]
+    found = cache.get_many(keys)
+    pending = list(dict.fromkeys(k for k in keys if k not in found))
+    return keys, found, pending
 
-    if provider == "none":
+
+def get_embeddings(texts: list[str], config: Config) -> list[list[float]] | None:
+    """Embed many texts in provider-sized batches; returns None when provider='none'.
+
+    Vectors already in the embedding cache are served from it; the rest are sent
+    in batches that run concurrently (bounded by EMBEDDING_MAX_CONCURRENCY) on a
+    shared client. Results are returned in input order. In-process providers
+    (``provider.local``) bypass batching, retries and the cache.
+    """
+    provider = get_provider(config)
+    if provider is None:
         return None
+    if not texts:
+        return []
 
+    cleaned = [normalize_text(text) for text in texts]
+    cache = None if provider.local else _cache_for(config)
     try:
-        if provider == "openai":
-            # Prefer OpenAI v1+/v2 client; fall back to legacy SDK if unavailable.
-            try:
-                from openai import OpenAI  # type: ignore
-            except Exception:
-                OpenAI = None  # type: ignore
+        if cache is None:
+            return _embed_uncached(cleaned, provider)
+
+        keys, found, pending = _split_cached(cleaned, provider, cache)
+        if pending:
+            text_by_key = dict(zip(keys, cleaned))
+            fetched = _embed_uncached([text_by_key[k] for k in pending], provider)
+            new_items = dict(zip(pending, fetched))
+            cache.put_many(new_items)
+            found.update(new_items)
+        return [found[k] for k in keys]
+    except Exception as exc:
+        print(f"Embedding error ({config.embedding_provider}): {exc}", file=sys.stderr)
+        raise
 
-            if OpenAI:
-                client = OpenAI(api_key=config.openai_api_key)
-                resp = client.embeddings.create(input=[text], model=config.openai_embedding_model)
-                return resp.data[0].embedding
 
-            import openai  # lazy import for legacy <1.x
+async def aget_embeddings(texts: list[str], config: Config) -> list[list[float]] | None:
+    """Async counterpart of get_embeddings using the provider's aembed_batch."""
+    provider = get_provider(config)
+    if provider is None:
+        return None
+    if not texts:
+        return []
 
-            openai.api_key = config.openai_api_key
-            resp = openai.Embedding.create(input=[text], model=config.openai_embedding_model)
-            return resp["data"][0]["embedding"]
+    cleaned = [normalize_text(text) for text in texts]
+    # The cache is SQLite: keep its I/O off the event loop.
+    cache = None if provider.local else await asyncio.to_thread(_cache_for, config)
+    try:
+        if cache is None:
+            return await _aembed_uncached(cleaned, provider)
 
-        raise ValueError(f"Unsupported embedding_provider: {provider}")
+        keys, found, pending = await asyncio.to_thread(_split_cached, cleaned, provider, cache)
+        if pending:
+            text_by_key = dict(zip(keys, cleaned))
+            fetched = await _aembed_uncached([text_by_key[k] for k in pending], provider)
+            new_items = dict(zip(pending, fetched))
+            await asyncio.to_thread(cache.put_many, new_items)
+            found.update(new_items)
+        return [found[k] for k in keys]
     except Exception as exc:
-        print(f"Embedding error ({provider}): {exc}", file=sys.stderr)
+        print(f"Embedding error ({config.embedding_provider}): {exc}", file=sys.stderr)
         raise
 
 
-__all__ = ["get_embedding"]
+def get_embedding(text: str, config: Config) -> list[float] | None:
+    """Fetch embedding according to provider; returns None when provider='none'."""
+    vectors = get_embeddings([text], config)
+    if not vectors:
+        return None
+    return vectors[0]
+
+
+async def aget_embedding(text: str, config: Config) -> list[float] | None:
+    vectors = await aget_embeddings([text], config)
+    if not vectors:
+        return None
+    return vectors[0]
+
+
+__all__ = [
+    "OpenAIEmbeddingProvider",
+    "aget_embedding",
+    "aget_embeddings",
+    "get_embedding",
+    "get_embeddings",
+]
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-import json
 import sys
-from pathlib import Path
+import threading
 from typing import Any
 
 import lancedb
+import pyarrow as pa
 
 from skillport.shared.config import Config
-from skillport.shared.utils import normalize_token, parse_frontmatter
+from skillport.shared.scan import SkillScan
+from skillport.shared.utils import normalize_token
 
-from .embeddings import get_embedding
-from .models import SkillRecord
+from .embeddings import get_embedding, get_embeddings
+from .models import SUMMARY_COLUMNS, VIEWS, SkillRecord, View
+from .records import build_record, scan_records, text_to_embed
 from .search_service import SearchService
-from .state import IndexStateStore
+from .state import IndexStateStore, embedding_signature
+
+FTS_COLUMNS = ["id", "name", "description", "tags_text", "category"]
 
 
 class IndexStore:
@@ -32,7 +36,13 @@ class IndexStore:
         self.search_service = SearchService(
             search_threshold=config.search_threshold,
             embed_fn=lambda text: get_embedding(text, config),
+            mode=config.search_mode,
         )
+        # Cached table handle, revalidated against index_state.json on each access.
+        self._tbl = None
+        self._tbl_token: tuple[int, int] | None = None
+        self._tbl_loaded = False
+        self._tbl_lock = threading.Lock()
 
     # --- helpers ---------------------------------------------------------
     @staticmethod
@@ -44,19 +54,29 @@ class IndexStore:
         return value.replace("'", "''")
 
     def _prefilter_clause(self) -> str:
-        """Build WHERE clause reflecting enabled filters."""
+        """Build WHERE clause reflecting enabled filters.
+
+        Mirrors shared.filters.is_skill_enabled exactly (case-insensitive ids, leaf
+        names for enabled_skills, prefix match for namespaces) so callers can rely on
+        the database for both filtering and counting.
+        """
         if self.config.enabled_skills:
-            safe = [f"'{self._escape_sql(normalize_token(s))}'" for s in self.config.enabled_skills]
-            return f"id IN ({', '.join(safe)})"
+            clauses = []
+            enabled = [normalize_token(s) for s in self.config.enabled_skills]
+            safe = [f"'{self._escape_sql(s)}'" for s in enabled]
+            clauses.append(f"lower(id) IN ({', '.join(safe)})")
+            for leaf in enabled:
+                if leaf and "/" not in leaf:
+                    clauses.append(f"ends_with(lower(id), '/{self._escape_sql(leaf)}')")
+            return "(" + " OR ".join(clauses) + ")"
 
         if self.config.enabled_namespaces:
-            clauses = []
-            for ns in self.config.enabled_namespaces:
-                prefix = self._escape_sql(normalize_token(ns).rstrip("/"))
-                if prefix:
-                    clauses.append(f"lower(id) LIKE '{prefix}%'")
-            if clauses:
-                return "(" + " OR ".join(clauses) + ")"
+            prefixes = [normalize_token(ns).rstrip("/") for ns in self.config.enabled_namespaces]
+            if not all(prefixes):
+                # An empty namespace prefix matches every skill.
+                return ""
+            clauses = [f"starts_with(lower(id), '{self._escape_sql(p)}')" for p in prefixes]
+            return "(" + " OR ".join(clauses) + ")"
 
         if self.config.enabled_categories:
             safe = [
@@ -66,51 +86,93 @@ class IndexStore:
 
         return ""
 
-    def _embedding_signature(self) -> dict[str, Any]:
-        provider = self.config.embedding_provider
-        if provider == "openai":
-            return {
-                "embedding_provider": provider,
-                "embedding_model": self.config.openai_embedding_model,
-            }
-        return {"embedding_provider": provider, "embedding_model": None}
-
     # --- indexing --------------------------------------------------------
-    def _canonical_metadata(
-        self,
-        original_meta: dict[str, Any],
-        metadata_block: dict[str, Any],
-        skillport_meta: dict[str, Any],
-        category: Any,
-        tags: Any,
-        always_apply: bool,
-    ) -> dict[str, Any]:
-        meta_copy = dict(original_meta)
-        meta_metadata = dict(metadata_block) if isinstance(metadata_block, dict) else {}
-        skillport = dict(skillport_meta) if isinstance(skillport_meta, dict) else {}
-
-        if category is not None:
-            skillport["category"] = category
-        if tags is not None:
-            skillport["tags"] = tags
-        skillport["alwaysApply"] = bool(
-            skillport.get("alwaysApply", skillport.get("always_apply", always_apply))
-        )
-        skillport.pop("always_apply", None)
+    def _embed_records(self, records: list[SkillRecord]) -> None:
+        """Embed all records in one batched pass."""
+        if not records:
+            return
+        vectors = get_embeddings([text_to_embed(r) for r in records], self.config)
+        if vectors is None:
+            return
+        for record, vec in zip(records, vectors):
+            record.vector = vec
+
+    @staticmethod
+    def _arrow_schema(vector_dim: int | None) -> pa.Schema:
+        """Explicit table schema so incremental writes never hit inferred null types."""
+        fields = [
+            pa.field("id", pa.string()),
+            pa.field("name", pa.string()),
+            pa.field("description", pa.string()),
+            pa.field("category", pa.string()),
+            pa.field("tags", pa.list_(pa.string())),
+            pa.field("always_apply", pa.bool_()),
+            pa.field("instructions", pa.string()),
+            pa.field("path", pa.string()),
+            pa.field("lines", pa.int64()),
+            pa.field("metadata", pa.string()),
+        ]
+        if vector_dim:
+            fields.append(pa.field("vector", pa.list_(pa.float32(), vector_dim)))
+        fields.append(pa.field("tags_text", pa.string()))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _to_rows(records: list[SkillRecord], *, with_vectors: bool) -> list[dict[str, Any]]:
+        data: list[dict[str, Any]] = []
+        for r in records:
+            d = r.model_dump()
+            d["tags_text"] = (
+                " ".join(d["tags"]) if isinstance(d.get("tags"), list) else str(d.get("tags", ""))
+            )
+            if not with_vectors:
+                d.pop("vector", None)
+            data.append(d)
+        return data
 
-        skillport.pop("env_version", None)
-        skillport.pop("requires_setup", None)
-        skillport.pop("requiresSetup", None)
-        skillport.pop("runtime", None)
+    def _create_indexes(self, tbl, *, tags_present: bool) -> None:
+        try:
+            tbl.create_fts_index(FTS_COLUMNS, replace=True, use_tantivy=True)
+        except Exception:
+            # Newer LanceDB releases only ship native FTS, which indexes one
+            # column per index; queries still search every indexed column.
+            try:
+                for column in FTS_COLUMNS:
+                    tbl.create_fts_index(column, replace=True)
+            except Exception as exc:
+                print(f"FTS index creation failed: {exc}", file=sys.stderr)
 
-        meta_metadata["skillport"] = skillport
-        meta_copy["metadata"] = meta_metadata
-        return meta_copy
+        try:
+            tbl.create_scalar_index("id", index_type="BTREE", replace=True)
+        except Exception as exc:
+            print(f"ID scalar index creation failed: {exc}", file=sys.stderr)
 
-    def initialize_index(self) -> None:
-        """Scan skills_dir and (re)build the LanceDB table."""
+        try:
+            tbl.create_scalar_index("category", index_type="BITMAP", replace=True)
+        except Exception as exc:
+            print(f"Category scalar index creation failed: {exc}", file=sys.stderr)
+
+        if tags_present:
+            try:
+                tbl.create_scalar_index("tags", index_type="LABEL_LIST", replace=True)
+            except Exception as exc:
+                print(f"Tags scalar index creation failed: {exc}", file=sys.stderr)
+
+    def initialize_index(self, scan: SkillScan | None = None) -> None:
+        """Scan skills_dir (or reuse ``scan``) and (re)build the LanceDB table."""
+        try:
+            self._build_table(scan)
+        finally:
+            self._invalidate_table()
+
+    def _build_table(self, scan: SkillScan | None) -> None:
         # Fail fast for embeddings if needed (double-check even though Config validates)
-        if self.config.embedding_provider == "openai" and not self.config.openai_api_key:
+        config = self.config
+        if (
+            config.embedding_provider == "openai"
+            and not config.openai_api_key
+            and not config.openai_base_url
+        ):
             raise ValueError("OPENAI_API_KEY is required when embedding_provider='openai'")
 
         skills_dir = self.config.skills_dir
@@ -123,179 +185,148 @@ class IndexStore:
                 self.db.drop_table(self.table_name)
             return
 
-        records: list[SkillRecord] = []
-        vectors_present = False
-        tags_present = False
-        ids_seen: set[str] = set()
-
-        def _iter_skill_dirs(base: Path):
-            seen: set[Path] = set()
-            for pattern in ("*/SKILL.md", "*/*/SKILL.md"):
-                for skill_md in base.glob(pattern):
-                    skill_dir = skill_md.parent
-                    if skill_dir in seen:
-                        continue
-                    seen.add(skill_dir)
-                    rel = skill_dir.relative_to(base)
-                    if len(rel.parts) > 2:
-                        print(
-                            f"Skipping deep skill path (>2 levels): {skill_dir}",
-                            file=sys.stderr,
-                        )
-                        continue
-                    yield skill_dir
-
-        for skill_path in _iter_skill_dirs(skills_dir):
-            skill_md = skill_path / "SKILL.md"
-            content = skill_md.read_text(encoding="utf-8")
-            line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
-
-            meta, body = parse_frontmatter(skill_md)
-            if not isinstance(meta, dict):
-                print(
-                    f"Skipping skill '{skill_path.name}' because frontmatter is not a mapping",
-                    file=sys.stderr,
-                )
-                continue
-
-            metadata_block = meta.get("metadata", {})
-            if not isinstance(metadata_block, dict):
-                metadata_block = {}
-
-            name = meta.get("name") or skill_path.name
-            description = meta.get("description") or ""
-            skillport_meta = (
-                metadata_block.get("skillport", {}) if isinstance(metadata_block, dict) else {}
-            )
-            if not isinstance(skillport_meta, dict):
-                skillport_meta = {}
-
-            category = skillport_meta.get("category", "")
-            tags = skillport_meta.get("tags", [])
-            always_apply = skillport_meta.get(
-                "alwaysApply", skillport_meta.get("always_apply", False)
-            )
-            if not isinstance(always_apply, bool):
-                always_apply = False
-
-            category_norm = normalize_token(category) if category else ""
-            tags_norm: list[str] = []
-            if isinstance(tags, list):
-                tags_norm = [normalize_token(t) for t in tags]
-            elif isinstance(tags, str):
-                tags_norm = [normalize_token(tags)]
-
-            rel = skill_path.relative_to(skills_dir)
-            if len(rel.parts) == 1:
-                skill_id = rel.parts[0]
-            elif len(rel.parts) == 2:
-                skill_id = "/".join(rel.parts[:2])
-            else:
-                continue
-
-            if skill_id in ids_seen:
-                print(
-                    f"Skipping duplicate skill id '{skill_id}' at {skill_path}",
-                    file=sys.stderr,
-                )
-                continue
-            ids_seen.add(skill_id)
-
-            text_to_embed = f"{skill_id} {name} {description} {category_norm} {' '.join(tags_norm)}"
-            vec = self.search_service.embed_fn(text_to_embed)
-            if vec:
-                vectors_present = True
-            if tags_norm:
-                tags_present = True
-
-            record = SkillRecord(
-                id=skill_id,
-                name=name,
-                description=description,
-                category=category_norm,
-                tags=tags_norm,
-                always_apply=always_apply,
-                instructions=body,
-                path=str(skill_path.absolute()),
-                lines=line_count,
-                metadata=json.dumps(
-                    self._canonical_metadata(
-                        meta,
-                        metadata_block,
-                        skillport_meta,
-                        category,
-                        tags,
-                        always_apply,
-                    )
-                ),
-                vector=vec,
-            )
-            records.append(record)
-
+        records = scan_records(skills_dir, scan)
         if not records:
             if self.table_name in self.db.list_tables().tables:
                 self.db.drop_table(self.table_name)
             return
 
-        if self.table_name in self.db.list_tables().tables:
-            self.db.drop_table(self.table_name)
-
-        data: list[dict[str, Any]] = []
-        for r in records:
-            d = r.model_dump()
-            d["tags_text"] = (
-                " ".join(d["tags"]) if isinstance(d.get("tags"), list) else str(d.get("tags", ""))
-            )
-            if not vectors_present:
-                d.pop("vector", None)
-            data.append(d)
+        self._embed_records(records)
+        vectors_present = any(r.vector for r in records)
+        tags_present = any(r.tags for r in records)
 
+        # mode="overwrite" swaps the table in a single new version, so concurrent
+        # readers keep serving the previous version until they reopen.
+        data = self._to_rows(records, with_vectors=vectors_present)
         if not data:
             return
 
-        tbl = self.db.create_table(self.table_name, data=data, mode="overwrite")
+        vector_dim = len(next(r.vector for r in records if r.vector)) if vectors_present else None
+        tbl = self.db.create_table(
+            self.table_name,
+            data=pa.Table.from_pylist(data, schema=self._arrow_schema(vector_dim)),
+            mode="overwrite",
+        )
+        self._create_indexes(tbl, tags_present=tags_present)
+
+    def update_index(self, previous: dict[str, Any] | None, current: dict[str, Any]) -> bool:
+        """Apply only the per-skill changes between two index states.
 
+        Changed skills are re-parsed, re-embedded and upserted; removed skills are
+        deleted. Returns False when a delta is not possible (no fingerprints in the
+        previous state, no table, schema drift), in which case callers should fall
+        back to initialize_index().
+        """
+        diff = self.state_store.diff_skills(previous, current)
+        tbl = self._table()
+        if diff is None or tbl is None:
+            return False
+        if not any(diff):
+            # Touched but identical files: only the state file needs rewriting.
+            return True
         try:
-            tbl.create_fts_index(
-                ["id", "name", "description", "tags_text", "category"],
-                replace=True,
-                use_tantivy=True,
+            return self._apply_delta(tbl, *diff)
+        finally:
+            self._invalidate_table()
+
+    def _apply_delta(self, tbl, changed: set[str], removed: set[str]) -> bool:
+        records: list[SkillRecord] = []
+        for skill_id in sorted(changed):
+            skill_path = self.config.skills_dir / skill_id
+            record = (
+                build_record(skill_path, self.config.skills_dir)
+                if (skill_path / "SKILL.md").exists()
+                else None
             )
-        except Exception as exc:
-            print(f"FTS index creation failed: {exc}", file=sys.stderr)
+            if record is None:
+                removed.add(skill_id)
+                continue
+            records.append(record)
 
         try:
-            tbl.create_scalar_index("id", index_type="BTREE", replace=True)
+            self._embed_records(records)
+            schema = tbl.schema
+            with_vectors = "vector" in schema.names
+            if any(r.vector for r in records) and not with_vectors:
+                return False
+
+            if removed:
+                safe = [f"'{self._escape_sql(skill_id)}'" for skill_id in sorted(removed)]
+                tbl.delete(f"id IN ({', '.join(safe)})")
+            if records:
+                data = self._to_rows(records, with_vectors=with_vectors)
+                (
+                    tbl.merge_insert("id")
+                    .when_matched_update_all()
+                    .when_not_matched_insert_all()
+                    .execute(pa.Table.from_pylist(data, schema=schema))
+                )
         except Exception as exc:
-            print(f"ID scalar index creation failed: {exc}", file=sys.stderr)
+            print(f"Incremental reindex failed, rebuilding: {exc}", file=sys.stderr)
+            return False
 
-        try:
-            tbl.create_scalar_index("category", index_type="BITMAP", replace=True)
-        except Exception as exc:
-            print(f"Category scalar index creation failed: {exc}", file=sys.stderr)
+        if tbl.count_rows() == 0:
+            self.db.drop_table(self.table_name)
+            return True
 
-        if tags_present:
-            try:
-                tbl.create_scalar_index("tags", index_type="LABEL_LIST", replace=True)
-            except Exception as exc:
-                print(f"Tags scalar index creation failed: {exc}", file=sys.stderr)
+        tags_present = bool(tbl.count_rows("array_length(tags) > 0"))
+        self._create_indexes(tbl, tags_present=tags_present)
+        print(
+            f"Incremental reindex: {len(records)} updated, {len(removed)} removed",
+            file=sys.stderr,
+        )
+        return True
 
     # --- state -----------------------------------------------------------
     def should_reindex(self, *, force: bool = False, skip_auto: bool = False) -> dict[str, Any]:
         return self.state_store.should_reindex(
-            self._embedding_signature(), force=force, skip_auto=skip_auto
+            embedding_signature(self.config), force=force, skip_auto=skip_auto
         )
 
     def persist_state(self, state: dict[str, Any]) -> None:
         self.state_store.persist(state, skills_dir=self.config.skills_dir, db_path=self.db_path)
 
     # --- query -----------------------------------------------------------
+    def _state_token(self) -> tuple[int, int] | None:
+        """Cheap version marker: every build ends by rewriting index_state.json."""
+        try:
+            st = self.state_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _invalidate_table(self) -> None:
+        with self._tbl_lock:
+            self._tbl = None
+            self._tbl_loaded = False
+
+    def close(self) -> None:
+        """Drop the table handle and cached results (the store reopens on next use)."""
+        self._invalidate_table()
+        self.search_service.clear_cache()
+
     def _table(self):
-        if self.table_name in self.db.list_tables().tables:
-            return self.db.open_table(self.table_name)
-        return None
+        """Return the open table handle, reopening only when the index was rebuilt."""
+        token = self._state_token()
+        with self._tbl_lock:
+            if self._tbl_loaded and token == self._tbl_token:
+                return self._tbl
+            tbl = None
+            if self.table_name in self.db.list_tables().tables:
+                tbl = self.db.open_table(self.table_name)
+            self._tbl = tbl
+            self._tbl_token = token
+            self._tbl_loaded = True
+            return tbl
 
-    def search(self, query: str, *, limit: int) -> list[dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        view: View = "summary",
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
         tbl = self._table()
         return self.search_service.search(
             tbl,
@@ -303,19 +334,57 @@ class IndexStore:
             limit=limit,
             prefilter=self._prefilter_clause(),
             normalize_query=self._normalize_query,
+            columns=VIEWS[view],
+            cache_token=self._cache_token(tbl),
+            query_vector=query_vector,
         )
 
-    def get_by_id(self, identifier: str) -> dict[str, Any] | None:
+    def _cache_token(self, tbl) -> tuple[Any, ...] | None:
+        """Index version for the search result cache (None disables caching)."""
+        if self._tbl_token is None:
+            return None
+        try:
+            version = tbl.version
+        except Exception:
+            return None
+        return (self._tbl_token, version)
+
+    def count_matches(self, query: str, *, query_vector: list[float] | None = None) -> int:
+        """Enabled skills search() would return for ``query`` without a limit."""
+        tbl = self._table()
+        return self.search_service.count(
+            tbl,
+            query,
+            prefilter=self._prefilter_clause(),
+            normalize_query=self._normalize_query,
+            cache_token=self._cache_token(tbl),
+            query_vector=query_vector,
+        )
+
+    def count(self) -> int:
+        """Number of enabled skills in the index (prefilter applied)."""
+        tbl = self._table()
+        if not tbl:
+            return 0
+        prefilter = self._prefilter_clause()
+        try:
+            return tbl.count_rows(prefilter) if prefilter else tbl.count_rows()
+        except Exception as exc:
+            print(f"Error counting skills: {exc}", file=sys.stderr)
+            return 0
+
+    def get_by_id(self, identifier: str, *, view: View = "detail") -> dict[str, Any] | None:
         tbl = self._table()
         if not tbl:
             return None
 
+        columns = VIEWS[view]
         safe = self._escape_sql(identifier)
-        res = tbl.search().where(f"id = '{safe}'").limit(1).to_list()
+        res = tbl.search().where(f"id = '{safe}'").select(columns).limit(1).to_list()
         if res:
             return res[0]
 
-        name_matches = tbl.search().where(f"name = '{safe}'").limit(5).to_list()
+        name_matches = tbl.search().where(f"name = '{safe}'").select(columns).limit(5).to_list()
         if len(name_matches) == 1:
             return name_matches[0]
         if len(name_matches) > 1:
@@ -325,6 +394,38 @@ class IndexStore:
             )
         return None
 
+    def get_many(
+        self, identifiers: list[str], *, view: View = "detail"
+    ) -> dict[str, dict[str, Any]]:
+        """Rows for several ids (or unique names), keyed by the requested identifier.
+
+        Ids are fetched with one ``id IN (...)`` query (BTREE index on id); leftovers
+        are tried as names with one ``name IN (...)`` query. Unknown and ambiguous
+        identifiers are omitted; get_by_id reports why.
+        """
+        tbl = self._table()
+        wanted = list(dict.fromkeys(i for i in identifiers if i))
+        if not tbl or not wanted:
+            return {}
+
+        columns = VIEWS[view]
+
+        def fetch(column: str, values: list[str], limit: int) -> list[dict[str, Any]]:
+            quoted = ", ".join(f"'{self._escape_sql(v)}'" for v in values)
+            op = tbl.search().where(f"{column} IN ({quoted})").select(columns)
+            return op.limit(limit).to_list()
+
+        found = {row["id"]: row for row in fetch("id", wanted, len(wanted))}
+        missing = [i for i in wanted if i not in found]
+        if missing:
+            by_name: dict[str, list[dict[str, Any]]] = {}
+            for row in fetch("name", missing, len(missing) * 5):
+                by_name.setdefault(row.get("name"), []).append(row)
+            for name in missing:
+                if len(by_name.get(name, ())) == 1:
+                    found[name] = by_name[name][0]
+        return {i: found[i] for i in wanted if i in found}
+
     def get_core_skills(self) -> list[dict[str, Any]]:
         tbl = self._table()
         if not tbl:
@@ -334,12 +435,12 @@ class IndexStore:
         prefilter = self._prefilter_clause()
         clause = base if not prefilter else f"{base} AND ({prefilter})"
         try:
-            return tbl.search().where(clause).limit(100).to_list()
+            return tbl.search().where(clause).select(SUMMARY_COLUMNS).limit(100).to_list()
         except Exception as exc:
             print(f"Error fetching core skills: {exc}", file=sys.stderr)
             return []
 
-    def list_all(self, *, limit: int) -> list[dict[str, Any]]:
+    def list_all(self, *, limit: int, view: View = "summary") -> list[dict[str, Any]]:
         tbl = self._table()
         if not tbl:
             return []
@@ -349,7 +450,7 @@ class IndexStore:
             query = tbl.search()
             if prefilter:
                 query = query.where(prefilter)
-            rows = query.limit(limit).to_list()
+            rows = query.select(VIEWS[view]).limit(limit).to_list()
             for r in rows:
                 if "_score" not in r:
                     r["_score"] = 1.0
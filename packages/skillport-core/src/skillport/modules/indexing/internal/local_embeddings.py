@@ -0,0 +1,94 @@
+"""Offline embeddings via feature hashing (no network, no model download).
+
+Each text becomes a bag of word unigrams plus character trigrams of every word,
+hashed into ``dimensions`` signed buckets (blake2b, so vectors are stable across
+processes and platforms). Counts are log-scaled and the vector is L2-normalized,
+so L2 distance between two vectors is a monotone function of their cosine
+similarity. Trigrams make the vectors tolerant of plurals and small typos.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+
+from .providers import EmbeddingProvider
+
+LOCAL_EMBEDDING_MODEL = "hashed-ngram-v1"
+# Character n-gram length for sub-word features.
+CHAR_NGRAM = 3
+# Sub-word features count for less than whole words.
+CHAR_NGRAM_WEIGHT = 0.5
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def local_model_name(dimensions: int) -> str:
+    """Model identifier used in the index state and embedding cache keys."""
+    return f"{LOCAL_EMBEDDING_MODEL}-{dimensions}"
+
+
+def _bucket(feature: str, dimensions: int) -> tuple[int, float]:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dimensions, (1.0 if value >> 63 else -1.0)
+
+
+@lru_cache(maxsize=65536)
+def _token_features(token: str, dimensions: int) -> tuple[tuple[int, float], ...]:
+    """(bucket, signed weight) pairs for one token: the word plus its char n-grams."""
+    features = [_bucket(f"w:{token}", dimensions)]
+    padded = f"<{token}>"
+    for i in range(max(1, len(padded) - CHAR_NGRAM + 1)):
+        bucket, sign = _bucket(f"c:{padded[i : i + CHAR_NGRAM]}", dimensions)
+        features.append((bucket, sign * CHAR_NGRAM_WEIGHT))
+    return tuple(features)
+
+
+def hashed_ngram_embeddings(texts: list[str], dimensions: int) -> list[list[float]]:
+    """Embed ``texts`` into unit vectors of length ``dimensions`` (zero vector for empty text)."""
+    import numpy as np
+
+    matrix = np.zeros((len(texts), dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        counts: dict[str, int] = {}
+        for token in _TOKEN_RE.findall(text.lower()):
+            counts[token] = counts.get(token, 0) + 1
+        vec = matrix[row]
+        for token, count in counts.items():
+            tf = 1.0 + np.log(count)
+            for bucket, weight in _token_features(token, dimensions):
+                vec[bucket] += weight * tf
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix.tolist()
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """embedding_provider='local': hashed n-gram vectors computed in-process."""
+
+    local = True
+
+    @property
+    def model(self) -> str:
+        return local_model_name(self.config.local_embedding_dimensions)
+
+    @property
+    def dimensions(self) -> int:
+        return self.config.local_embedding_dimensions
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return hashed_ngram_embeddings(texts, self.dimensions)
+
+    async def aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_batch(texts)
+
+
+__all__ = [
+    "LOCAL_EMBEDDING_MODEL",
+    "LocalEmbeddingProvider",
+    "hashed_ngram_embeddings",
+    "local_model_name",
+]
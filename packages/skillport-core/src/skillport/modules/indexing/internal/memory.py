@@ -0,0 +1,387 @@
+"""In-process BM25 index for embedding_provider='none' (no LanceDB import).
+
+Records are persisted as a gzip-compressed JSON file next to index_state.json
+and loaded into an inverted index over id/name/description/tags/category.
+Scoring is BM25 per field with field boosts; query terms also match indexed
+terms they prefix (e.g. "pd" -> "pdf") at a reduced weight.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import os
+import re
+import sys
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from skillport.shared.config import Config
+from skillport.shared.filters import is_skill_enabled
+from skillport.shared.scan import SkillScan
+
+from .models import SUMMARY_COLUMNS, VIEWS, SkillRecord, View
+from .records import build_record, scan_records
+from .search_service import SUBSTRING_FIELDS
+from .state import IndexStateStore, embedding_signature
+
+MEMORY_INDEX_FILENAME = "skills_memory.json.gz"
+MEMORY_INDEX_VERSION = 1
+
+FIELD_BOOSTS = {"name": 3.0, "id": 2.0, "tags": 2.0, "category": 1.5, "description": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Weight of a term reached by prefix expansion relative to an exact match.
+PREFIX_WEIGHT = 0.5
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSIONS = 50
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric runs; "/", "-", "_" and whitespace all split."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _field_text(row: dict[str, Any], field: str) -> str:
+    value = row.get(field)
+    if isinstance(value, list):
+        return " ".join(str(v) for v in value)
+    return str(value or "")
+
+
+class MemoryIndex:
+    """Inverted index with field-boosted BM25 scoring over skill rows."""
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        self.by_id = {row["id"]: i for i, row in enumerate(rows)}
+        # term -> [(doc, field, term frequency)]
+        self._postings: dict[str, list[tuple[int, str, int]]] = defaultdict(list)
+        self._lengths: dict[str, list[int]] = {field: [] for field in FIELD_BOOSTS}
+
+        for doc, row in enumerate(rows):
+            for field in FIELD_BOOSTS:
+                tokens = tokenize(_field_text(row, field))
+                self._lengths[field].append(len(tokens))
+                counts: dict[str, int] = defaultdict(int)
+                for token in tokens:
+                    counts[token] += 1
+                for term, tf in counts.items():
+                    self._postings[term].append((doc, field, tf))
+
+        n = len(rows) or 1
+        self._avg_length = {
+            field: (sum(lengths) / n) or 1.0 for field, lengths in self._lengths.items()
+        }
+        self._idf: dict[str, float] = {}
+        for term, postings in self._postings.items():
+            df = len({doc for doc, _, _ in postings})
+            self._idf[term] = math.log(1 + (len(rows) - df + 0.5) / (df + 0.5))
+        self._vocabulary = sorted(self._postings)
+
+    def _expand(self, token: str) -> list[tuple[str, float]]:
+        terms = [(token, 1.0)] if token in self._postings else []
+        if len(token) < MIN_PREFIX_LENGTH:
+            return terms
+        start = bisect_left(self._vocabulary, token)
+        for term in self._vocabulary[start : start + MAX_PREFIX_EXPANSIONS + 1]:
+            if not term.startswith(token):
+                break
+            if term != token:
+                terms.append((term, PREFIX_WEIGHT))
+        return terms
+
+    def search(
+        self, query: str, *, allowed: Callable[[dict[str, Any]], bool]
+    ) -> list[tuple[int, float]]:
+        """Return (row index, score) pairs sorted by descending score."""
+        scores: dict[int, float] = defaultdict(float)
+        for token in dict.fromkeys(tokenize(query)):
+            for term, weight in self._expand(token):
+                idf = self._idf[term]
+                for doc, field, tf in self._postings[term]:
+                    norm = 1 - BM25_B + BM25_B * self._lengths[field][doc] / self._avg_length[field]
+                    bm25 = idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                    scores[doc] += weight * FIELD_BOOSTS[field] * bm25
+
+        hits = [(doc, score) for doc, score in scores.items() if allowed(self.rows[doc])]
+        hits.sort(key=lambda item: (-item[1], item[0]))
+        return hits
+
+
+class MemoryIndexStore:
+    """IndexStore counterpart that keeps the whole index in process memory."""
+
+    schema_version = "memory-v1"
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.db_path = config.db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.db_path.parent / MEMORY_INDEX_FILENAME
+        self.state_path = self.db_path.parent / "index_state.json"
+        self.state_store = IndexStateStore(config, self.schema_version, self.state_path)
+        # Loaded index, revalidated against index_state.json on each access.
+        self._index: MemoryIndex | None = None
+        self._index_token: tuple[int, int] | None = None
+        self._index_loaded = False
+        self._index_lock = threading.Lock()
+
+    # --- helpers ---------------------------------------------------------
+    @staticmethod
+    def _normalize_query(value: str) -> str:
+        return " ".join(value.strip().split())
+
+    def _enabled(self, row: dict[str, Any]) -> bool:
+        return is_skill_enabled(row["id"], row.get("category"), config=self.config)
+
+    @staticmethod
+    def _project(row: dict[str, Any], view: View, **extra: Any) -> dict[str, Any]:
+        projected = {col: row.get(col) for col in VIEWS[view]}
+        projected.update(extra)
+        return projected
+
+    # --- persistence -----------------------------------------------------
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            self.index_path.unlink(missing_ok=True)
+            return
+        payload = json.dumps(
+            {"version": MEMORY_INDEX_VERSION, "records": rows},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+            f.write(payload)
+        os.replace(tmp_path, self.index_path)
+
+    def _read(self) -> list[dict[str, Any]] | None:
+        try:
+            with gzip.open(self.index_path, "rb") as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            print(f"Failed to read memory index {self.index_path}: {exc}", file=sys.stderr)
+            return None
+        if data.get("version") != MEMORY_INDEX_VERSION:
+            return None
+        return data.get("records") or None
+
+    @staticmethod
+    def _to_row(record: SkillRecord) -> dict[str, Any]:
+        return record.model_dump(exclude={"vector"})
+
+    # --- indexing --------------------------------------------------------
+    def initialize_index(self, scan: SkillScan | None = None) -> None:
+        """Scan skills_dir (or reuse ``scan``) and rewrite the memory index file."""
+        try:
+            skills_dir = self.config.skills_dir
+            if not skills_dir.exists():
+                print(
+                    f"Skills dir not found: {skills_dir}; dropping existing index if present",
+                    file=sys.stderr,
+                )
+                self._write([])
+                return
+            self._write([self._to_row(r) for r in scan_records(skills_dir, scan)])
+        finally:
+            self._invalidate()
+
+    def update_index(self, previous: dict[str, Any] | None, current: dict[str, Any]) -> bool:
+        """Re-parse only changed skills; False means callers should fully rebuild."""
+        diff = self.state_store.diff_skills(previous, current)
+        index = self._load()
+        if diff is None or index is None:
+            return False
+        if not any(diff):
+            # Touched but identical files: only the state file needs rewriting.
+            return True
+        changed, removed = diff
+
+        rows = {row["id"]: row for row in index.rows}
+        updated = 0
+        for skill_id in sorted(changed):
+            skill_path = self.config.skills_dir / skill_id
+            record = (
+                build_record(skill_path, self.config.skills_dir)
+                if (skill_path / "SKILL.md").exists()
+                else None
+            )
+            if record is None:
+                removed.add(skill_id)
+                continue
+            rows[record.id] = self._to_row(record)
+            updated += 1
+        for skill_id in removed:
+            rows.pop(skill_id, None)
+
+        try:
+            self._write(list(rows.values()))
+        finally:
+            self._invalidate()
+        print(f"Incremental reindex: {updated} updated, {len(removed)} removed", file=sys.stderr)
+        return True
+
+    # --- state -----------------------------------------------------------
+    def should_reindex(self, *, force: bool = False, skip_auto: bool = False) -> dict[str, Any]:
+        return self.state_store.should_reindex(
+            embedding_signature(self.config), force=force, skip_auto=skip_auto
+        )
+
+    def persist_state(self, state: dict[str, Any]) -> None:
+        self.state_store.persist(state, skills_dir=self.config.skills_dir, db_path=self.db_path)
+
+    # --- query -----------------------------------------------------------
+    def _state_token(self) -> tuple[int, int] | None:
+        """Cheap version marker: every build ends by rewriting index_state.json."""
+        try:
+            st = self.state_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _invalidate(self) -> None:
+        with self._index_lock:
+            self._index = None
+            self._index_token = None
+            self._index_loaded = False
+
+    def close(self) -> None:
+        """Drop the loaded index (reloaded on next use)."""
+        self._invalidate()
+
+    def _load(self) -> MemoryIndex | None:
+        """Return the in-memory index, reloading only when the index was rebuilt."""
+        token = self._state_token()
+        with self._index_lock:
+            if self._index_loaded and token == self._index_token:
+                return self._index
+            rows = self._read()
+            self._index = MemoryIndex(rows) if rows else None
+            self._index_token = token
+            self._index_loaded = True
+            return self._index
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        view: View = "summary",
+        query_vector: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        # query_vector is accepted for IndexStore parity; BM25 does not use it.
+        index = self._load()
+        if index is None:
+            return []
+        return [
+            self._project(row, view, _score=score, _source=source)
+            for row, score, source in self._matches(index, query, limit)
+        ]
+
+    def count_matches(self, query: str, *, query_vector: list[float] | None = None) -> int:
+        """Enabled skills search() would return for ``query`` without a limit."""
+        index = self._load()
+        if index is None:
+            return 0
+        return len(self._matches(index, query, len(index.rows)))
+
+    def _matches(
+        self, index: MemoryIndex, query: str, limit: int
+    ) -> list[tuple[dict[str, Any], float, str]]:
+        """BM25 hits above the relative threshold, else substring matches."""
+        query_norm = self._normalize_query(query)
+        hits = index.search(query_norm, allowed=self._enabled)
+        if hits:
+            top_score = hits[0][1]
+            threshold = self.config.search_threshold
+            return [
+                (index.rows[doc], score, "fts")
+                for doc, score in hits[:limit]
+                if score / top_score >= threshold
+            ]
+
+        qlow = query_norm.lower()
+        results: list[tuple[dict[str, Any], float, str]] = []
+        for row in index.rows:
+            if not self._enabled(row):
+                continue
+            if any(qlow in str(row.get(field, "")).lower() for field in SUBSTRING_FIELDS):
+                results.append((row, 0.1, "substring"))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def count(self) -> int:
+        """Number of enabled skills in the index."""
+        index = self._load()
+        if index is None:
+            return 0
+        return sum(1 for row in index.rows if self._enabled(row))
+
+    def get_by_id(self, identifier: str, *, view: View = "detail") -> dict[str, Any] | None:
+        index = self._load()
+        if index is None:
+            return None
+
+        doc = index.by_id.get(identifier)
+        if doc is not None:
+            return self._project(index.rows[doc], view)
+
+        name_matches = [row for row in index.rows if row.get("name") == identifier]
+        if len(name_matches) == 1:
+            return self._project(name_matches[0], view)
+        if len(name_matches) > 1:
+            ids = [m["id"] for m in name_matches[:5]]
+            raise ValueError(
+                f"Ambiguous skill name '{identifier}'. Specify full id. Candidates: {', '.join(ids)}"
+            )
+        return None
+
+    def get_many(
+        self, identifiers: list[str], *, view: View = "detail"
+    ) -> dict[str, dict[str, Any]]:
+        """Same contract as IndexStore.get_many (unknown/ambiguous ids omitted)."""
+        result: dict[str, dict[str, Any]] = {}
+        for identifier in dict.fromkeys(i for i in identifiers if i):
+            try:
+                row = self.get_by_id(identifier, view=view)
+            except ValueError:
+                continue
+            if row is not None:
+                result[identifier] = row
+        return result
+
+    def get_core_skills(self) -> list[dict[str, Any]]:
+        index = self._load()
+        if index is None:
+            return []
+        core = [
+            {col: row.get(col) for col in SUMMARY_COLUMNS}
+            for row in index.rows
+            if row.get("always_apply") and self._enabled(row)
+        ]
+        return core[:100]
+
+    def list_all(self, *, limit: int, view: View = "summary") -> list[dict[str, Any]]:
+        index = self._load()
+        if index is None:
+            return []
+        rows: list[dict[str, Any]] = []
+        for row in index.rows:
+            if len(rows) >= limit:
+                break
+            if self._enabled(row):
+                rows.append(self._project(row, view, _score=1.0))
+        return rows
+
+
+__all__ = ["MemoryIndex", "MemoryIndexStore", "tokenize"]
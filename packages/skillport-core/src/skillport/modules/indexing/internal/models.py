@@ -1,8 +1,9 @@
-from lancedb.pydantic import LanceModel
-from pydantic import Field
+from typing import Literal
 
+from pydantic import BaseModel, Field
 
-class SkillRecord(LanceModel):
+
+class SkillRecord(BaseModel):
     id: str
     name: str
     description: str
@@ -14,3 +15,13 @@ class SkillRecord(LanceModel):
     lines: int = 0
     metadata: str
     vector: list[float] | None = None
+
+
+View = Literal["summary", "detail"]
+
+# Row projections for read paths. "summary" is enough for listing, searching,
+# core skills and file access; "detail" adds what load_skill returns. Neither
+# decodes the embedding vector.
+SUMMARY_COLUMNS = ["id", "name", "description", "category", "tags", "always_apply", "path"]
+DETAIL_COLUMNS = [*SUMMARY_COLUMNS, "instructions", "lines", "metadata"]
+VIEWS: dict[str, list[str]] = {"summary": SUMMARY_COLUMNS, "detail": DETAIL_COLUMNS}
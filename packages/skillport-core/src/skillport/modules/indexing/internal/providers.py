@@ -0,0 +1,118 @@
+"""Embedding provider registry.
+
+Built-in providers are resolved from ``_BUILTINS``; anything else is looked up in
+the ``skillport.embedding_providers`` entry-point group, e.g. in a plugin's
+pyproject.toml::
+
+    [project.entry-points."skillport.embedding_providers"]
+    my-provider = "my_package.embeddings:MyProvider"
+
+and selected with ``SKILLPORT_EMBEDDING_PROVIDER=my-provider``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from importlib import import_module
+from typing import Any
+
+from skillport.shared.config import Config, embedding_provider_entry_points
+
+_BUILTINS = {
+    "openai": "skillport.modules.indexing.internal.embeddings:OpenAIEmbeddingProvider",
+    "local": "skillport.modules.indexing.internal.local_embeddings:LocalEmbeddingProvider",
+}
+# HTTP statuses worth retrying besides 5xx: request timeout, conflict, rate limit.
+RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+
+def _status_code(exc: Exception) -> int | None:
+    """HTTP status carried by an SDK error (OpenAI v1, legacy OpenAI or httpx), if any."""
+    for status in (
+        getattr(exc, "status_code", None),
+        getattr(exc, "http_status", None),
+        getattr(getattr(exc, "response", None), "status_code", None),
+    ):
+        if isinstance(status, int):
+            return status
+    return None
+
+
+class EmbeddingProvider(ABC):
+    """Base class for embedding backends.
+
+    Subclasses implement ``embed_batch``; ``aembed_batch`` defaults to running it
+    in a worker thread. The batching, caching and retry pipeline lives in
+    ``embeddings.get_embeddings`` / ``aget_embeddings``.
+    """
+
+    # Largest number of texts the backend accepts per call.
+    max_batch_size: int = 256
+    # In-process providers are called once with every text: no cache, no retries.
+    local: bool = False
+
+    def __init__(self, config: Config):
+        self.config = config
+
+    @property
+    def model(self) -> str | None:
+        """Model identifier; part of the index signature and embedding cache keys."""
+        return None
+
+    @property
+    def dimensions(self) -> int | None:
+        """Vector length, when known up front (None skips the length check)."""
+        return None
+
+    def signature(self) -> dict[str, Any]:
+        """Recorded in index state; any change forces a full rebuild."""
+        return {"embedding_provider": self.config.embedding_provider, "embedding_model": self.model}
+
+    @abstractmethod
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts`` in one call, returning vectors in the same order."""
+
+    async def aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        return await asyncio.to_thread(self.embed_batch, texts)
+
+    def is_transient(self, exc: Exception) -> bool:
+        """True when retrying may succeed: timeouts, connection errors, 429 and 5xx.
+
+        Anything else (bad key, unknown model, invalid input) fails the batch at once.
+        """
+        if isinstance(exc, (TimeoutError, ConnectionError)):
+            return True
+        status = _status_code(exc)
+        return status is not None and (status in RETRYABLE_STATUSES or status >= 500)
+
+
+@lru_cache(maxsize=16)
+def provider_class(name: str) -> type[EmbeddingProvider]:
+    spec = _BUILTINS.get(name)
+    if spec is not None:
+        module, attr = spec.split(":")
+        return getattr(import_module(module), attr)
+
+    entry_point = embedding_provider_entry_points().get(name)
+    if entry_point is None:
+        raise ValueError(f"Unknown embedding_provider: {name}")
+    cls = entry_point.load()
+    if not (isinstance(cls, type) and issubclass(cls, EmbeddingProvider)):
+        raise TypeError(f"Embedding provider '{name}' must subclass EmbeddingProvider")
+    if inspect.isabstract(cls):
+        missing = ", ".join(sorted(cls.__abstractmethods__))
+        raise TypeError(f"Embedding provider '{name}' does not implement: {missing}")
+    return cls
+
+
+def get_provider(config: Config) -> EmbeddingProvider | None:
+    """Provider configured by ``config``, or None when embedding_provider='none'."""
+    if config.embedding_provider == "none":
+        return None
+    return provider_class(config.embedding_provider)(config)
+
+
+__all__ = ["EmbeddingProvider", "get_provider", "provider_class"]
@@ -0,0 +1,145 @@
+"""Parse skill directories into SkillRecords (shared by every index backend)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from skillport.shared.scan import SkillScan, scan_skills
+from skillport.shared.utils import normalize_token, parse_frontmatter
+
+from .models import SkillRecord
+
+
+def canonical_metadata(
+    original_meta: dict[str, Any],
+    metadata_block: dict[str, Any],
+    skillport_meta: dict[str, Any],
+    category: Any,
+    tags: Any,
+    always_apply: bool,
+) -> dict[str, Any]:
+    meta_copy = dict(original_meta)
+    meta_metadata = dict(metadata_block) if isinstance(metadata_block, dict) else {}
+    skillport = dict(skillport_meta) if isinstance(skillport_meta, dict) else {}
+
+    if category is not None:
+        skillport["category"] = category
+    if tags is not None:
+        skillport["tags"] = tags
+    skillport["alwaysApply"] = bool(
+        skillport.get("alwaysApply", skillport.get("always_apply", always_apply))
+    )
+    skillport.pop("always_apply", None)
+
+    skillport.pop("env_version", None)
+    skillport.pop("requires_setup", None)
+    skillport.pop("requiresSetup", None)
+    skillport.pop("runtime", None)
+
+    meta_metadata["skillport"] = skillport
+    meta_copy["metadata"] = meta_metadata
+    return meta_copy
+
+
+def iter_skill_dirs(base: Path, scan: SkillScan | None = None) -> Iterator[Path]:
+    """Skill directories under ``base`` (from ``scan`` when the caller already has one)."""
+    for skill in scan if scan is not None else scan_skills(base):
+        yield skill.path
+
+
+def build_record(skill_path: Path, skills_dir: Path) -> SkillRecord | None:
+    """Parse a skill directory into a SkillRecord (without embedding)."""
+    skill_md = skill_path / "SKILL.md"
+    content = skill_md.read_text(encoding="utf-8")
+    line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+
+    meta, body = parse_frontmatter(skill_md)
+    if not isinstance(meta, dict):
+        print(
+            f"Skipping skill '{skill_path.name}' because frontmatter is not a mapping",
+            file=sys.stderr,
+        )
+        return None
+
+    metadata_block = meta.get("metadata", {})
+    if not isinstance(metadata_block, dict):
+        metadata_block = {}
+
+    name = meta.get("name") or skill_path.name
+    description = meta.get("description") or ""
+    skillport_meta = metadata_block.get("skillport", {}) if isinstance(metadata_block, dict) else {}
+    if not isinstance(skillport_meta, dict):
+        skillport_meta = {}
+
+    category = skillport_meta.get("category", "")
+    tags = skillport_meta.get("tags", [])
+    always_apply = skillport_meta.get("alwaysApply", skillport_meta.get("always_apply", False))
+    if not isinstance(always_apply, bool):
+        always_apply = False
+
+    category_norm = normalize_token(category) if category else ""
+    tags_norm: list[str] = []
+    if isinstance(tags, list):
+        tags_norm = [normalize_token(t) for t in tags]
+    elif isinstance(tags, str):
+        tags_norm = [normalize_token(tags)]
+
+    rel = skill_path.relative_to(skills_dir)
+    if len(rel.parts) not in (1, 2):
+        return None
+    skill_id = "/".join(rel.parts)
+
+    return SkillRecord(
+        id=skill_id,
+        name=name,
+        description=description,
+        category=category_norm,
+        tags=tags_norm,
+        always_apply=always_apply,
+        instructions=body,
+        path=str(skill_path.absolute()),
+        lines=line_count,
+        metadata=json.dumps(
+            canonical_metadata(
+                meta,
+                metadata_block,
+                skillport_meta,
+                category,
+                tags,
+                always_apply,
+            )
+        ),
+    )
+
+
+def scan_records(skills_dir: Path, scan: SkillScan | None = None) -> list[SkillRecord]:
+    """Build records for every skill under skills_dir, skipping duplicate ids."""
+    records: list[SkillRecord] = []
+    ids_seen: set[str] = set()
+
+    for skill_path in iter_skill_dirs(skills_dir, scan):
+        record = build_record(skill_path, skills_dir)
+        if record is None:
+            continue
+        if record.id in ids_seen:
+            print(
+                f"Skipping duplicate skill id '{record.id}' at {skill_path}",
+                file=sys.stderr,
+            )
+            continue
+        ids_seen.add(record.id)
+        records.append(record)
+    return records
+
+
+def text_to_embed(record: SkillRecord) -> str:
+    return (
+        f"{record.id} {record.name} {record.description} {record.category} {' '.join(record.tags)}"
+    )
+
+
+__all__ = ["build_record", "canonical_metadata", "iter_skill_dirs", "scan_records", "text_to_embed"]
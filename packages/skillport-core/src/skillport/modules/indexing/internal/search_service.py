@@ -1,11 +1,58 @@
-"""Search strategy with vector → FTS → substring fallback."""
+"""Search strategies: hybrid (vector + FTS fused by RRF) or vector → FTS → substring fallback."""
 
 from __future__ import annotations
 
+import atexit
 import sys
-from collections.abc import Callable
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal
+
+from skillport.shared.config import MAX_SKILLS
+
+SUBSTRING_FIELDS = ("id", "name", "description")
+# Reciprocal rank fusion constant (Cormack et al.); damps the weight of top ranks.
+RRF_K = 60
+# Each ranked list is over-fetched so fusion can promote rows one source ranks low.
+HYBRID_CANDIDATE_FACTOR = 2
+# In-process result cache: entries per service and their lifetime in seconds.
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 300.0
+# Threads shared by every SearchService to run the FTS leg of hybrid search.
+SEARCH_POOL_WORKERS = 4
+# Recent query embeddings per service, so a page and its total embed once.
+QUERY_VECTOR_CACHE_SIZE = 64
+
+SearchMode = Literal["hybrid", "fallback"]
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _search_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=SEARCH_POOL_WORKERS, thread_name_prefix="skillport-search"
+            )
+        return _pool
+
+
+def shutdown_search_pool() -> None:
+    """Stop the shared search threads; the next hybrid search starts a new pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_search_pool)
 
 
 def _normalize_score(row: dict[str, Any]) -> float:
@@ -21,7 +68,9 @@ def _normalize_score(row: dict[str, Any]) -> float:
             return 0.0
     if row.get("_distance") is not None:
         try:
-            return -float(row["_distance"])
+            # Vector queries use the cosine metric, so this is cosine similarity
+            # whatever the length of the provider's vectors.
+            return max(0.0, 1.0 - float(row["_distance"]))
         except Exception:
             return 0.0
     return 0.0
@@ -29,15 +78,20 @@ def _normalize_score(row: dict[str, Any]) -> float:
 
 @dataclass
 class SearchHit:
-    """Internal search hit (not to be confused with public SearchResult)."""
+    """Internal search hit (not to be confused with public SearchResult).
+
+    ``score`` orders hits. ``relevance`` is what callers see as ``_score`` when it
+    differs: fused hits are ordered by RRF but report their similarity.
+    """
 
     row: dict[str, Any]
     score: float
     source: str
+    relevance: float | None = None
 
     def to_dict(self) -> dict[str, Any]:
         merged = dict(self.row)
-        merged["_score"] = self.score
+        merged["_score"] = self.score if self.relevance is None else self.relevance
         merged["_source"] = self.source
         return merged
 
@@ -50,9 +104,18 @@ class SearchService:
         *,
         search_threshold: float,
         embed_fn: Callable[[str], list[float] | None],
+        mode: SearchMode = "hybrid",
+        cache_size: int = RESULT_CACHE_SIZE,
+        cache_ttl: float = RESULT_CACHE_TTL,
     ):
         self.search_threshold = search_threshold
         self.embed_fn = embed_fn
+        self.mode = mode
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[Hashable, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._vectors: OrderedDict[str, list[float]] = OrderedDict()
 
     def search(
         self,
@@ -62,37 +125,112 @@ class SearchService:
         limit: int,
         prefilter: str,
         normalize_query: Callable[[str], str],
+        columns: list[str] | None = None,
+        cache_token: Hashable | None = None,
+        query_vector: list[float] | None = None,
     ) -> list[dict[str, Any]]:
+        """Run the configured strategy; results are cached while ``cache_token`` holds.
+
+        ``cache_token`` identifies the index version (e.g. table version plus state
+        file fingerprint). Without it results are never cached. ``query_vector`` is
+        the query's embedding when the caller already has it (embed_fn is skipped).
+        """
         if not table:
             return []
 
         query_norm = normalize_query(query)
-        vec: list[float] | None = None
-        try:
-            vec = self.embed_fn(query_norm)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"Embedding fetch failed, falling back to FTS: {exc}", file=sys.stderr)
-            vec = None
+        key = None
+        if cache_token is not None and self.cache_size > 0:
+            key = (query_norm, prefilter, limit, tuple(columns or ()), cache_token)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        results = self._execute(table, query_norm, limit, prefilter, columns, query_vector)
+        if key is not None:
+            self._cache_put(key, results)
+        return results
+
+    def count(
+        self,
+        table,
+        query: str,
+        *,
+        prefilter: str,
+        normalize_query: Callable[[str], str],
+        cache_token: Hashable | None = None,
+        query_vector: list[float] | None = None,
+    ) -> int:
+        """Number of rows search() returns for ``query`` when not limited.
+
+        Runs the same strategy, fallbacks and thresholds as search(), at full depth
+        and fetching only ``id``, so totals agree with the returned results.
+        """
+        rows = self.search(
+            table,
+            query,
+            limit=MAX_SKILLS,
+            prefilter=prefilter,
+            normalize_query=normalize_query,
+            columns=["id"],
+            cache_token=cache_token,
+            query_vector=query_vector,
+        )
+        return len(rows)
 
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._vectors.clear()
+
+    def _execute(
+        self,
+        table,
+        query_norm: str,
+        limit: int,
+        prefilter: str,
+        columns: list[str] | None,
+        query_vector: list[float] | None,
+    ) -> list[dict[str, Any]]:
+        if self.mode == "hybrid":
+            try:
+                results = self._hybrid_search(
+                    table, query_norm, prefilter, limit, columns, query_vector
+                )
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"Search error: {exc}", file=sys.stderr)
+                return []
+            results.sort(key=lambda r: r.score, reverse=True)
+            return [r.to_dict() for r in results[:limit]]
+
+        vec = query_vector if query_vector is not None else self._embed(query_norm)
         try:
+            results: list[SearchHit] = []
             if vec:
                 try:
-                    results = self._vector_search(table, vec, prefilter, limit)
+                    # Unthresholded, as this mode always was: the nearest rows are returned.
+                    results = self._vector_search(
+                        table, vec, prefilter, limit, columns, threshold=False
+                    )
                 except Exception as exc:
                     print(
                         f"Vector search failed, falling back to FTS: {exc}",
                         file=sys.stderr,
                     )
-                    results = self._fts_then_substring(table, query_norm, prefilter, limit)
-                else:
-                    if not results:
-                        results = self._fts_then_substring(table, query_norm, prefilter, limit)
+            if results:
+                results.sort(key=lambda r: r.score, reverse=True)
             else:
-                results = self._fts_then_substring(table, query_norm, prefilter, limit)
+                results = self._relative_threshold(
+                    self._fts_then_substring(table, query_norm, prefilter, limit, columns)
+                )
         except Exception as exc:  # pragma: no cover - defensive logging
             print(f"Search error: {exc}", file=sys.stderr)
             return []
 
+        return [r.to_dict() for r in results[:limit]]
+
+    def _relative_threshold(self, results: list[SearchHit]) -> list[SearchHit]:
+        """Sort by score and keep hits scoring at least threshold x the top score."""
         if not results:
             return []
 
@@ -100,54 +238,175 @@ class SearchService:
         top_score = results[0].score
 
         if top_score <= 0:
-            return [r.to_dict() for r in results[:limit]]
+            return results
 
-        filtered = [r for r in results if r.score / top_score >= self.search_threshold]
-        return [r.to_dict() for r in filtered[:limit]]
+        return [r for r in results if r.score / top_score >= self.search_threshold]
 
     # --- strategies ---
-    def _vector_search(
-        self, table, vec: list[float], prefilter: str, limit: int
-    ) -> list[SearchHit]:
-        op = table.search(vec)
+    @staticmethod
+    def _prepare(op, prefilter: str, columns: list[str] | None, score_column: str | None = None):
         if prefilter:
             op = op.where(prefilter)
-        rows = op.limit(limit).to_list()
-        return [self._to_hit(row, "vector") for row in rows]
+        if columns:
+            if score_column:
+                columns = [*columns, score_column]
+            op = op.select(columns)
+        return op
 
-    def _fts_search(self, table, query: str, prefilter: str, limit: int) -> list[SearchHit]:
-        op = table.search(query, query_type="fts")
-        if prefilter:
-            op = op.where(prefilter)
+    def _hybrid_search(
+        self,
+        table,
+        query: str,
+        prefilter: str,
+        limit: int,
+        columns: list[str] | None,
+        query_vector: list[float] | None = None,
+    ) -> list[SearchHit]:
+        """Run FTS alongside embedding + vector search and fuse both rankings.
+
+        The threshold is applied to each source on its own scale before fusion
+        (RRF scores only encode list positions): FTS hits relative to the best
+        FTS score, vector hits by absolute cosine similarity. Fused hits report
+        their cosine similarity (or FTS score for text-only hits) as ``_score``.
+        """
+        depth = limit * HYBRID_CANDIDATE_FACTOR
+        fts_future = _search_pool().submit(
+            self._fts_then_substring, table, query, prefilter, depth, columns
+        )
+
+        vector_hits: list[SearchHit] = []
+        vec = query_vector if query_vector is not None else self._embed(query)
+        if vec:
+            try:
+                vector_hits = self._vector_search(table, vec, prefilter, depth, columns)
+            except Exception as exc:
+                print(f"Vector search failed, using FTS only: {exc}", file=sys.stderr)
+
+        text_hits = self._relative_threshold(fts_future.result())
+        if not vector_hits:
+            return text_hits
+        return self._fuse([vector_hits, text_hits])
+
+    def _vector_search(
+        self,
+        table,
+        vec: list[float],
+        prefilter: str,
+        limit: int,
+        columns: list[str] | None,
+        *,
+        threshold: bool = True,
+    ) -> list[SearchHit]:
+        """Nearest rows scored by cosine similarity.
+
+        With ``threshold``, rows less similar than search_threshold are dropped.
+        """
+        op = table.search(vec).distance_type("cosine")
+        rows = self._prepare(op, prefilter, columns, "_distance").limit(limit).to_list()
+        hits = [self._to_hit(row, "vector") for row in rows]
+        if not threshold:
+            return hits
+        return [hit for hit in hits if hit.score >= self.search_threshold]
+
+    def _fts_search(
+        self, table, query: str, prefilter: str, limit: int, columns: list[str] | None
+    ) -> list[SearchHit]:
+        op = self._prepare(table.search(query, query_type="fts"), prefilter, columns, "_score")
         rows = op.limit(limit).to_list()
         return [self._to_hit(row, "fts") for row in rows]
 
-    def _substring_search(self, table, query: str, prefilter: str, limit: int) -> list[SearchHit]:
-        op = table.search()
-        if prefilter:
-            op = op.where(prefilter)
+    def _substring_search(
+        self, table, query: str, prefilter: str, limit: int, columns: list[str] | None
+    ) -> list[SearchHit]:
+        if columns:
+            # Matching needs these fields even when the caller projects fewer.
+            columns = list(dict.fromkeys([*columns, *SUBSTRING_FIELDS]))
+        op = self._prepare(table.search(), prefilter, columns)
         rows = op.limit(limit * 3).to_list()
 
         qlow = query.lower()
         hits: list[SearchHit] = []
         for row in rows:
-            if (
-                qlow in str(row.get("id", "")).lower()
-                or qlow in str(row.get("name", "")).lower()
-                or qlow in str(row.get("description", "")).lower()
-            ):
+            if any(qlow in str(row.get(field, "")).lower() for field in SUBSTRING_FIELDS):
                 hits.append(self._to_hit(row, "substring", default_score=0.1))
                 if len(hits) >= limit:
                     break
         return hits
 
+    # --- result cache ---
+    def _cache_get(self, key: Hashable) -> list[dict[str, Any]] | None:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        # Copies so callers can't mutate the cached rows.
+        return [dict(row) for row in results]
+
+    def _cache_put(self, key: Hashable, results: list[dict[str, Any]]) -> None:
+        with self._cache_lock:
+            # Entries for an older index version can never hit again.
+            stale = [k for k in self._cache if k[-1] != key[-1]]
+            for k in stale:
+                del self._cache[k]
+            self._cache[key] = (time.monotonic(), [dict(row) for row in results])
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     # --- helpers ---
-    def _fts_then_substring(self, table, query: str, prefilter: str, limit: int) -> list[SearchHit]:
+    def _embed(self, query: str) -> list[float] | None:
+        with self._cache_lock:
+            vec = self._vectors.get(query)
+            if vec is not None:
+                self._vectors.move_to_end(query)
+                return vec
+        try:
+            vec = self.embed_fn(query)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            print(f"Embedding fetch failed, falling back to FTS: {exc}", file=sys.stderr)
+            return None
+        if vec:
+            with self._cache_lock:
+                self._vectors[query] = vec
+                while len(self._vectors) > QUERY_VECTOR_CACHE_SIZE:
+                    self._vectors.popitem(last=False)
+        return vec
+
+    @staticmethod
+    def _fuse(rankings: list[list[SearchHit]]) -> list[SearchHit]:
+        """Reciprocal rank fusion: score = sum(1 / (RRF_K + rank)) across rankings.
+
+        Each fused hit keeps the source score from the first ranking it appears in
+        as its relevance.
+        """
+        fused: dict[Any, SearchHit] = {}
+        for ranking in rankings:
+            ordered = sorted(ranking, key=lambda h: h.score, reverse=True)
+            for rank, hit in enumerate(ordered, start=1):
+                key = hit.row.get("id", id(hit.row))
+                contribution = 1.0 / (RRF_K + rank)
+                existing = fused.get(key)
+                if existing is None:
+                    fused[key] = SearchHit(
+                        row=hit.row, score=contribution, source=hit.source, relevance=hit.score
+                    )
+                else:
+                    existing.score += contribution
+                    existing.source = "hybrid"
+        return list(fused.values())
+
+    def _fts_then_substring(
+        self, table, query: str, prefilter: str, limit: int, columns: list[str] | None
+    ) -> list[SearchHit]:
         try:
-            return self._fts_search(table, query, prefilter, limit)
+            return self._fts_search(table, query, prefilter, limit, columns)
         except Exception as exc:
             print(f"FTS search failed, using substring fallback: {exc}", file=sys.stderr)
-            return self._substring_search(table, query, prefilter, limit)
+            return self._substring_search(table, query, prefilter, limit, columns)
 
     def _to_hit(
         self, row: dict[str, Any], source: str, default_score: float | None = None
@@ -6,6 +6,20 @@ from pathlib import Path
 from typing import Any
 
 from skillport.shared.config import Config
+from skillport.shared.scan import SkillScan, scan_skills
+
+from .providers import get_provider
+
+
+def embedding_signature(config: Config) -> dict[str, Any]:
+    """Provider/model pair (plus any provider extras) recorded in index state.
+
+    A change forces a rebuild.
+    """
+    provider = get_provider(config)
+    if provider is None:
+        return {"embedding_provider": "none", "embedding_model": None}
+    return provider.signature()
 
 
 class IndexStateStore:
@@ -17,30 +31,50 @@ class IndexStateStore:
         self.state_path = state_path
 
     # --- hashing ---
-    def _hash_skills_dir(self) -> dict[str, Any]:
+    def _hash_skills_dir(
+        self, previous_files: dict[str, Any] | None = None, scan: SkillScan | None = None
+    ) -> dict[str, Any]:
+        """Fingerprint every SKILL.md in ``scan`` (a fresh scan when None).
+
+        Files whose (mtime_ns, size, inode) match the previous manifest reuse the
+        stored digest, so an unchanged tree costs one stat per skill and no reads.
+        """
         skills_dir = self.config.skills_dir
         entries: list[str] = []
+        files: dict[str, dict[str, Any]] = {}
+        previous_files = previous_files or {}
 
         if not skills_dir.exists():
-            return {"hash": "", "count": 0}
-
-        for pattern in ("*/SKILL.md", "*/*/SKILL.md"):
-            for skill_md in skills_dir.glob(pattern):
-                try:
-                    st = skill_md.stat()
-                except FileNotFoundError:
-                    continue
+            return {"hash": "", "count": 0, "files": files}
+
+        for skill in scan if scan is not None else scan_skills(skills_dir):
+            rel = skill.rel_skill_md
+            prev = previous_files.get(rel)
+            if (
+                isinstance(prev, dict)
+                and prev.get("mtime_ns") == skill.mtime_ns
+                and prev.get("size") == skill.size
+                and prev.get("inode") == skill.inode
+                and prev.get("digest", "err") != "err"
+            ):
+                body_digest = prev["digest"]
+            else:
                 try:
-                    body_digest = hashlib.sha1(skill_md.read_bytes()).hexdigest()
+                    body_digest = hashlib.sha1(skill.skill_md.read_bytes()).hexdigest()
                 except Exception:
                     body_digest = "err"
-                rel = skill_md.relative_to(skills_dir)
-                entries.append(f"{rel.as_posix()}:{st.st_mtime_ns}:{st.st_size}:{body_digest}")
+            entries.append(f"{rel}:{skill.mtime_ns}:{skill.size}:{body_digest}")
+            files[rel] = {
+                "mtime_ns": skill.mtime_ns,
+                "size": skill.size,
+                "inode": skill.inode,
+                "digest": body_digest,
+            }
 
         entries.sort()
         joined = "|".join(entries)
         digest = hashlib.sha256(joined.encode("utf-8")).hexdigest()
-        return {"hash": f"sha256:{digest}", "count": len(entries)}
+        return {"hash": f"sha256:{digest}", "count": len(entries), "files": files}
 
     # --- IO helpers ---
     def _load_state(self) -> dict[str, Any] | None:
@@ -62,14 +96,56 @@ class IndexStateStore:
             print(f"Failed to write index state: {exc}", file=sys.stderr)
 
     # --- public ---
-    def build_current_state(self, embedding_signature: dict[str, Any]) -> dict[str, Any]:
-        current = self._hash_skills_dir()
+    def build_current_state(
+        self,
+        embedding_signature: dict[str, Any],
+        previous: dict[str, Any] | None = None,
+        scan: SkillScan | None = None,
+    ) -> dict[str, Any]:
+        previous_files = None
+        if previous and previous.get("skills_dir") == str(self.config.skills_dir):
+            previous_files = previous.get("skills")
+        current = self._hash_skills_dir(
+            previous_files if isinstance(previous_files, dict) else None, scan
+        )
         return {
             "schema_version": self.schema_version,
             **embedding_signature,
             "skills_hash": current["hash"],
             "skill_count": current["count"],
+            "skills": current["files"],
+        }
+
+    def diff_skills(
+        self, previous: dict[str, Any] | None, current: dict[str, Any]
+    ) -> tuple[set[str], set[str]] | None:
+        """Return (changed_ids, removed_ids) between two states.
+
+        Returns None when the previous state carries no per-skill fingerprints
+        (or was built for another skills_dir), meaning a full rebuild is required.
+        """
+        if not previous or not isinstance(previous.get("skills"), dict):
+            return None
+        if previous.get("skills_dir") != str(self.config.skills_dir):
+            return None
+
+        before: dict[str, Any] = previous["skills"]
+        after: dict[str, Any] = current.get("skills", {})
+
+        def _skill_id(rel: str) -> str:
+            return rel.rsplit("/", 1)[0]
+
+        def _digest(entry: Any) -> str | None:
+            return entry.get("digest") if isinstance(entry, dict) else None
+
+        # Only content matters: a touched-but-identical file needs no reindex.
+        changed = {
+            _skill_id(rel)
+            for rel, fingerprint in after.items()
+            if _digest(before.get(rel)) != _digest(fingerprint) or _digest(fingerprint) == "err"
         }
+        removed = {_skill_id(rel) for rel in before if rel not in after}
+        return changed, removed - changed
 
     def should_reindex(
         self,
@@ -78,30 +154,39 @@ class IndexStateStore:
         force: bool = False,
         skip_auto: bool = False,
     ):
-        current_state = self.build_current_state(embedding_signature)
+        """Compare the current tree with the stored state.
+
+        The returned ``scan`` is the snapshot ``state`` was computed from; pass it
+        to initialize_index so a rebuild does not walk skills_dir again.
+        """
+        prev = self._load_state()
+        scan = scan_skills(self.config.skills_dir)
+        current_state = self.build_current_state(embedding_signature, prev, scan)
 
         if force:
             return {
                 "need": True,
                 "reason": "force",
                 "state": current_state,
-                "previous": self._load_state(),
+                "previous": prev,
+                "scan": scan,
             }
         if skip_auto:
             return {
                 "need": False,
                 "reason": "skip_auto",
                 "state": current_state,
-                "previous": self._load_state(),
+                "previous": prev,
+                "scan": scan,
             }
 
-        prev = self._load_state()
         if not prev:
             return {
                 "need": True,
                 "reason": "no_state",
                 "state": current_state,
                 "previous": prev,
+                "scan": scan,
             }
 
         if prev.get("schema_version") != self.schema_version:
@@ -110,6 +195,7 @@ class IndexStateStore:
                 "reason": "schema_changed",
                 "state": current_state,
                 "previous": prev,
+                "scan": scan,
             }
         if prev.get("embedding_provider") != embedding_signature.get("embedding_provider"):
             return {
@@ -117,6 +203,7 @@ class IndexStateStore:
                 "reason": "provider_changed",
                 "state": current_state,
                 "previous": prev,
+                "scan": scan,
             }
         if prev.get("embedding_model") != embedding_signature.get("embedding_model"):
             return {
@@ -124,6 +211,15 @@ class IndexStateStore:
                 "reason": "model_changed",
                 "state": current_state,
                 "previous": prev,
+                "scan": scan,
+            }
+        if any(prev.get(key) != value for key, value in embedding_signature.items()):
+            return {
+                "need": True,
+                "reason": "embedding_changed",
+                "state": current_state,
+                "previous": prev,
+                "scan": scan,
             }
         if prev.get("skills_hash") != current_state["skills_hash"]:
             return {
@@ -131,6 +227,7 @@ class IndexStateStore:
                 "reason": "hash_changed",
                 "state": current_state,
                 "previous": prev,
+                "scan": scan,
             }
 
         return {
@@ -138,6 +235,7 @@ class IndexStateStore:
             "reason": "unchanged",
             "state": current_state,
             "previous": prev,
+            "scan": scan,
         }
 
     def persist(self, state: dict[str, Any], *, skills_dir: Path, db_path: Path) -> None:
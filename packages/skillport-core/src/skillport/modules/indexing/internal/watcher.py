@@ -0,0 +1,133 @@
+"""Background filesystem watcher that keeps the index in sync with skills_dir.
+
+Uses `watchfiles` (inotify/FSEvents/ReadDirectoryChangesW) when installed and
+falls back to polling SKILL.md stat fingerprints otherwise. Bursts of changes
+are debounced into a single refresh callback, run on the watcher thread.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from skillport.shared.scan import is_scannable, scan_skills
+
+# skills_dir/<ns>/<skill>/SKILL.md is the deepest path that affects the index.
+MAX_RELEVANT_DEPTH = 3
+
+
+def _is_relevant(path: str, skills_dir: Path) -> bool:
+    try:
+        parts = Path(path).relative_to(skills_dir).parts
+    except ValueError:
+        return False
+    if not parts or len(parts) > MAX_RELEVANT_DEPTH:
+        return False
+    return all(is_scannable(p) for p in parts)
+
+
+def _stat_signature(skills_dir: Path) -> frozenset[tuple[str, int, int]]:
+    """Cheap snapshot of SKILL.md files for the polling fallback."""
+    return frozenset(
+        (skill.skill_md.as_posix(), skill.mtime_ns, skill.size) for skill in scan_skills(skills_dir)
+    )
+
+
+class IndexWatcher:
+    """Debounced skills_dir watcher running `on_change` in a daemon thread."""
+
+    def __init__(
+        self,
+        skills_dir: Path,
+        on_change: Callable[[], Any],
+        *,
+        debounce_seconds: float = 1.0,
+        poll_interval: float = 2.0,
+        use_polling: bool | None = None,
+    ):
+        self.skills_dir = skills_dir
+        self.on_change = on_change
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        if use_polling is None:
+            use_polling = not self._watchfiles_available() or not skills_dir.exists()
+        self.use_polling = use_polling
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._baseline: frozenset[tuple[str, int, int]] = frozenset()
+
+    @staticmethod
+    def _watchfiles_available() -> bool:
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @property
+    def mode(self) -> str:
+        return "polling" if self.use_polling else "native"
+
+    # --- lifecycle ---
+    def start(self) -> IndexWatcher:
+        if self._thread is not None:
+            return self
+        if self.use_polling:
+            # Snapshot before returning so edits made right after start() are seen.
+            self._baseline = _stat_signature(self.skills_dir)
+        target = self._run_polling if self.use_polling else self._run_native
+        self._thread = threading.Thread(target=target, name="skillport-index-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # --- loops ---
+    def _refresh(self) -> None:
+        try:
+            self.on_change()
+        except Exception as exc:  # keep watching after a failed refresh
+            print(f"[WARN] Index refresh failed: {exc}", file=sys.stderr)
+
+    def _run_native(self) -> None:
+        from watchfiles import watch
+
+        skills_dir = self.skills_dir
+        for changes in watch(
+            skills_dir,
+            watch_filter=lambda _change, path: _is_relevant(path, skills_dir),
+            debounce=int(self.debounce_seconds * 1000),
+            stop_event=self._stop,
+            yield_on_timeout=False,
+        ):
+            if self._stop.is_set():
+                return
+            if changes:
+                self._refresh()
+
+    def _run_polling(self) -> None:
+        last = self._baseline
+        while not self._stop.wait(self.poll_interval):
+            current = _stat_signature(self.skills_dir)
+            if current == last:
+                continue
+            # Debounce: wait until the tree has been quiet for debounce_seconds.
+            while not self._stop.wait(self.debounce_seconds):
+                settled = _stat_signature(self.skills_dir)
+                if settled == current:
+                    break
+                current = settled
+            if self._stop.is_set():
+                return
+            last = current
+            self._refresh()
+
+
+__all__ = ["IndexWatcher"]
@@ -1,13 +1,17 @@
 from .index import build_index, should_reindex
-from .query import get_by_id, list_all, search
+from .query import count, count_matches, get_by_id, list_all, search
 from .types import IndexBuildResult, ReindexDecision
+from .watch import watch_index
 
 __all__ = [
     "build_index",
     "should_reindex",
+    "watch_index",
     "search",
     "get_by_id",
     "list_all",
+    "count",
+    "count_matches",
     "IndexBuildResult",
     "ReindexDecision",
 ]
@@ -5,7 +5,7 @@ import sys
 from skillport.modules.skills.internal import prune_orphan_origins
 from skillport.shared.config import Config
 
-from ..internal.lancedb import IndexStore
+from .query import _store
 from .types import IndexBuildResult, ReindexDecision
 
 
@@ -18,27 +18,28 @@ def build_index(*, config: Config, force: bool = False) -> IndexBuildResult:
             file=sys.stderr,
         )
 
-    store = IndexStore(config)
+    store = _store(config)
     decision = store.should_reindex(force=force, skip_auto=False)
 
     if not decision["need"]:
         # No reindex needed, return current state
-        table = store.list_all(limit=1_000_000)
-        count = len(table)
-        return IndexBuildResult(success=True, skill_count=count, message=decision["reason"])
+        return IndexBuildResult(success=True, skill_count=store.count(), message=decision["reason"])
 
     try:
-        store.initialize_index()
+        updated = decision["reason"] == "hash_changed" and store.update_index(
+            decision["previous"], decision["state"]
+        )
+        if not updated:
+            store.initialize_index(decision.get("scan"))
         store.persist_state(decision["state"])
-        table = store.list_all(limit=1_000_000)
-        count = len(table)
-        return IndexBuildResult(success=True, skill_count=count, message=decision["reason"])
+        # count() runs count_rows with the prefilter; rows are never materialized.
+        return IndexBuildResult(success=True, skill_count=store.count(), message=decision["reason"])
     except Exception as exc:
         return IndexBuildResult(success=False, skill_count=0, message=str(exc))
 
 
 def should_reindex(*, config: Config) -> ReindexDecision:
-    store = IndexStore(config)
+    store = _store(config)
     decision = store.should_reindex()
     return ReindexDecision(
         need=bool(decision["need"]), reason=decision["reason"], state=decision["state"]
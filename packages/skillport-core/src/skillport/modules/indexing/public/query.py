@@ -1,23 +1,132 @@
 """Query-facing public APIs."""
 
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any
+
 from skillport.shared.config import Config
 
-from ..internal.lancedb import IndexStore
+from ..internal.models import View
+
+# Process-wide stores: one LanceDB connection + table handle (or one in-memory
+# index) per distinct config, reused across calls (e.g. every MCP tool invocation).
+# Least recently used stores beyond STORE_CACHE_SIZE are closed and dropped.
+STORE_CACHE_SIZE = 8
+_STORES: OrderedDict[tuple[Any, str], Any] = OrderedDict()
+_STORES_LOCK = threading.Lock()
+
+
+def __getattr__(name: str):
+    # IndexStore is resolved lazily so the memory backend never imports lancedb.
+    if name == "IndexStore":
+        from ..internal.lancedb import IndexStore
+
+        globals()["IndexStore"] = IndexStore
+        return IndexStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _store_class(config: Config) -> type:
+    if config.index_backend == "memory":
+        from ..internal.memory import MemoryIndexStore
+
+        return MemoryIndexStore
+    return globals().get("IndexStore") or __getattr__("IndexStore")
+
+
+def _store(config: Config):
+    """Return the long-lived index store for this config, creating it once."""
+    store_cls = _store_class(config)
+    key = (store_cls, config.model_dump_json())
+    evicted = []
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = store_cls(config)
+            _STORES[key] = store
+            while len(_STORES) > STORE_CACHE_SIZE:
+                evicted.append(_STORES.popitem(last=False)[1])
+        else:
+            _STORES.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return store
+
+
+def search(
+    query: str,
+    *,
+    limit: int,
+    config: Config,
+    view: View = "summary",
+    query_vector: list[float] | None = None,
+) -> list[dict]:
+    """Search the index. Rows use the summary view (no instructions or vectors).
+
+    ``query_vector`` is the query embedding when the caller computed it already
+    (see aembed_query); otherwise the search embeds the query itself.
+    """
+    store = _store(config)
+    return store.search(query, limit=limit, view=view, query_vector=query_vector)
+
+
+async def aembed_query(query: str, *, config: Config) -> list[float] | None:
+    """Embed ``query`` with the provider's async client, for search(query_vector=...).
+
+    Lets async callers (the MCP server) keep slow network embedding calls off their
+    worker threads. Returns None without a remote provider (local providers embed
+    in-process during search) or on failure, which is logged; search() then embeds
+    the query itself.
+    """
+    if config.embedding_provider == "none":
+        return None
+    if not query.strip() or query.strip() == "*":
+        return None
+
+    from ..internal.embeddings import aget_embedding
+    from ..internal.providers import get_provider
+
+    try:
+        if get_provider(config).local:
+            return None
+        return await aget_embedding(" ".join(query.strip().split()), config)
+    except Exception as exc:
+        print(f"Query embedding failed: {exc}", file=sys.stderr)
+        return None
 
 
-def search(query: str, *, limit: int, config: Config) -> list[dict]:
-    store = IndexStore(config)
-    return store.search(query, limit=limit)
+def get_by_id(skill_id: str, *, config: Config, view: View = "detail") -> dict | None:
+    """Fetch one skill by id (or unique name). The detail view includes instructions."""
+    store = _store(config)
+    return store.get_by_id(skill_id, view=view)
 
 
-def get_by_id(skill_id: str, *, config: Config) -> dict | None:
-    store = IndexStore(config)
-    return store.get_by_id(skill_id)
+def get_many(skill_ids: list[str], *, config: Config, view: View = "detail") -> dict[str, dict]:
+    """Fetch several skills at once, keyed by requested id; unknown ids are omitted."""
+    store = _store(config)
+    return store.get_many(skill_ids, view=view)
 
 
-def list_all(*, limit: int, config: Config) -> list[dict]:
-    store = IndexStore(config)
-    return store.list_all(limit=limit)
+def list_all(*, limit: int, config: Config, view: View = "summary") -> list[dict]:
+    store = _store(config)
+    return store.list_all(limit=limit, view=view)
+
+
+def count(*, config: Config) -> int:
+    """Count enabled skills in the index without fetching rows."""
+    store = _store(config)
+    return store.count()
+
+
+def count_matches(query: str, *, config: Config, query_vector: list[float] | None = None) -> int:
+    """Count the skills search() would return for ``query`` if it were not limited.
+
+    The same strategy and thresholds run at full depth, fetching ids only, so the
+    count agrees with search() results. ``query_vector`` is as for search().
+    """
+    store = _store(config)
+    return store.count_matches(query, query_vector=query_vector)
 
 
 def get_core_skills(*, config: Config) -> list[dict]:
@@ -34,7 +143,7 @@ def get_core_skills(*, config: Config) -> list[dict]:
     if config.core_skills_mode == "explicit":
         if not config.core_skills:
             return []
-        store = IndexStore(config)
+        store = _store(config)
         results = []
         for skill_id in config.core_skills:
             skill = store.get_by_id(skill_id)
@@ -43,5 +152,5 @@ def get_core_skills(*, config: Config) -> list[dict]:
         return results
 
     # mode == "auto" (default)
-    store = IndexStore(config)
+    store = _store(config)
     return store.get_core_skills()
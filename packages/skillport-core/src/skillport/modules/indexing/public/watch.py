@@ -0,0 +1,30 @@
+"""Live index refresh for long-running processes (e.g. the MCP server)."""
+
+import sys
+
+from skillport.shared.config import Config
+
+from ..internal.watcher import IndexWatcher
+from .index import build_index
+
+
+def watch_index(*, config: Config, debounce_seconds: float = 1.0) -> IndexWatcher:
+    """Start a background watcher that reindexes skills_dir changes incrementally.
+
+    Refreshes go through build_index, so only changed skills are re-embedded and
+    queries pick up the new table version on their next call. Call ``stop()`` on
+    the returned watcher to end it.
+    """
+
+    def _refresh() -> None:
+        result = build_index(config=config)
+        if not result.success:
+            print(f"[WARN] Index refresh failed: {result.message}", file=sys.stderr)
+        elif result.message != "unchanged":
+            print(
+                f"[INFO] Index refreshed (reason={result.message}, skills={result.skill_count})",
+                file=sys.stderr,
+            )
+
+    watcher = IndexWatcher(config.skills_dir, _refresh, debounce_seconds=debounce_seconds)
+    return watcher.start()
@@ -5,6 +5,7 @@ from __future__ import annotations
 _EXPORTS = {
     "search_skills",
     "load_skill",
+    "load_skills",
     "add_skill",
     "remove_skill",
     "list_skills",
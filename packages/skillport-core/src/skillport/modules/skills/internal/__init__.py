@@ -1,5 +1,7 @@
 """Internal implementations for the skills module."""
 
+from .catalog_snapshot import CatalogEntry, extract_skill_meta, load_catalog, snapshot_path_for
+from .file_cache import FileCache, content_etag, etag_matches, file_cache
 from .github import (
     GitHubFetchResult,
     ParsedGitHubURL,
@@ -82,4 +84,12 @@ __all__ = [
     "get_missing_skill_ids",
     "ZipExtractResult",
     "extract_zip",
+    "CatalogEntry",
+    "load_catalog",
+    "snapshot_path_for",
+    "extract_skill_meta",
+    "FileCache",
+    "file_cache",
+    "content_etag",
+    "etag_matches",
 ]
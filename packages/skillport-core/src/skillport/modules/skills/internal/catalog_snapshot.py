@@ -0,0 +1,190 @@
+"""Persistent snapshot of the filesystem catalog (no index dependency).
+
+The snapshot holds one row per skill (id, name, description, category, tags,
+alwaysApply) together with the stat fingerprint of its SKILL.md. Each read
+rescans skills_dir (one stat per skill, see shared/scan.py), reuses rows whose
+fingerprint is unchanged and reparses only the rest, so repeated CLI calls do
+not reparse the catalog. The snapshot is kept in memory and, when a path is
+given, as JSON lines under meta_dir:
+
+    {"format": 1, "skills_dir": "/abs/skills"}
+    {"id": "pdf", "path": "...", "mtime_ns": ..., "size": ..., "name": ..., ...}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from skillport.shared.filters import normalize_token
+from skillport.shared.frontmatter import read_frontmatter
+from skillport.shared.scan import ScannedSkill, scan_skills
+
+_SNAPSHOT_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Catalog row for one skill plus the SKILL.md fingerprint it was parsed from."""
+
+    id: str
+    path: str
+    mtime_ns: int
+    size: int
+    name: str
+    description: str
+    category: str
+    tags: tuple[str, ...]
+    always_apply: bool
+
+    def matches(self, skill: ScannedSkill) -> bool:
+        return (self.path, self.mtime_ns, self.size) == (
+            str(skill.path),
+            skill.mtime_ns,
+            skill.size,
+        )
+
+
+# In-process snapshots, keyed by snapshot file (or skills_dir when not persisted).
+_memo: dict[str, dict[str, CatalogEntry]] = {}
+_memo_lock = threading.Lock()
+
+
+def extract_skill_meta(meta: dict, fallback_name: str) -> tuple[str, str, str, list[str], dict]:
+    """(name, description, normalized category, normalized tags, meta) from frontmatter."""
+    metadata_block = meta.get("metadata", {})
+    if not isinstance(metadata_block, dict):
+        metadata_block = {}
+
+    skillport_meta = metadata_block.get("skillport", {})
+    if not isinstance(skillport_meta, dict):
+        skillport_meta = {}
+
+    name = meta.get("name") or fallback_name
+    description = meta.get("description") or ""
+    category = skillport_meta.get("category", "")
+    tags = skillport_meta.get("tags", [])
+
+    category_norm = normalize_token(category) if category else ""
+    tags_norm: list[str] = []
+    if isinstance(tags, list):
+        tags_norm = [normalize_token(t) for t in tags]
+    elif isinstance(tags, str):
+        tags_norm = [normalize_token(tags)]
+
+    return name, description, category_norm, tags_norm, meta
+
+
+def _parse_entry(skill: ScannedSkill) -> CatalogEntry:
+    meta = read_frontmatter(skill.skill_md).meta
+    name, description, category, tags, _ = extract_skill_meta(meta, skill.path.name)
+    metadata_block = meta.get("metadata")
+    skillport_meta = metadata_block.get("skillport") if isinstance(metadata_block, dict) else None
+    always_apply = isinstance(skillport_meta, dict) and (
+        skillport_meta.get("alwaysApply", skillport_meta.get("always_apply")) is True
+    )
+    return CatalogEntry(
+        id=skill.id,
+        path=str(skill.path),
+        mtime_ns=skill.mtime_ns,
+        size=skill.size,
+        name=str(name),
+        description=str(description),
+        category=category,
+        tags=tuple(tags),
+        always_apply=always_apply,
+    )
+
+
+def snapshot_path_for(meta_dir: Path, skills_dir: Path) -> Path:
+    """Snapshot file for ``skills_dir`` (one per skills_dir, so a shared meta_dir is fine)."""
+    digest = hashlib.sha1(str(skills_dir.resolve()).encode("utf-8")).hexdigest()[:12]
+    return meta_dir / f"catalog_{digest}.jsonl"
+
+
+def _read_snapshot(path: Path, skills_dir: Path) -> dict[str, CatalogEntry]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header != {"format": _SNAPSHOT_FORMAT, "skills_dir": str(skills_dir)}:
+                return {}
+            entries = {}
+            for line in f:
+                row: dict[str, Any] = json.loads(line)
+                row["tags"] = tuple(row["tags"])
+                entries[row["id"]] = CatalogEntry(**row)
+            return entries
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, KeyError) as exc:
+        print(f"Ignoring catalog snapshot {path}: {exc}", file=sys.stderr)
+        return {}
+
+
+def _write_snapshot(path: Path, skills_dir: Path, entries: list[CatalogEntry]) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"format": _SNAPSHOT_FORMAT, "skills_dir": str(skills_dir)}))
+            f.write("\n")
+            for entry in entries:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False))
+                f.write("\n")
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"Failed to write catalog snapshot {path}: {exc}", file=sys.stderr)
+        tmp.unlink(missing_ok=True)
+
+
+def load_catalog(skills_dir: Path, snapshot_path: Path | None = None) -> list[CatalogEntry]:
+    """Every skill under ``skills_dir`` (sorted by id), refreshed against the filesystem.
+
+    Rows whose SKILL.md fingerprint is unchanged are reused from the in-memory
+    snapshot, or from ``snapshot_path`` on first use in this process; only new
+    or modified skills are parsed. The file is rewritten when anything changed.
+    """
+    key = str(snapshot_path or skills_dir)
+    with _memo_lock:
+        previous = _memo.get(key)
+    if previous is None:
+        previous = _read_snapshot(snapshot_path, skills_dir) if snapshot_path else {}
+
+    entries: list[CatalogEntry] = []
+    reparsed = 0
+    for skill in scan_skills(skills_dir):
+        entry = previous.get(skill.id)
+        if entry is None or not entry.matches(skill):
+            try:
+                entry = _parse_entry(skill)
+            except FileNotFoundError:
+                continue
+            reparsed += 1
+        entries.append(entry)
+
+    changed = reparsed > 0 or len(entries) != len(previous)
+    with _memo_lock:
+        _memo[key] = {entry.id: entry for entry in entries}
+    if changed and snapshot_path is not None:
+        _write_snapshot(snapshot_path, skills_dir, entries)
+    return entries
+
+
+def clear_catalog_memo() -> None:
+    with _memo_lock:
+        _memo.clear()
+
+
+__all__ = [
+    "CatalogEntry",
+    "clear_catalog_memo",
+    "extract_skill_meta",
+    "load_catalog",
+    "snapshot_path_for",
+]
@@ -0,0 +1,107 @@
+"""In-memory cache of encoded read_skill_file payloads.
+
+Entries are keyed by a file version, ``(path, mtime_ns, size)``, plus the
+requested range, so editing a file simply stops its old entries from being hit;
+they age out of the LRU. Content hashes (ETags) are memoized per file version
+separately, so large files are hashed once per version even when payloads are
+too big to cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any
+
+# Memoized content hashes (one per file version; each entry is tiny).
+ETAG_ENTRIES = 4096
+# Bytes fed to the hash per update(), so an mmap'd file is hashed page by page.
+ETAG_BLOCK_BYTES = 1 << 20
+
+FileVersion = tuple[str, int, int]
+
+
+def content_etag(data: Any) -> str:
+    """Content hash of a bytes-like object (bytes or mmap), hashed in blocks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with memoryview(data) as view:
+        for start in range(0, len(view), ETAG_BLOCK_BYTES):
+            digest.update(view[start : start + ETAG_BLOCK_BYTES])
+    return digest.hexdigest()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True when ``if_none_match`` names ``etag`` (HTTP-style quotes and W/ accepted)."""
+    if not if_none_match:
+        return False
+    candidates = (tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(","))
+    return any(tag in (etag, "*") for tag in candidates)
+
+
+class FileCache:
+    """LRU of payloads bounded by total payload size, plus an ETag memo."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._payloads: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._etags: OrderedDict[FileVersion, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._payloads.get(key)
+            if entry is None:
+                return None
+            self._payloads.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, weight: int) -> None:
+        """Store ``value``; payloads larger than the whole budget are not cached."""
+        if weight > self.max_bytes:
+            return
+        with self._lock:
+            old = self._payloads.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._payloads[key] = (value, weight)
+            self._bytes += weight
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._payloads.popitem(last=False)
+                self._bytes -= evicted
+
+    def get_etag(self, version: FileVersion) -> str | None:
+        with self._lock:
+            etag = self._etags.get(version)
+            if etag is not None:
+                self._etags.move_to_end(version)
+            return etag
+
+    def put_etag(self, version: FileVersion, etag: str) -> None:
+        with self._lock:
+            self._etags[version] = etag
+            self._etags.move_to_end(version)
+            while len(self._etags) > ETAG_ENTRIES:
+                self._etags.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+            self._etags.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+@lru_cache(maxsize=4)
+def file_cache(max_bytes: int) -> FileCache:
+    """Process-wide cache for a given budget (one per distinct config value)."""
+    return FileCache(max_bytes)
+
+
+__all__ = ["FileCache", "content_etag", "etag_matches", "file_cache"]
@@ -12,7 +12,7 @@ import yaml
 from skillport.modules.skills.public.types import AddResult, RemoveResult
 from skillport.shared.config import Config
 from skillport.shared.types import SourceType
-from skillport.shared.utils import parse_frontmatter, resolve_inside
+from skillport.shared.utils import parse_frontmatter, read_frontmatter, resolve_inside
 
 from .validation import validate_skill_record
 
@@ -125,7 +125,7 @@ def _load_skill_info(skill_dir: Path) -> SkillInfo:
     skill_md = skill_dir / "SKILL.md"
     if not skill_md.exists():
         raise FileNotFoundError(f"SKILL.md not found in {skill_dir}")
-    meta, _ = parse_frontmatter(skill_md)
+    meta = read_frontmatter(skill_md).meta
     if not isinstance(meta, dict):
         raise ValueError(f"Invalid SKILL.md in {skill_dir}: frontmatter must be a mapping")
     name = meta.get("name") or ""
@@ -12,37 +12,19 @@ from __future__ import annotations
 from pathlib import Path
 
 from skillport.shared.config import Config
+from skillport.shared.scan import scan_skills
 
 from .origin import get_all_origins
 
-# Directories to exclude from scanning (in addition to hidden directories)
-SCAN_EXCLUDE_NAMES = {"__pycache__", "node_modules"}
-
 
 def _scan_installed_skill_ids(skills_dir: Path) -> set[str]:
     """Scan skills_dir and return installed skill IDs (FS-based, index-independent).
 
     Skill ID is the relative path from skills_dir (e.g., "my-skill", "ns/my-skill").
     Hidden directories (.git, .venv, etc.) and heavy directories (node_modules, etc.)
-    are skipped.
+    are skipped, and nothing deeper than ``<ns>/<skill>`` is walked.
     """
-    if not skills_dir.exists():
-        return set()
-
-    result: set[str] = set()
-    for skill_md in skills_dir.rglob("SKILL.md"):
-        skill_dir = skill_md.parent
-        rel_parts = skill_dir.relative_to(skills_dir).parts
-
-        # Skip hidden directories and excluded directories
-        if any(part.startswith(".") or part in SCAN_EXCLUDE_NAMES for part in rel_parts):
-            continue
-
-        # Normalize path separator to "/" for cross-platform consistency
-        skill_id = "/".join(rel_parts)
-        result.add(skill_id)
-
-    return result
+    return scan_skills(skills_dir).ids
 
 
 def scan_installed_skill_ids(*, config: Config) -> set[str]:
@@ -7,7 +7,7 @@ import unicodedata
 from pathlib import Path
 
 from skillport.shared.types import ValidationIssue
-from skillport.shared.utils import parse_frontmatter
+from skillport.shared.utils import read_frontmatter
 
 SKILL_LINE_THRESHOLD = 500
 NAME_MAX_LENGTH = 64
@@ -80,7 +80,7 @@ def validate_skill_record(
     Args:
         skill: Skill data dict (name, description, lines, path).
         strict: If True, return only fatal issues. Used by add command.
-        meta: Raw frontmatter dict from parse_frontmatter(). If provided,
+        meta: Raw frontmatter dict from read_frontmatter(). If provided,
               enables key existence checks (A1/A2). Used by add command.
 
     Returns:
@@ -241,7 +241,7 @@ def validate_skill_record(
         skill_md = Path(path) / "SKILL.md"
         if skill_md.exists():
             try:
-                parsed_meta, _ = parse_frontmatter(skill_md)
+                parsed_meta = read_frontmatter(skill_md).meta
                 if isinstance(parsed_meta, dict):
                     # Unexpected keys → fatal (per Agent Skills spec)
                     unexpected_keys = set(parsed_meta.keys()) - ALLOWED_FRONTMATTER_KEYS
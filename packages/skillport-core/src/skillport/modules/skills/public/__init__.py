@@ -3,6 +3,7 @@ from __future__ import annotations
 _EXPORTS = {
     "search_skills",
     "load_skill",
+    "load_skills",
     "add_skill",
     "remove_skill",
     "list_skills",
@@ -35,6 +36,8 @@ def __getattr__(name: str):
         from .list import list_skills as value
     elif name == "load_skill":
         from .load import load_skill as value
+    elif name == "load_skills":
+        from .load import load_skills as value
     elif name == "read_skill_file":
         from .read import read_skill_file as value
     elif name == "remove_skill":
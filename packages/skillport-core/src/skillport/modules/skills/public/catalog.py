@@ -0,0 +1,160 @@
+"""Filesystem-based skill catalog (no index dependency).
+
+Used by CLI SkillOps and by the MCP server while its index is still building.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from skillport.modules.skills.internal.catalog_snapshot import (
+    CatalogEntry,
+    extract_skill_meta,
+    load_catalog,
+    snapshot_path_for,
+)
+from skillport.modules.skills.public.types import (
+    ListResult,
+    SearchResult,
+    SkillDetail,
+    SkillSummary,
+)
+from skillport.shared.config import Config
+from skillport.shared.exceptions import SkillNotFoundError
+from skillport.shared.filters import is_skill_enabled, normalize_token
+from skillport.shared.scan import MAX_SKILL_DEPTH, scan_skills
+from skillport.shared.utils import parse_frontmatter, resolve_inside
+
+
+def _iter_skill_dirs(skills_dir: Path) -> Iterable[tuple[str, Path]]:
+    for skill in scan_skills(skills_dir):
+        yield skill.id, skill.path
+
+
+def iter_skill_dirs(skills_dir: Path) -> Iterable[tuple[str, Path]]:
+    """Yield skill IDs and directories discovered on disk (no filtering)."""
+    yield from _iter_skill_dirs(skills_dir)
+
+
+def _catalog(config: Config) -> list[CatalogEntry]:
+    """Enabled skills from the catalog snapshot, sorted by id."""
+    snapshot_path = (
+        snapshot_path_for(config.meta_dir, config.skills_dir) if config.catalog_snapshot else None
+    )
+    return [
+        entry
+        for entry in load_catalog(config.skills_dir, snapshot_path)
+        if is_skill_enabled(entry.id, entry.category, config=config)
+    ]
+
+
+def iter_skill_dirs_filtered(*, config: Config) -> Iterable[tuple[str, Path]]:
+    """Yield skill IDs and directories, applying the same filters as list_skills_fs."""
+    for entry in _catalog(config):
+        yield entry.id, Path(entry.path)
+
+
+def _summary(entry: CatalogEntry, score: float = 0.0) -> SkillSummary:
+    return SkillSummary(
+        id=entry.id,
+        name=entry.name,
+        description=entry.description,
+        category=entry.category,
+        score=score,
+    )
+
+
+def list_skills_fs(*, config: Config, limit: int | None = None) -> ListResult:
+    """List skills from filesystem (no index dependency)."""
+    effective_limit = limit or config.search_limit
+    skills = [_summary(entry) for entry in _catalog(config)[:effective_limit]]
+    return ListResult(skills=skills, total=len(skills))
+
+
+def load_skill_fs(skill_id: str, *, config: Config) -> SkillDetail:
+    """Load a skill from filesystem by ID (no index dependency)."""
+    if len(Path(skill_id).parts) > MAX_SKILL_DEPTH:
+        raise SkillNotFoundError(skill_id)
+    skill_dir = resolve_inside(config.skills_dir, skill_id)
+    skill_md = skill_dir / "SKILL.md"
+    if not skill_md.exists():
+        raise SkillNotFoundError(skill_id)
+
+    meta, body = parse_frontmatter(skill_md)
+    if not isinstance(meta, dict):
+        meta = {}
+
+    name, description, category_norm, tags_norm, metadata = extract_skill_meta(meta, skill_dir.name)
+
+    if not is_skill_enabled(skill_id, category_norm, config=config):
+        raise SkillNotFoundError(skill_id)
+
+    return SkillDetail(
+        id=skill_id,
+        name=name,
+        description=description,
+        category=category_norm,
+        tags=tags_norm,
+        instructions=body,
+        path=str(skill_dir.resolve()),
+        metadata=metadata,
+    )
+
+
+def search_skills_fs(query: str, *, config: Config, limit: int | None = None) -> SearchResult:
+    """Keyword search over the filesystem catalog (no index dependency).
+
+    Scores are the fraction of query words found in id/name/description/category/tags,
+    so results are coarser than index search but need no build step.
+    """
+    effective_limit = limit or config.search_limit
+    stripped = (query or "").strip()
+    terms = normalize_token(stripped).split() if stripped not in ("", "*") else []
+
+    matches: list[SkillSummary] = []
+    for entry in _catalog(config):
+        score = 1.0
+        if terms:
+            haystack = " ".join(
+                [entry.id, entry.name, entry.description, entry.category, *entry.tags]
+            ).lower()
+            score = sum(1 for term in terms if term in haystack) / len(terms)
+            if score == 0:
+                continue
+        matches.append(_summary(entry, score))
+
+    matches.sort(key=lambda s: (-s.score, s.id))
+    return SearchResult(skills=matches[:effective_limit], total=len(matches), query=query)
+
+
+def get_core_skills_fs(*, config: Config) -> list[dict]:
+    """Core skills from the filesystem, honoring core_skills_mode like the index does."""
+    if config.core_skills_mode == "none":
+        return []
+
+    if config.core_skills_mode == "explicit":
+        rows = []
+        for skill_id in config.core_skills:
+            try:
+                detail = load_skill_fs(skill_id, config=config)
+            except SkillNotFoundError:
+                continue
+            rows.append({"id": detail.id, "description": detail.description, "path": detail.path})
+        return rows
+
+    return [
+        {"id": entry.id, "description": entry.description, "path": str(Path(entry.path).absolute())}
+        for entry in _catalog(config)
+        if entry.always_apply
+    ]
+
+
+__all__ = [
+    "get_core_skills_fs",
+    "iter_skill_dirs",
+    "iter_skill_dirs_filtered",
+    "list_skills_fs",
+    "load_skill_fs",
+    "search_skills_fs",
+]
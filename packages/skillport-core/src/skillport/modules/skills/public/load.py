@@ -3,8 +3,9 @@ from __future__ import annotations
 import json
 
 from skillport.modules.indexing.public.query import get_by_id as idx_get_by_id
+from skillport.modules.indexing.public.query import get_many as idx_get_many
 from skillport.shared.config import Config
-from skillport.shared.exceptions import AmbiguousSkillError, SkillNotFoundError
+from skillport.shared.exceptions import AmbiguousSkillError, SkillNotFoundError, SkillPortError
 from skillport.shared.filters import is_skill_enabled, normalize_token
 
 from .types import SkillDetail
@@ -19,7 +20,30 @@ def load_skill(skill_id: str, *, config: Config) -> SkillDetail:
 
     if not record:
         raise SkillNotFoundError(skill_id)
+    return _to_detail(record, skill_id, config=config)
 
+
+def load_skills(skill_ids: list[str], *, config: Config) -> list[SkillDetail | SkillPortError]:
+    """Load several skills with one index lookup; results follow ``skill_ids`` order.
+
+    Each entry is the SkillDetail or the error load_skill would have raised for
+    that id (identifiers the batch lookup cannot resolve fall back to load_skill).
+    """
+    records = idx_get_many(skill_ids, config=config)
+    results: list[SkillDetail | SkillPortError] = []
+    for skill_id in skill_ids:
+        try:
+            record = records.get(skill_id)
+            if record is None:
+                results.append(load_skill(skill_id, config=config))
+            else:
+                results.append(_to_detail(record, skill_id, config=config))
+        except SkillPortError as exc:
+            results.append(exc)
+    return results
+
+
+def _to_detail(record: dict, skill_id: str, *, config: Config) -> SkillDetail:
     identifier = record.get("id", skill_id)
     if not is_skill_enabled(identifier, record.get("category"), config=config):
         raise SkillNotFoundError(identifier)
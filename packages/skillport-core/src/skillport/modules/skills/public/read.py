@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import mimetypes
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from skillport.modules.indexing.public.query import get_by_id as idx_get_by_id
+from skillport.modules.skills.internal import content_etag, etag_matches, file_cache
 from skillport.shared.config import Config
 from skillport.shared.exceptions import SkillNotFoundError
 from skillport.shared.filters import is_skill_enabled
@@ -32,28 +38,59 @@ TEXT_EXTENSIONS = {
     ".css",
 }
 
+# Files at least this large are read through mmap, so a chunk read never loads the
+# whole file.
+MMAP_MIN_BYTES = 1 << 20
 
-def read_skill_file(skill_id: str, file_path: str, *, config: Config) -> FileContent:
-    """Read a file inside a skill directory.
+
+def read_skill_file(
+    skill_id: str,
+    file_path: str,
+    *,
+    config: Config,
+    offset: int = 0,
+    length: int | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    continuation_token: str | None = None,
+    if_none_match: str | None = None,
+) -> FileContent:
+    """Read a file (or part of it) inside a skill directory.
 
     Handles both text and binary files:
     - Text files: Returns content as UTF-8 string with encoding="utf-8"
     - Binary files: Returns content as base64-encoded string with encoding="base64"
 
+    At most ``config.max_file_bytes`` bytes are returned per call. When more of the
+    requested range remains, ``next_token`` is set; pass it back as
+    ``continuation_token`` to read the next chunk.
+
+    Every result carries the file's content hash as ``etag``. When
+    ``if_none_match`` names the current etag, an empty result with
+    ``not_modified=True`` is returned instead of the content. Encoded chunks are
+    cached in memory (``config.file_cache_bytes``) keyed by path, mtime and size.
+
     Args:
         skill_id: Skill identifier from load_skill.
         file_path: Relative path within the skill directory.
         config: Application configuration.
+        offset: First byte to read.
+        length: Bytes to read from ``offset`` (default: to end of file).
+        start_line: First line to read (1-based; overrides offset/length).
+        end_line: Last line to read, inclusive (default: to end of file).
+        continuation_token: ``next_token`` from a previous call (overrides the range).
+        if_none_match: ``etag`` from a previous call; skip the content if unchanged.
 
     Returns:
-        FileContent with content, path, size, encoding, and mime_type.
+        FileContent with content, path, size, encoding, mime_type, etag, and the
+        chunk's offset, length and next_token.
 
     Raises:
         SkillNotFoundError: If skill doesn't exist or is disabled.
         FileNotFoundError: If file doesn't exist within skill directory.
-        ValueError: If file exceeds max_file_bytes limit.
+        ValueError: If the range or continuation token is invalid.
     """
-    record = idx_get_by_id(skill_id, config=config)
+    record = idx_get_by_id(skill_id, config=config, view="summary")
     if not record:
         raise SkillNotFoundError(skill_id)
 
@@ -62,38 +99,193 @@ def read_skill_file(skill_id: str, file_path: str, *, config: Config) -> FileCon
         raise SkillNotFoundError(identifier)
 
     skill_dir = Path(record.get("path", "")).resolve()
+    return read_file_in_skill_dir(
+        skill_dir,
+        file_path,
+        config=config,
+        offset=offset,
+        length=length,
+        start_line=start_line,
+        end_line=end_line,
+        continuation_token=continuation_token,
+        if_none_match=if_none_match,
+    )
+
+
+def read_file_in_skill_dir(
+    skill_dir: Path,
+    file_path: str,
+    *,
+    config: Config,
+    offset: int = 0,
+    length: int | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    continuation_token: str | None = None,
+    if_none_match: str | None = None,
+) -> FileContent:
+    """Read a file inside an already-resolved skill directory (see read_skill_file)."""
     target = resolve_inside(skill_dir, file_path)
     if not target.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    size = target.stat().st_size
-    if size > config.max_file_bytes:
-        raise ValueError(f"File too large: {size} bytes (max: {config.max_file_bytes})")
+    stat = target.stat()
+    size = stat.st_size
 
     # Determine MIME type
     mime_type, _ = mimetypes.guess_type(str(target))
     mime_type = mime_type or "application/octet-stream"
+    looks_text = mime_type.startswith("text/") or target.suffix.lower() in TEXT_EXTENSIONS
+
+    cache = file_cache(config.file_cache_bytes)
+    version = (str(target), stat.st_mtime_ns, size)
+    key = (version, offset, length, start_line, end_line, continuation_token, config.max_file_bytes)
+
+    # Tokens carry the etag of the version they were issued for, so later chunks
+    # never rehash the file.
+    token = _decode_token(continuation_token, target, stat) if continuation_token else None
+    etag = cache.get_etag(version)
+    if etag is None and token is not None:
+        etag = token[2]
+        cache.put_etag(version, etag)
+    if etag is not None and etag_matches(if_none_match, etag):
+        return _not_modified(target, size, mime_type, etag)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
 
-    # Try to read as text first if it looks like a text file
-    if mime_type.startswith("text/") or target.suffix.lower() in TEXT_EXTENSIONS:
+    with _open_view(target, size) as view:
+        if etag is None:
+            etag = content_etag(view)
+            cache.put_etag(version, etag)
+            if etag_matches(if_none_match, etag):
+                return _not_modified(target, size, mime_type, etag)
+
+        if token is not None:
+            start, end, _ = token
+        elif start_line is not None or end_line is not None:
+            start, end = _line_span(view, start_line or 1, end_line)
+        else:
+            if offset < 0 or (length is not None and length < 0):
+                raise ValueError("offset and length must be non-negative")
+            start = min(offset, size)
+            end = size if length is None else min(size, start + length)
+
+        stop = min(end, start + config.max_file_bytes)
+        if looks_text and stop < end:
+            stop = _text_cut(view, start, stop)
+        data = view[start:stop]
+
+    next_token = _encode_token(target, stat, stop, end, etag) if stop < end else None
+    encoding = "base64"
+    content = None
+    # Try to decode as text first if it looks like a text file
+    if looks_text:
         try:
-            content = target.read_text(encoding="utf-8")
-            return FileContent(
-                content=content,
-                path=str(target),
-                size=size,
-                encoding="utf-8",
-                mime_type=mime_type,
-            )
+            content = data.decode("utf-8")
+            encoding = "utf-8"
         except UnicodeDecodeError:
             pass  # Fall through to binary handling
+    if content is None:
+        # Binary file: encode as base64
+        content = base64.b64encode(data).decode("ascii")
 
-    # Binary file: encode as base64
-    content = base64.b64encode(target.read_bytes()).decode("ascii")
-    return FileContent(
+    result = FileContent(
         content=content,
         path=str(target),
         size=size,
-        encoding="base64",
+        encoding=encoding,
         mime_type=mime_type,
+        offset=start,
+        length=len(data),
+        next_token=next_token,
+        etag=etag,
     )
+    cache.put(key, result, len(content))
+    return result
+
+
+def _not_modified(target: Path, size: int, mime_type: str, etag: str) -> FileContent:
+    return FileContent(
+        content="",
+        path=str(target),
+        size=size,
+        mime_type=mime_type,
+        length=0,
+        etag=etag,
+        not_modified=True,
+    )
+
+
+@contextmanager
+def _open_view(target: Path, size: int) -> Iterator[bytes | mmap.mmap]:
+    """Sliceable, searchable view of the file: mmap for large files, bytes otherwise."""
+    with open(target, "rb") as fh:
+        if size >= MMAP_MIN_BYTES:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                yield view
+        else:
+            yield fh.read()
+
+
+def _line_span(view: bytes | mmap.mmap, start_line: int, end_line: int | None) -> tuple[int, int]:
+    """Byte span covering lines start_line..end_line (1-based, inclusive)."""
+    if start_line < 1 or (end_line is not None and end_line < start_line):
+        raise ValueError("Lines are 1-based and end_line must not precede start_line")
+    size = len(view)
+    start = 0
+    for _ in range(start_line - 1):
+        newline = view.find(b"\n", start)
+        if newline < 0:
+            return size, size
+        start = newline + 1
+    if end_line is None:
+        return start, size
+    end = start
+    for _ in range(end_line - start_line + 1):
+        newline = view.find(b"\n", end)
+        if newline < 0:
+            return start, size
+        end = newline + 1
+    return start, end
+
+
+def _text_cut(view: bytes | mmap.mmap, start: int, stop: int) -> int:
+    """Move a chunk end back to a line break, or at least off a UTF-8 continuation byte."""
+    newline = view.rfind(b"\n", start, stop)
+    if newline >= start:
+        return newline + 1
+    while stop > start + 1 and view[stop] & 0xC0 == 0x80:
+        stop -= 1
+    return stop
+
+
+def _path_tag(target: Path) -> str:
+    return hashlib.sha1(str(target).encode("utf-8")).hexdigest()[:12]
+
+
+def _encode_token(target: Path, stat: os.stat_result, start: int, end: int, etag: str) -> str:
+    raw = f"{start}:{end}:{stat.st_mtime_ns}:{stat.st_size}:{_path_tag(target)}:{etag}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+
+def _decode_token(token: str, target: Path, stat: os.stat_result) -> tuple[int, int, str]:
+    """Return (start, end, etag) from a token issued for this version of ``target``."""
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("ascii")
+        start, end, mtime_ns, size, tag, etag = raw.split(":")
+        span = (int(start), int(end))
+        version = (int(mtime_ns), int(size))
+        int(etag, 16)
+    except Exception:
+        raise ValueError("Invalid continuation token") from None
+    if tag != _path_tag(target):
+        raise ValueError("Continuation token was issued for another file")
+    if version != (stat.st_mtime_ns, stat.st_size):
+        raise ValueError("File changed since the continuation token was issued; read it again")
+    if not 0 <= span[0] <= span[1] <= stat.st_size:
+        raise ValueError(
+            f"Continuation token range {span[0]}-{span[1]} is outside the file "
+            f"({stat.st_size} bytes)"
+        )
+    return span[0], span[1], etag
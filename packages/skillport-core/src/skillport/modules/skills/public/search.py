@@ -1,49 +1,68 @@
 from __future__ import annotations
 
+from skillport.modules.indexing.public.query import count as idx_count
+from skillport.modules.indexing.public.query import count_matches as idx_count_matches
 from skillport.modules.indexing.public.query import list_all as idx_list_all
 from skillport.modules.indexing.public.query import search as idx_search
-from skillport.shared.config import MAX_SKILLS, Config
+from skillport.shared.config import Config
 from skillport.shared.filters import is_skill_enabled, normalize_token
 
 from .types import SearchResult, SkillSummary
 
 
-def search_skills(query: str, *, limit: int = 10, config: Config) -> SearchResult:
-    """Search for skills via indexing module with filters applied."""
-    effective_limit = limit or config.search_limit
-    normalized_query = query or ""
-    is_list_all = not normalized_query.strip() or normalized_query.strip() == "*"
-
-    # Fetch up to MAX_SKILLS to count total filtered results
-    raw_results: list[dict]
-    if is_list_all:
-        raw_results = idx_list_all(limit=MAX_SKILLS, config=config)
-    else:
-        raw_results = idx_search(normalized_query, limit=MAX_SKILLS, config=config)
-
-    # Filter and collect all matching skills
-    all_matching: list[SkillSummary] = []
-    for row in raw_results:
+def _to_summaries(rows: list[dict], *, config: Config) -> list[SkillSummary]:
+    summaries: list[SkillSummary] = []
+    for row in rows:
         skill_id = row.get("id") or row.get("name")
         category = row.get("category", "")
         if not skill_id:
             continue
+        # The index prefilter already applies enabled_* filters; this is a cheap guard.
         if not is_skill_enabled(skill_id, category, config=config):
             continue
-        score = float(row.get("_score", 0.0))
-        all_matching.append(
+        summaries.append(
             SkillSummary(
                 id=skill_id,
                 name=row.get("name", skill_id),
                 description=row.get("description", ""),
                 category=normalize_token(category),
-                score=score,
+                score=float(row.get("_score", 0.0)),
             )
         )
+    return summaries
+
+
+def search_skills(
+    query: str,
+    *,
+    limit: int = 10,
+    config: Config,
+    query_vector: list[float] | None = None,
+) -> SearchResult:
+    """Search for skills via indexing module with filters applied.
+
+    ``query_vector`` is the query embedding if the caller already computed it.
+    """
+    effective_limit = limit or config.search_limit
+    normalized_query = query or ""
+    is_list_all = not normalized_query.strip() or normalized_query.strip() == "*"
+
+    if is_list_all:
+        # Only fetch the page we return; the total comes from a count query.
+        rows = idx_list_all(limit=effective_limit, config=config)
+        return SearchResult(
+            skills=_to_summaries(rows, config=config),
+            total=idx_count(config=config),
+            query=query,
+        )
 
-    # Return limited results but total count of all matching
+    # Only the returned page is fetched; the total reruns the same search over
+    # ids alone.
+    rows = idx_search(
+        normalized_query, limit=effective_limit, config=config, query_vector=query_vector
+    )
     return SearchResult(
-        skills=all_matching[:effective_limit],
-        total=len(all_matching),
+        skills=_to_summaries(rows, config=config),
+        total=idx_count_matches(normalized_query, config=config, query_vector=query_vector),
         query=query,
     )
@@ -70,7 +70,7 @@ class FileContent(FrozenModel):
         description="File content (UTF-8 text or base64-encoded binary)",
     )
     path: str = Field(..., description="Resolved absolute path")
-    size: int = Field(..., ge=0, description="Content size in bytes")
+    size: int = Field(..., ge=0, description="File size in bytes")
     encoding: Literal["utf-8", "base64"] = Field(
         default="utf-8",
         description="Content encoding: 'utf-8' for text, 'base64' for binary",
@@ -79,6 +79,20 @@ class FileContent(FrozenModel):
         default="text/plain",
         description="MIME type (e.g., 'image/png', 'application/pdf')",
     )
+    offset: int = Field(default=0, ge=0, description="Byte offset of this chunk in the file")
+    length: int | None = Field(
+        default=None, ge=0, description="Bytes in this chunk (before base64 encoding)"
+    )
+    next_token: str | None = Field(
+        default=None,
+        description="Pass as continuation_token to read the next chunk (None: range complete)",
+    )
+    etag: str | None = Field(
+        default=None, description="Content hash of the whole file (send back as if_none_match)"
+    )
+    not_modified: bool = Field(
+        default=False, description="True when if_none_match matched; content is then empty"
+    )
 
 
 class SearchResult(FrozenModel):
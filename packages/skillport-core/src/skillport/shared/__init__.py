@@ -20,7 +20,7 @@ from .types import (
     SourceType,
     ValidationIssue,
 )
-from .utils import parse_frontmatter, resolve_inside
+from .utils import Frontmatter, parse_frontmatter, read_frontmatter, resolve_inside
 
 __all__ = [
     # Auth
@@ -47,7 +47,9 @@ __all__ = [
     "Namespace",
     # Utils
     "normalize_token",
+    "Frontmatter",
     "parse_frontmatter",
+    "read_frontmatter",
     "is_skill_enabled",
     "resolve_inside",
 ]
@@ -71,6 +71,17 @@ SKILLPORT_HOME = Path.home() / ".skillport"
 MAX_SKILLS = 10000
 DEFAULT_DB_SUBDIR = Path("indexes") / "default"
 
+# Embedding providers shipped with SkillPort; others register under this entry-point group.
+BUILTIN_EMBEDDING_PROVIDERS = ("none", "openai", "local")
+EMBEDDING_PROVIDER_GROUP = "skillport.embedding_providers"
+
+
+def embedding_provider_entry_points() -> dict[str, Any]:
+    """Installed third-party embedding providers, keyed by name."""
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep for ep in entry_points(group=EMBEDDING_PROVIDER_GROUP)}
+
 
 class Config(BaseSettings):
     """Application configuration with environment variable support."""
@@ -92,15 +103,30 @@ class Config(BaseSettings):
         default=None,
         description="LanceDB database path (auto-derived from skills_dir if not set)",
     )
+    index_backend: Literal["lancedb", "memory"] = Field(
+        default="lancedb",
+        description="Index engine: lancedb, or memory (in-process BM25; embedding_provider=none only)",
+    )
     meta_dir: Path | None = Field(
         default=None,
         description="Directory for SkillPort metadata (origins, etc., auto-derived)",
     )
+    frontmatter_cache: bool = Field(
+        default=True,
+        description="Persist parsed SKILL.md frontmatter under meta_dir between CLI runs",
+    )
+    catalog_snapshot: bool = Field(
+        default=True,
+        description="Persist the filesystem catalog under meta_dir for index-free commands",
+    )
 
     # Embeddings
-    embedding_provider: Literal["none", "openai"] = Field(
+    embedding_provider: str = Field(
         default="none",
-        description="Embedding provider for vector search",
+        description=(
+            "Embedding provider for vector search: none, openai, local (offline hashed "
+            "n-grams), or a name registered under the skillport.embedding_providers entry points"
+        ),
     )
     openai_api_key: str | None = Field(
         default=None,
@@ -111,10 +137,36 @@ class Config(BaseSettings):
         default="text-embedding-3-small",
         validation_alias="OPENAI_EMBEDDING_MODEL",
     )
+    openai_base_url: str | None = Field(
+        default=None,
+        description="Base URL of an OpenAI-compatible embeddings API (e.g. a local server)",
+        validation_alias="OPENAI_BASE_URL",
+    )
+    local_embedding_dimensions: int = Field(
+        default=256,
+        ge=16,
+        le=4096,
+        description="Vector size for embedding_provider=local",
+    )
+    embedding_cache_size: int = Field(
+        default=50000,
+        ge=0,
+        description="Max cached embedding vectors stored next to the index (0 disables)",
+    )
     # Search
     search_limit: int = Field(default=10, ge=1, le=100, description="Default search result limit")
     search_threshold: float = Field(
-        default=0.2, ge=0.0, le=1.0, description="Minimum relevance score"
+        default=0.2,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Minimum relevance: full-text hits must score at least this fraction of the best"
+            " full-text hit, and in hybrid mode vector hits need at least this cosine similarity"
+        ),
+    )
+    search_mode: Literal["hybrid", "fallback"] = Field(
+        default="hybrid",
+        description="hybrid: fuse vector and FTS rankings; fallback: vector, then FTS, then substring",
     )
 
     # Filters (comma-separated strings from env, e.g., "cat1,cat2")
@@ -153,7 +205,14 @@ class Config(BaseSettings):
     )
     exec_timeout_seconds: int = Field(default=60, description="Command timeout seconds")
     exec_max_output_bytes: int = Field(default=65536, description="Max captured output in bytes")
-    max_file_bytes: int = Field(default=65536, description="Max file size to read")
+    max_file_bytes: int = Field(
+        default=65536, description="Max bytes returned per read (larger files are chunked)"
+    )
+    file_cache_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Memory budget for cached read_skill_file payloads (0 disables)",
+    )
     log_level: str | None = Field(
         default=None, description="Optional log level (e.g., DEBUG/INFO/WARN/ERROR)"
     )
@@ -182,6 +241,18 @@ class Config(BaseSettings):
             return None
         return _expanduser_cross_platform(value).resolve()
 
+    @field_validator("embedding_provider", mode="before")
+    @classmethod
+    def validate_embedding_provider(cls, value: Any):
+        name = str(value).strip().lower()
+        if name in BUILTIN_EMBEDDING_PROVIDERS:
+            return name
+        # Only scan installed entry points for names that are not built in.
+        if name not in embedding_provider_entry_points():
+            known = ", ".join(BUILTIN_EMBEDDING_PROVIDERS)
+            raise ValueError(f"Unknown embedding_provider '{value}' (built-in: {known})")
+        return name
+
     @staticmethod
     def _slug_for_skills_dir(skills_dir: Path) -> str:
         default_path = SKILLPORT_HOME / "skills"
@@ -192,8 +263,11 @@ class Config(BaseSettings):
 
     @model_validator(mode="after")
     def validate_provider_keys(self):
-        if self.embedding_provider == "openai" and not self.openai_api_key:
+        needs_key = not self.openai_api_key and not self.openai_base_url
+        if self.embedding_provider == "openai" and needs_key:
             raise ValueError("OPENAI_API_KEY is required when embedding_provider='openai'")
+        if self.index_backend == "memory" and self.embedding_provider != "none":
+            raise ValueError("index_backend='memory' requires embedding_provider='none'")
         return self
 
     def model_post_init(self, __context: Any) -> None:
@@ -233,4 +307,11 @@ class Config(BaseSettings):
         return Config(**data)
 
 
-__all__ = ["Config", "SKILLPORT_HOME", "MAX_SKILLS"]
+__all__ = [
+    "Config",
+    "SKILLPORT_HOME",
+    "MAX_SKILLS",
+    "BUILTIN_EMBEDDING_PROVIDERS",
+    "EMBEDDING_PROVIDER_GROUP",
+    "embedding_provider_entry_points",
+]
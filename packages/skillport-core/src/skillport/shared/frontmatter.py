@@ -0,0 +1,237 @@
+"""SKILL.md frontmatter parsing with a stat-keyed cache.
+
+Parsed headers are cached per process, keyed by (path, mtime_ns, size), so a
+file is YAML-parsed once until it changes. The CLI additionally persists the
+cache under meta_dir between runs (load_frontmatter_cache /
+save_frontmatter_cache).
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import yaml
+
+# Line that opens and closes the YAML frontmatter block.
+FRONTMATTER_DELIMITER = b"---"
+# libyaml-backed loader when PyYAML was built with it (several times faster).
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Parsed headers kept in memory (and persisted by the CLI).
+FRONTMATTER_CACHE_ENTRIES = 8192
+FRONTMATTER_CACHE_FILENAME = "frontmatter_cache.json"
+_CACHE_FORMAT = 1
+
+_CacheKey = tuple[str, int, int]
+_cache: OrderedDict[_CacheKey, tuple[dict[str, Any], int | None]] = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_dirty = False
+
+
+def _load_meta(header: bytes) -> dict[str, Any]:
+    try:
+        meta = yaml.load(header.decode("utf-8"), Loader=_YAML_LOADER) or {}
+    except yaml.YAMLError:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _read_header(fh: BinaryIO) -> tuple[dict[str, Any], int | None]:
+    """Read the frontmatter block line by line, stopping at the closing ``---``.
+
+    Returns (metadata, offset where the body starts), or ({}, None) when the file
+    has no complete frontmatter block.
+    """
+    if fh.readline().rstrip() != FRONTMATTER_DELIMITER:
+        return {}, None
+    header: list[bytes] = []
+    for line in fh:
+        if line.rstrip() == FRONTMATTER_DELIMITER:
+            return _load_meta(b"".join(header)), fh.tell()
+        header.append(line)
+    return {}, None
+
+
+def _read_body(fh: BinaryIO, offset: int | None) -> str:
+    fh.seek(offset or 0)
+    # Universal newlines, as Path.read_text() would give.
+    text = fh.read().decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return text if offset is None else text.lstrip("\n")
+
+
+def _stat_key(file_path: Path) -> _CacheKey:
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    return (str(file_path), st.st_mtime_ns, st.st_size)
+
+
+def _cache_get(key: _CacheKey) -> tuple[dict[str, Any], int | None] | None:
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        _cache.move_to_end(key)
+    # Callers may edit the metadata (e.g. `skillport meta set`); never hand out the cached dict.
+    return copy.deepcopy(entry[0]), entry[1]
+
+
+def _cache_put(key: _CacheKey, meta: dict[str, Any], offset: int | None) -> None:
+    global _cache_dirty
+    with _cache_lock:
+        _cache[key] = (copy.deepcopy(meta), offset)
+        _cache.move_to_end(key)
+        while len(_cache) > FRONTMATTER_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+        _cache_dirty = True
+
+
+class Frontmatter:
+    """Frontmatter of a Markdown file; the body is read only when first accessed."""
+
+    def __init__(self, path: Path, meta: dict[str, Any], body_offset: int | None):
+        self.path = path
+        self.meta = meta
+        self.body_offset = body_offset
+
+    @cached_property
+    def body(self) -> str:
+        with open(self.path, "rb") as fh:
+            return _read_body(fh, self.body_offset)
+
+
+def read_frontmatter(file_path: Path) -> Frontmatter:
+    """Parse only the YAML frontmatter of a Markdown file.
+
+    Reading stops at the closing ``---`` line, so long instruction bodies are not
+    loaded; ``Frontmatter.body`` reads the rest on demand. Metadata is {} when
+    frontmatter is absent or invalid.
+    """
+    key = _stat_key(file_path)
+    cached = _cache_get(key)
+    if cached is not None:
+        return Frontmatter(file_path, *cached)
+    with open(file_path, "rb") as fh:
+        meta, offset = _read_header(fh)
+    _cache_put(key, meta, offset)
+    return Frontmatter(file_path, meta, offset)
+
+
+def parse_frontmatter(file_path: Path) -> tuple[dict[str, Any], str]:
+    """Parse a Markdown file with YAML frontmatter.
+
+    Returns (metadata, body). If frontmatter is absent or invalid, metadata is {}.
+    """
+    key = _stat_key(file_path)
+    cached = _cache_get(key)
+    with open(file_path, "rb") as fh:
+        if cached is not None:
+            meta, offset = cached
+        else:
+            meta, offset = _read_header(fh)
+            _cache_put(key, meta, offset)
+        return meta, _read_body(fh, offset)
+
+
+def split_frontmatter(data: bytes) -> tuple[dict[str, Any], str]:
+    """parse_frontmatter for file content already in memory (not cached)."""
+    fh = io.BytesIO(data)
+    meta, offset = _read_header(fh)
+    return meta, _read_body(fh, offset)
+
+
+def clear_frontmatter_cache() -> None:
+    global _cache_dirty
+    with _cache_lock:
+        _cache.clear()
+        _cache_dirty = False
+
+
+def _json_safe(meta: dict[str, Any]) -> bool:
+    """True when ``meta`` survives a JSON round trip unchanged (no dates, int keys, ...)."""
+    try:
+        return json.loads(json.dumps(meta)) == meta
+    except (TypeError, ValueError):
+        return False
+
+
+def _cache_entry(row: Any) -> tuple[_CacheKey, tuple[dict[str, Any], int | None]]:
+    file_path, mtime_ns, size, offset, meta = row
+    if not (
+        isinstance(file_path, str)
+        and isinstance(mtime_ns, int)
+        and isinstance(size, int)
+        and (offset is None or isinstance(offset, int))
+        and isinstance(meta, dict)
+    ):
+        raise ValueError(f"malformed entry {row!r}")
+    return (file_path, mtime_ns, size), (meta, offset)
+
+
+def load_frontmatter_cache(path: Path) -> None:
+    """Seed the in-memory cache from a file written by save_frontmatter_cache.
+
+    A missing, corrupt or outdated file is ignored: the cache is rebuilt by parsing.
+    """
+    global _cache_dirty
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+            return
+        entries = [_cache_entry(row) for row in data.get("entries", [])]
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, TypeError) as exc:
+        print(f"Ignoring frontmatter cache {path}: {exc}", file=sys.stderr)
+        return
+    with _cache_lock:
+        for key, entry in entries:
+            _cache.setdefault(key, entry)
+        while len(_cache) > FRONTMATTER_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+        _cache_dirty = False
+
+
+def save_frontmatter_cache(path: Path) -> None:
+    """Persist the in-memory cache (skipped when nothing was parsed since loading)."""
+    global _cache_dirty
+    with _cache_lock:
+        if not _cache_dirty:
+            return
+        entries = [
+            [file_path, mtime_ns, size, offset, meta]
+            for (file_path, mtime_ns, size), (meta, offset) in _cache.items()
+            if _json_safe(meta)
+        ]
+        _cache_dirty = False
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": _CACHE_FORMAT, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"Failed to write frontmatter cache {path}: {exc}", file=sys.stderr)
+        tmp.unlink(missing_ok=True)
+
+
+__all__ = [
+    "FRONTMATTER_CACHE_FILENAME",
+    "Frontmatter",
+    "clear_frontmatter_cache",
+    "load_frontmatter_cache",
+    "parse_frontmatter",
+    "read_frontmatter",
+    "save_frontmatter_cache",
+    "split_frontmatter",
+]
@@ -0,0 +1,145 @@
+"""Depth-bounded skills_dir scanner shared by indexing, tracking, the catalog and the watcher.
+
+Skills live at ``<skills_dir>/<skill>/SKILL.md`` or ``<skills_dir>/<ns>/<skill>/SKILL.md``.
+Only those two levels are listed: the root and each top-level directory are read
+with one ``os.scandir`` each, and second-level candidates cost a single stat of
+their SKILL.md. Hidden and excluded directories are pruned before anything below
+them is touched, so ``node_modules`` or asset folders inside skills are never
+walked.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+SKILL_FILENAME = "SKILL.md"
+# Directory names never descended into (hidden directories are skipped too).
+SCAN_EXCLUDE_NAMES = frozenset({"__pycache__", "node_modules"})
+# skills_dir/<ns>/<skill> is the deepest skill location.
+MAX_SKILL_DEPTH = 2
+# Top-level directories needed before the scan fans out to a thread pool.
+SCAN_PARALLEL_MIN_DIRS = 32
+SCAN_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ScannedSkill:
+    """A skill directory and the stat of its SKILL.md."""
+
+    id: str
+    path: Path
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @property
+    def skill_md(self) -> Path:
+        return self.path / SKILL_FILENAME
+
+    @property
+    def rel_skill_md(self) -> str:
+        """SKILL.md path relative to skills_dir, with "/" separators."""
+        return f"{self.id}/{SKILL_FILENAME}"
+
+
+@dataclass(frozen=True)
+class SkillScan:
+    """Snapshot of the skills found under ``skills_dir``, sorted by id."""
+
+    skills_dir: Path
+    skills: tuple[ScannedSkill, ...]
+
+    @property
+    def ids(self) -> set[str]:
+        return {skill.id for skill in self.skills}
+
+    def __iter__(self):
+        return iter(self.skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+
+def is_scannable(name: str) -> bool:
+    """False for hidden and excluded directory names."""
+    return not name.startswith(".") and name not in SCAN_EXCLUDE_NAMES
+
+
+def _skill_at(skill_id: str, path: Path, st: os.stat_result) -> ScannedSkill:
+    return ScannedSkill(
+        id=skill_id, path=path, mtime_ns=st.st_mtime_ns, size=st.st_size, inode=st.st_ino
+    )
+
+
+def _scan_top_level(entry_path: str, name: str) -> list[ScannedSkill]:
+    """Skills in one top-level directory: itself and its direct children."""
+    found: list[ScannedSkill] = []
+    children: list[tuple[str, str]] = []
+    try:
+        with os.scandir(entry_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.name == SKILL_FILENAME and entry.is_file():
+                        found.append(_skill_at(name, Path(entry_path), os.stat(entry.path)))
+                    elif is_scannable(entry.name) and entry.is_dir():
+                        children.append((entry.name, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return found
+
+    for child_name, child_path in children:
+        try:
+            st = os.stat(os.path.join(child_path, SKILL_FILENAME))
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            found.append(_skill_at(f"{name}/{child_name}", Path(child_path), st))
+    return found
+
+
+def scan_skills(skills_dir: Path, *, workers: int | None = None) -> SkillScan:
+    """Scan ``skills_dir`` once and return every skill with its SKILL.md stat.
+
+    Top-level directories are scanned on a thread pool when there are at least
+    ``SCAN_PARALLEL_MIN_DIRS`` of them (``workers`` overrides the pool size; 1
+    keeps the scan on the calling thread). A missing skills_dir yields an empty
+    snapshot.
+    """
+    top: list[tuple[str, str]] = []
+    try:
+        with os.scandir(skills_dir) as entries:
+            for entry in entries:
+                try:
+                    if is_scannable(entry.name) and entry.is_dir():
+                        top.append((entry.path, entry.name))
+                except OSError:
+                    continue
+    except OSError:
+        return SkillScan(skills_dir=skills_dir, skills=())
+
+    if workers is None:
+        workers = SCAN_MAX_WORKERS if len(top) >= SCAN_PARALLEL_MIN_DIRS else 1
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            groups = list(pool.map(lambda item: _scan_top_level(*item), top))
+    else:
+        groups = [_scan_top_level(path, name) for path, name in top]
+
+    skills = sorted((skill for group in groups for skill in group), key=lambda s: s.id)
+    return SkillScan(skills_dir=skills_dir, skills=tuple(skills))
+
+
+__all__ = [
+    "MAX_SKILL_DEPTH",
+    "SCAN_EXCLUDE_NAMES",
+    "SKILL_FILENAME",
+    "ScannedSkill",
+    "SkillScan",
+    "is_scannable",
+    "scan_skills",
+]
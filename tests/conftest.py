@@ -1,6 +1,8 @@
 """Shared pytest fixtures for SkillPort tests."""
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -17,3 +19,53 @@ def test_config(tmp_path: Path) -> Config:
         skills_dir=tmp_path / "skills",
         db_path=tmp_path / "index" / "skills.lancedb",
     )
+
+
+@pytest.fixture
+def make_config(tmp_path: Path) -> Callable[..., Config]:
+    """Factory for Configs like ``test_config``; keyword arguments override fields.
+
+    The skills directory is created so indexing and watching have something to scan.
+    """
+
+    def make(**overrides: Any) -> Config:
+        overrides.setdefault("skills_dir", tmp_path / "skills")
+        overrides.setdefault("db_path", tmp_path / "index" / "skills.lancedb")
+        Path(overrides["skills_dir"]).mkdir(parents=True, exist_ok=True)
+        return Config(**overrides)
+
+    return make
+
+
+def _yaml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(str(item) for item in value)}]"
+    return str(value)
+
+
+@pytest.fixture
+def write_skill() -> Callable[..., Path]:
+    """Writer for ``<skills_dir>/<skill_id>/SKILL.md``; returns the file's path.
+
+    Keyword arguments (category, tags, alwaysApply, ...) go under
+    ``metadata.skillport``. The body is ``# <skill_id>``.
+    """
+
+    def write(
+        skills_dir: Path, skill_id: str, description: str = "test skill", **skillport: Any
+    ) -> Path:
+        skill_dir = skills_dir / skill_id
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        meta = "".join(f"    {key}: {_yaml_value(value)}\n" for key, value in skillport.items())
+        block = f"metadata:\n  skillport:\n{meta}" if meta else ""
+        path = skill_dir / "SKILL.md"
+        path.write_text(
+            f"---\nname: {skill_id.split('/')[-1]}\ndescription: {description}\n{block}"
+            f"---\n# {skill_id}\n",
+            encoding="utf-8",
+        )
+        return path
+
+    return write
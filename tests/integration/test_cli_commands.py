@@ -77,6 +77,17 @@ class TestListCommand:
         assert "total" in data
         assert data["total"] >= 1
 
+    def test_list_persists_frontmatter_cache(self, skills_env: SkillsEnv, tmp_path: Path):
+        """Parsed frontmatter is saved under meta_dir for the next run."""
+        _create_skill(skills_env.skills_dir, "cached-skill")
+
+        result = runner.invoke(app, ["list", "--json"])
+
+        assert result.exit_code == 0
+        cache = json.loads((tmp_path / "index" / "meta" / "frontmatter_cache.json").read_text())
+        cached_paths = {entry[0] for entry in cache["entries"]}
+        assert str(skills_env.skills_dir / "cached-skill" / "SKILL.md") in cached_paths
+
     def test_list_with_limit(self, skills_env: SkillsEnv):
         """--limit restricts results."""
         for i in range(5):
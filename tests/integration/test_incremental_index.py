@@ -0,0 +1,87 @@
+"""Incremental (delta) reindexing against a real LanceDB table."""
+
+import os
+
+from skillport.modules.indexing import build_index, get_by_id, list_all, search
+from skillport.modules.indexing.internal.lancedb import IndexStore
+
+
+def test_changed_skills_are_upserted_without_full_rebuild(make_config, write_skill, monkeypatch):
+    cfg = make_config()
+    for name in ("alpha", "beta", "gamma"):
+        write_skill(cfg.skills_dir, name, f"{name} skill", category="test", tags=["demo"])
+    assert build_index(config=cfg, force=True).skill_count == 3
+
+    embedded: list[str] = []
+
+    def _fake_embeddings(texts, config):
+        embedded.extend(texts)
+        return None
+
+    monkeypatch.setattr(
+        "skillport.modules.indexing.internal.lancedb.get_embeddings", _fake_embeddings
+    )
+
+    write_skill(cfg.skills_dir, "alpha", "alpha skill, edited", category="test", tags=["demo"])
+    (cfg.skills_dir / "beta" / "SKILL.md").unlink()
+    write_skill(cfg.skills_dir, "ns/delta", "delta skill", category="test", tags=[])
+
+    result = build_index(config=cfg)
+    assert result.success
+    assert result.message == "hash_changed"
+    assert result.skill_count == 3
+
+    assert len(embedded) == 2
+    assert sorted(row["id"] for row in list_all(limit=10, config=cfg)) == [
+        "alpha",
+        "gamma",
+        "ns/delta",
+    ]
+    assert get_by_id("alpha", config=cfg)["description"] == "alpha skill, edited"
+    assert get_by_id("beta", config=cfg) is None
+    assert [row["id"] for row in search("delta", limit=5, config=cfg)] == ["ns/delta"]
+
+
+def test_removing_every_skill_drops_the_table(make_config, write_skill):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "alpha", "alpha skill")
+    build_index(config=cfg, force=True)
+
+    (cfg.skills_dir / "alpha" / "SKILL.md").unlink()
+    result = build_index(config=cfg)
+
+    assert result.success
+    assert result.skill_count == 0
+
+
+def test_touched_but_identical_skill_leaves_the_table_alone(make_config, write_skill, monkeypatch):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "alpha", "alpha skill")
+    build_index(config=cfg, force=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the table was modified for a content-identical skill")
+
+    monkeypatch.setattr(IndexStore, "_apply_delta", fail)
+    monkeypatch.setattr(IndexStore, "_create_indexes", fail)
+    os.utime(cfg.skills_dir / "alpha" / "SKILL.md", ns=(1, 1))
+
+    result = build_index(config=cfg)
+
+    assert (result.success, result.message, result.skill_count) == (True, "hash_changed", 1)
+    assert build_index(config=cfg).message != "hash_changed"
+
+
+def test_build_index_counts_without_listing(make_config, write_skill, monkeypatch):
+    cfg = make_config()
+    for name in ("alpha", "beta"):
+        write_skill(cfg.skills_dir, name, f"{name} skill")
+
+    def fail(self, **kwargs):
+        raise AssertionError("build_index materialized the table to count it")
+
+    monkeypatch.setattr(IndexStore, "list_all", fail)
+
+    assert build_index(config=cfg, force=True).skill_count == 2
+    assert build_index(config=cfg).skill_count == 2
+    assert build_index(config=cfg.with_overrides(enabled_skills=["alpha"])).skill_count == 1
@@ -0,0 +1,74 @@
+"""Long-lived IndexStore / table handle reuse across queries."""
+
+from skillport.modules.indexing import build_index, get_by_id, search
+from skillport.modules.indexing.internal.lancedb import IndexStore
+from skillport.modules.indexing.public import query
+from skillport.modules.indexing.public.query import _store
+
+
+def test_queries_reuse_one_store_and_table_handle(make_config, write_skill, monkeypatch):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "alpha", "alpha skill")
+    build_index(config=cfg, force=True)
+
+    store = _store(cfg)
+    assert _store(cfg.with_overrides()) is store
+
+    opened: list[str] = []
+    original_open = store.db.open_table
+    monkeypatch.setattr(
+        store.db, "open_table", lambda name: opened.append(name) or original_open(name)
+    )
+
+    for _ in range(3):
+        assert search("alpha", limit=5, config=cfg)
+        assert get_by_id("alpha", config=cfg)
+    assert len(opened) <= 1
+
+
+def test_rebuild_from_another_store_refreshes_the_handle(make_config, write_skill):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "alpha", "alpha skill")
+    build_index(config=cfg, force=True)
+    assert get_by_id("alpha", config=cfg)["description"] == "alpha skill"
+
+    # Simulate another process (e.g. `skillport-mcp --reindex`) rebuilding the index.
+    write_skill(cfg.skills_dir, "alpha", "alpha skill, rebuilt elsewhere")
+    other = IndexStore(cfg)
+    other.initialize_index()
+    other.persist_state(other.should_reindex(force=True)["state"])
+
+    assert get_by_id("alpha", config=cfg)["description"] == "alpha skill, rebuilt elsewhere"
+
+
+def test_search_results_are_cached_until_the_index_changes(make_config, write_skill):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "alpha", "pdf helper")
+    build_index(config=cfg, force=True)
+
+    first = search("pdf", limit=5, config=cfg)
+    assert [row["id"] for row in first] == ["alpha"]
+    assert len(_store(cfg).search_service._cache) == 1
+    assert search("pdf", limit=5, config=cfg) == first
+
+    write_skill(cfg.skills_dir, "beta", "another pdf helper")
+    build_index(config=cfg)
+    assert sorted(row["id"] for row in search("pdf", limit=5, config=cfg)) == ["alpha", "beta"]
+
+
+def test_store_cache_is_bounded_and_closes_evicted_stores(make_config, monkeypatch):
+    monkeypatch.setattr(query, "_STORES", query.OrderedDict())
+    monkeypatch.setattr(query, "STORE_CACHE_SIZE", 2)
+    cfg = make_config()
+    first = _store(cfg)
+    closed = []
+    monkeypatch.setattr(first, "close", lambda: closed.append(first))
+
+    _store(cfg.with_overrides(search_limit=11))
+    assert _store(cfg) is first  # recently used again
+    _store(cfg.with_overrides(search_limit=12))
+    _store(cfg.with_overrides(search_limit=13))
+
+    assert list(query._STORES.values())[-1].config.search_limit == 13
+    assert len(query._STORES) == 2
+    assert closed == [first]
@@ -0,0 +1,68 @@
+"""Filesystem watcher keeping the index in sync with skills_dir."""
+
+import threading
+import time
+
+from skillport.modules.indexing import build_index, get_by_id
+from skillport.modules.indexing.internal.watcher import IndexWatcher, _is_relevant
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_relevance_filter_ignores_hidden_and_deep_paths(tmp_path):
+    assert _is_relevant(str(tmp_path / "ns" / "skill" / "SKILL.md"), tmp_path)
+    assert not _is_relevant(str(tmp_path / ".git" / "HEAD"), tmp_path)
+    assert not _is_relevant(str(tmp_path / "a" / "b" / "c" / "d.md"), tmp_path)
+    assert not _is_relevant(str(tmp_path.parent / "other"), tmp_path)
+
+
+def test_polling_watcher_debounces_bursts(tmp_path, write_skill):
+    write_skill(tmp_path, "alpha", "v0")
+    calls: list[float] = []
+    fired = threading.Event()
+
+    def _on_change():
+        calls.append(time.monotonic())
+        fired.set()
+
+    watcher = IndexWatcher(
+        tmp_path, _on_change, debounce_seconds=0.3, poll_interval=0.05, use_polling=True
+    ).start()
+    try:
+        for i in range(3):
+            write_skill(tmp_path, "alpha", f"v{i + 1}-" + "x" * i)
+            time.sleep(0.05)
+        assert fired.wait(5.0)
+        time.sleep(0.5)
+    finally:
+        watcher.stop()
+
+    assert len(calls) == 1
+
+
+def test_watch_refreshes_index_on_edit(make_config, write_skill):
+    cfg = make_config()
+    skills_dir = cfg.skills_dir
+    write_skill(skills_dir, "alpha", "before")
+    build_index(config=cfg, force=True)
+
+    def _refresh():
+        build_index(config=cfg)
+
+    watcher = IndexWatcher(
+        skills_dir, _refresh, debounce_seconds=0.1, poll_interval=0.05, use_polling=True
+    ).start()
+    try:
+        write_skill(skills_dir, "alpha", "after the edit")
+        assert _wait_for(
+            lambda: (get_by_id("alpha", config=cfg) or {}).get("description") == "after the edit"
+        )
+    finally:
+        watcher.stop()
@@ -109,11 +109,29 @@ class TestLocalMode:
 class TestRemoteMode:
     """Tests for Remote mode (HTTP transport)."""
 
-    async def test_list_tools_returns_three_tools(self, remote_client: Client):
-        """Remote mode should have 3 tools including read_skill_file."""
+    async def test_list_tools_returns_four_tools(self, remote_client: Client):
+        """Remote mode should have 4 tools including load_skills and read_skill_file."""
         tools = await remote_client.list_tools()
         tool_names = [t.name for t in tools]
-        assert sorted(tool_names) == ["load_skill", "read_skill_file", "search_skills"]
+        assert sorted(tool_names) == [
+            "load_skill",
+            "load_skills",
+            "read_skill_file",
+            "search_skills",
+        ]
+
+    async def test_load_skills_returns_details_and_errors(self, remote_client: Client):
+        """load_skills loads several skills and reports unknown ids separately."""
+        result = await remote_client.call_tool(
+            "load_skills", {"skill_ids": ["test-skill", "missing", "test-skill"]}
+        )
+        assert [s["id"] for s in result.data["skills"]] == ["test-skill", "test-skill"]
+        assert "Hello from test skill" in result.data["skills"][0]["instructions"]
+        assert [e["id"] for e in result.data["errors"]] == ["missing"]
+
+    async def test_load_skills_rejects_oversized_batches(self, remote_client: Client):
+        with pytest.raises(Exception, match="at most"):
+            await remote_client.call_tool("load_skills", {"skill_ids": ["x"] * 21})
 
     async def test_search_skills_works(self, remote_client: Client):
         """search_skills should work in Remote mode."""
@@ -198,3 +216,190 @@ class TestInstructions:
         )
         assert "read_skill_file" in instructions
         assert "base64" in instructions or "encoding" in instructions
+
+
+class TestIndexWarmup:
+    """Tools answer from the filesystem until the background index is ready."""
+
+    async def test_tools_use_filesystem_before_index_is_ready(self, tmp_path: Path):
+        config = _create_test_config(tmp_path)
+        _create_test_skill(config.skills_dir, "pdf-tools", "Extract PDF text")
+        (config.skills_dir / "pdf-tools" / "notes.txt").write_text("hi", encoding="utf-8")
+
+        mcp = create_mcp_server(config=config, is_remote=True, index_ready=lambda: False)
+        async with Client(transport=mcp) as client:
+            found = await client.call_tool("search_skills", {"query": "pdf-tools"})
+            loaded = await client.call_tool("load_skill", {"skill_id": "pdf-tools"})
+            read = await client.call_tool(
+                "read_skill_file", {"skill_id": "pdf-tools", "file_path": "notes.txt"}
+            )
+
+        assert [s["id"] for s in found.data["skills"]] == ["pdf-tools"]
+        assert "Extract PDF text" in loaded.data["instructions"]
+        assert read.data["content"] == "hi"
+        assert not (tmp_path / "db.lancedb").exists()
+
+    async def test_warmup_builds_index_then_switches_to_it(self, tmp_path: Path):
+        from skillport.interfaces.mcp.warmup import IndexWarmup
+
+        config = _create_test_config(tmp_path)
+        _create_test_skill(config.skills_dir, "test-skill")
+        ready_calls: list[bool] = []
+
+        warmup = IndexWarmup(config, on_ready=lambda: ready_calls.append(True))
+        mcp = create_mcp_server(config=config, is_remote=False, index_ready=warmup.is_ready)
+        assert not warmup.is_ready()
+        warmup.start()
+        assert warmup.wait(30)
+
+        async with Client(transport=mcp) as client:
+            result = await client.call_tool("search_skills", {"query": "test"})
+
+        assert [s["id"] for s in result.data["skills"]] == ["test-skill"]
+        assert ready_calls == [True]
+        assert (tmp_path / "index_state.json").exists()
+
+    async def test_failed_warmup_keeps_serving_from_filesystem(
+        self, tmp_path: Path, monkeypatch, capsys
+    ):
+        from skillport.interfaces.mcp.warmup import IndexWarmup
+        from skillport.modules import indexing
+        from skillport.modules.indexing import IndexBuildResult
+
+        monkeypatch.setattr(
+            indexing,
+            "build_index",
+            lambda **kwargs: IndexBuildResult(success=False, skill_count=0, message="disk full"),
+        )
+        config = _create_test_config(tmp_path)
+        _create_test_skill(config.skills_dir, "test-skill")
+        ready_calls: list[bool] = []
+
+        warmup = IndexWarmup(config, force=True, on_ready=lambda: ready_calls.append(True))
+        mcp = create_mcp_server(config=config, is_remote=False, index_ready=warmup.is_ready)
+        assert not warmup.start().wait(30)
+
+        async with Client(transport=mcp) as client:
+            result = await client.call_tool("search_skills", {"query": "test"})
+
+        assert [s["id"] for s in result.data["skills"]] == ["test-skill"]
+        assert warmup.error == "disk full"
+        assert ready_calls == []
+        assert "Index ready" not in capsys.readouterr().err
+
+    def test_on_ready_failure_is_logged(self, tmp_path: Path, capsys):
+        from skillport.interfaces.mcp.warmup import IndexWarmup
+
+        def on_ready():
+            raise OSError("inotify limit reached")
+
+        config = _create_test_config(tmp_path)
+        warmup = IndexWarmup(config, skip_auto=True, on_ready=on_ready)
+
+        assert warmup.start().wait(30)
+        warmup._thread.join(5)
+        assert "Index ready callback failed: inotify limit reached" in capsys.readouterr().err
+
+
+class TestAsyncTools:
+    """Blocking tool work runs on worker threads, not the event loop."""
+
+    async def test_slow_search_does_not_block_other_tools(self, test_config: Config, monkeypatch):
+        import asyncio
+        import threading
+
+        from skillport.interfaces.mcp import tools
+
+        loaded = threading.Event()
+        real_load_skill = tools.load_skill
+
+        def slow_search(query, *, limit, config, query_vector=None):
+            # Only finishes early if load_skill ran while this call was in flight.
+            assert loaded.wait(5)
+            return tools.search_skills_fs(query, limit=limit, config=config)
+
+        def load_skill(skill_id, *, config):
+            loaded.set()
+            return real_load_skill(skill_id, config=config)
+
+        monkeypatch.setattr(tools, "search_skills", slow_search)
+        monkeypatch.setattr(tools, "load_skill", load_skill)
+
+        mcp = create_mcp_server(config=test_config, is_remote=False)
+        async with Client(transport=mcp) as client:
+            search_task = asyncio.create_task(client.call_tool("search_skills", {"query": "test"}))
+            await asyncio.sleep(0.05)
+            detail = await client.call_tool("load_skill", {"skill_id": "test-skill"})
+            found = await asyncio.wait_for(search_task, 10)
+
+        assert detail.data["id"] == "test-skill"
+        assert [s["id"] for s in found.data["skills"]] == ["test-skill"]
+
+    async def test_tool_pool_is_shut_down_with_the_server(self, test_config: Config, monkeypatch):
+        from skillport.interfaces.mcp import tools
+
+        shutdowns = []
+        real_shutdown = tools.ToolPool.shutdown
+        monkeypatch.setattr(
+            tools.ToolPool, "shutdown", lambda pool: shutdowns.append(pool) or real_shutdown(pool)
+        )
+
+        mcp = create_mcp_server(config=test_config, is_remote=False)
+        for runs in range(2):
+            # The pool restarts on the next connection after a shutdown.
+            async with Client(transport=mcp) as client:
+                await client.call_tool("load_skill", {"skill_id": "test-skill"})
+                assert len(shutdowns) == runs
+
+        assert len(shutdowns) == 2
+        assert shutdowns[0]._executor is None
+
+
+class TestChunkedReads:
+    """read_skill_file pages through files larger than max_file_bytes."""
+
+    async def test_pages_with_continuation_token(self, tmp_path: Path):
+        config = _create_test_config(tmp_path).with_overrides(max_file_bytes=64)
+        _create_test_skill(config.skills_dir, "test-skill")
+        text = "".join(f"row {i}\n" for i in range(100))
+        (config.skills_dir / "test-skill" / "rows.txt").write_text(text, encoding="utf-8")
+        build_index(config=config, force=True)
+
+        mcp = create_mcp_server(config=config, is_remote=True)
+        args = {"skill_id": "test-skill", "file_path": "rows.txt"}
+        pages = []
+        async with Client(transport=mcp) as client:
+            result = await client.call_tool("read_skill_file", args)
+            pages.append(result.data)
+            while pages[-1]["next_token"]:
+                result = await client.call_tool(
+                    "read_skill_file", {**args, "continuation_token": pages[-1]["next_token"]}
+                )
+                pages.append(result.data)
+            lines = await client.call_tool(
+                "read_skill_file", {**args, "start_line": 3, "end_line": 4}
+            )
+
+        assert len(pages) > 1
+        assert "".join(p["content"] for p in pages) == text
+        assert lines.data["content"] == "row 2\nrow 3\n"
+
+    async def test_if_none_match_skips_unchanged_file(self, tmp_path: Path):
+        config = _create_test_config(tmp_path)
+        _create_test_skill(config.skills_dir, "test-skill")
+        build_index(config=config, force=True)
+
+        mcp = create_mcp_server(config=config, is_remote=True)
+        args = {"skill_id": "test-skill", "file_path": "SKILL.md"}
+        async with Client(transport=mcp) as client:
+            first = await client.call_tool("read_skill_file", args)
+            again = await client.call_tool(
+                "read_skill_file", {**args, "if_none_match": first.data["etag"]}
+            )
+
+        assert first.data["content"]
+        assert again.data == {
+            "path": first.data["path"],
+            "etag": first.data["etag"],
+            "not_modified": True,
+        }
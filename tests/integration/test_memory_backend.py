@@ -0,0 +1,70 @@
+"""index_backend='memory': build, query and incremental updates without LanceDB."""
+
+import subprocess
+import sys
+
+from skillport.modules.indexing import build_index, count, get_by_id, list_all, search
+
+
+def test_build_and_query(make_config, write_skill):
+    cfg = make_config(index_backend="memory")
+    write_skill(cfg.skills_dir, "pdf-tools", "Extract text from PDF files", category="docs")
+    write_skill(cfg.skills_dir, "ns/git-helper", "Draft commit messages", alwaysApply=True)
+
+    result = build_index(config=cfg, force=True)
+    assert result.success and result.skill_count == 2
+    assert not cfg.db_path.exists()
+
+    hits = search("pdf", limit=5, config=cfg)
+    assert [h["id"] for h in hits] == ["pdf-tools"]
+    assert "instructions" not in hits[0]
+    assert [h["id"] for h in search("helper", limit=5, config=cfg)] == ["ns/git-helper"]
+
+    detail = get_by_id("git-helper", config=cfg)
+    assert detail["id"] == "ns/git-helper"
+    assert detail["instructions"].startswith("# ns/git-helper")
+    assert count(config=cfg) == 2
+
+
+def test_filters_apply_to_every_read_path(make_config, write_skill):
+    cfg = make_config(index_backend="memory", enabled_namespaces=["ns"])
+    write_skill(cfg.skills_dir, "pdf-tools", "pdf tools")
+    write_skill(cfg.skills_dir, "ns/pdf-merge", "merge pdf files")
+    build_index(config=cfg, force=True)
+
+    assert [h["id"] for h in search("pdf", limit=5, config=cfg)] == ["ns/pdf-merge"]
+    assert [r["id"] for r in list_all(limit=10, config=cfg)] == ["ns/pdf-merge"]
+    assert count(config=cfg) == 1
+
+
+def test_incremental_update(make_config, write_skill):
+    cfg = make_config(index_backend="memory")
+    write_skill(cfg.skills_dir, "alpha", "alpha skill")
+    write_skill(cfg.skills_dir, "beta", "beta skill")
+    build_index(config=cfg, force=True)
+
+    write_skill(cfg.skills_dir, "alpha", "alpha skill, edited")
+    (cfg.skills_dir / "beta" / "SKILL.md").unlink()
+    result = build_index(config=cfg)
+
+    assert result.message == "hash_changed"
+    assert result.skill_count == 1
+    assert get_by_id("alpha", config=cfg)["description"] == "alpha skill, edited"
+    assert get_by_id("beta", config=cfg) is None
+
+
+def test_memory_backend_does_not_import_lancedb(make_config, write_skill):
+    cfg = make_config(index_backend="memory")
+    write_skill(cfg.skills_dir, "alpha", "alpha skill")
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from skillport.shared.config import Config\n"
+        "from skillport.modules.indexing import build_index, search\n"
+        f"cfg = Config(skills_dir=Path({str(cfg.skills_dir)!r}),"
+        f" db_path=Path({str(cfg.db_path)!r}), index_backend='memory')\n"
+        "build_index(config=cfg, force=True)\n"
+        "assert search('alpha', limit=5, config=cfg)\n"
+        "assert 'lancedb' not in sys.modules, 'lancedb imported'\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
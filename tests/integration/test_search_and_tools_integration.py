@@ -14,6 +14,7 @@ class DummyTable:
         self.data = data
         self.fail_fts = fail_fts
         self._limit = None
+        self._columns = None
         self.filter_fn = lambda row: True
 
     def search(self, *args, **kwargs):
@@ -58,10 +59,19 @@ class DummyTable:
         self._limit = n
         return self
 
+    def select(self, columns: list[str]):
+        self._columns = columns
+        return self
+
     def to_list(self):
         rows = [r for r in self.data if self.filter_fn(r)]
         if self._limit is not None:
             rows = rows[: self._limit]
+        if self._columns is not None:
+            rows = [
+                {k: v for k, v in r.items() if k in self._columns or k.startswith("_")}
+                for r in rows
+            ]
         return rows
 
     # Index creation stubs
@@ -0,0 +1,150 @@
+"""search_skills against a real index: projection, prefilter parity and totals."""
+
+from pathlib import Path
+
+import pytest
+
+from skillport.modules.indexing import build_index, get_by_id, get_many, list_all
+from skillport.modules.indexing import search as idx_search
+from skillport.modules.indexing.public import query as query_module
+from skillport.modules.skills import load_skill, load_skills, search_skills
+from skillport.shared.config import Config
+from skillport.shared.exceptions import SkillNotFoundError
+from skillport.shared.filters import is_skill_enabled
+
+SKILL_IDS = ["alpha", "beta", "tools/Lint_Check", "tools/format", "web/fetch"]
+
+
+@pytest.fixture
+def skills_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "skills"
+    for skill_id in SKILL_IDS:
+        skill_dir = root / skill_id
+        skill_dir.mkdir(parents=True)
+        category = skill_id.split("/")[0] if "/" in skill_id else "misc"
+        (skill_dir / "SKILL.md").write_text(
+            f"""---
+name: {skill_id.split("/")[-1]}
+description: helper skill {skill_id}
+metadata:
+  skillport:
+    category: {category}
+---
+{"long instructions " * 200}
+""",
+            encoding="utf-8",
+        )
+    return root
+
+
+def _config(tmp_path: Path, skills_dir: Path, **filters) -> Config:
+    cfg = Config(skills_dir=skills_dir, db_path=tmp_path / "db.lancedb", **filters)
+    build_index(config=cfg, force=True)
+    return cfg
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"enabled_skills": ["lint_check", "ALPHA"]},
+        {"enabled_namespaces": ["tools/"]},
+        {"enabled_namespaces": ["/"]},
+        {"enabled_categories": ["Web"]},
+    ],
+)
+def test_list_all_total_matches_python_filter(tmp_path, skills_dir, filters):
+    cfg = _config(tmp_path, skills_dir, **filters)
+    expected = sorted(
+        s
+        for s in SKILL_IDS
+        if is_skill_enabled(s, s.split("/")[0] if "/" in s else "misc", config=cfg)
+    )
+
+    result = search_skills("", limit=2, config=cfg)
+
+    assert result.total == len(expected)
+    assert len(result.skills) == min(2, len(expected))
+    assert {s.id for s in result.skills} <= set(expected)
+
+
+def test_search_and_list_use_summary_view(tmp_path, skills_dir):
+    cfg = _config(tmp_path, skills_dir)
+
+    for rows in (idx_search("helper", limit=10, config=cfg), list_all(limit=10, config=cfg)):
+        assert len(rows) == len(SKILL_IDS)
+        assert all("instructions" not in r and "metadata" not in r for r in rows)
+        assert all("vector" not in r for r in rows)
+    assert search_skills("helper", limit=2, config=cfg).total == len(SKILL_IDS)
+
+
+@pytest.mark.parametrize("backend", ["lancedb", "memory"])
+def test_query_search_fetches_only_the_page(tmp_path, skills_dir, monkeypatch, backend):
+    cfg = _config(
+        tmp_path, skills_dir, index_backend=backend, enabled_namespaces=["tools/", "web/"]
+    )
+    store = query_module._store(cfg)
+    limits = []
+    real_search = store.search
+    monkeypatch.setattr(
+        store,
+        "search",
+        lambda q, *, limit, **kwargs: limits.append(limit) or real_search(q, limit=limit, **kwargs),
+    )
+
+    result = search_skills("helper", limit=2, config=cfg)
+
+    assert limits == [2]
+    assert len(result.skills) == 2
+    assert result.total == 3
+    assert search_skills("zzzzqqq", limit=2, config=cfg).total == 0
+
+
+def test_get_by_id_detail_view_loads_instructions(tmp_path, skills_dir):
+    cfg = _config(tmp_path, skills_dir)
+
+    detail = get_by_id("alpha", config=cfg)
+    summary = get_by_id("alpha", config=cfg, view="summary")
+
+    assert "long instructions" in detail["instructions"]
+    assert "metadata" in detail and "vector" not in detail
+    assert "instructions" not in summary
+    assert summary["path"] == detail["path"]
+
+
+@pytest.mark.parametrize("mode", ["hybrid", "fallback"])
+def test_local_embeddings_drive_vector_search(tmp_path, skills_dir, mode):
+    cfg = _config(tmp_path, skills_dir, embedding_provider="local", search_mode=mode)
+
+    rows = idx_search("web fetch", limit=3, config=cfg)
+    result = search_skills("web fetch", limit=3, config=cfg)
+
+    assert rows[0]["id"] == "web/fetch"
+    assert rows[0]["_source"] in {"vector", "hybrid"}
+    assert all(r["_score"] >= 0 for r in rows)
+    assert result.skills[0].id == "web/fetch"
+
+
+def test_get_many_resolves_ids_and_unique_names(tmp_path, skills_dir):
+    cfg = _config(tmp_path, skills_dir)
+
+    rows = get_many(["web/fetch", "format", "alpha", "missing", "alpha"], config=cfg)
+
+    assert {k: r["id"] for k, r in rows.items()} == {
+        "web/fetch": "web/fetch",
+        "format": "tools/format",
+        "alpha": "alpha",
+    }
+    assert "long instructions" in rows["alpha"]["instructions"]
+    assert "instructions" not in get_many(["alpha"], config=cfg, view="summary")["alpha"]
+
+
+def test_load_skills_matches_load_skill(tmp_path, skills_dir):
+    cfg = _config(tmp_path, skills_dir, enabled_namespaces=["tools/"])
+
+    results = load_skills(["tools/format", "alpha", "Lint_Check", "nope"], config=cfg)
+
+    assert results[0] == load_skill("tools/format", config=cfg)
+    assert isinstance(results[1], SkillNotFoundError)  # filtered out by namespace
+    assert results[2].id == "tools/Lint_Check"
+    assert isinstance(results[3], SkillNotFoundError)
@@ -0,0 +1,36 @@
+"""Filesystem catalog search and core skills (index-free fallbacks)."""
+
+from skillport.modules.skills.public.catalog import get_core_skills_fs, search_skills_fs
+
+
+def test_search_ranks_by_matched_words(make_config, write_skill):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "pdf-tools", "Extract text from PDF files")
+    write_skill(cfg.skills_dir, "ns/report", "Write reports and export text")
+    write_skill(cfg.skills_dir, "git-helper", "Commit messages")
+
+    result = search_skills_fs("pdf text", config=cfg)
+
+    assert [(s.id, s.score) for s in result.skills] == [("pdf-tools", 1.0), ("ns/report", 0.5)]
+    assert result.total == 2
+
+
+def test_empty_query_lists_enabled_skills(make_config, write_skill):
+    cfg = make_config(enabled_namespaces=["ns"])
+    write_skill(cfg.skills_dir, "a", "first")
+    write_skill(cfg.skills_dir, "ns/b", "second")
+
+    result = search_skills_fs("*", config=cfg)
+
+    assert [s.id for s in result.skills] == ["ns/b"]
+
+
+def test_core_skills_follow_mode(make_config, write_skill):
+    cfg = make_config()
+    write_skill(cfg.skills_dir, "always", "core", alwaysApply=True)
+    write_skill(cfg.skills_dir, "other", "not core")
+
+    assert [r["id"] for r in get_core_skills_fs(config=cfg)] == ["always"]
+    explicit = cfg.with_overrides(core_skills_mode="explicit", core_skills=["other", "missing"])
+    assert [r["id"] for r in get_core_skills_fs(config=explicit)] == ["other"]
+    assert get_core_skills_fs(config=cfg.with_overrides(core_skills_mode="none")) == []
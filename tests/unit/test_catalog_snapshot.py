@@ -0,0 +1,129 @@
+"""Persistent filesystem catalog snapshot (skills/internal/catalog_snapshot.py)."""
+
+import json
+import os
+
+import pytest
+
+from skillport.modules.skills.internal import catalog_snapshot
+from skillport.modules.skills.internal.catalog_snapshot import (
+    clear_catalog_memo,
+    load_catalog,
+    snapshot_path_for,
+)
+from skillport.modules.skills.public.catalog import get_core_skills_fs, list_skills_fs
+from skillport.shared.config import Config
+
+
+def _skill(root, skill_id, description="d", extra=""):
+    skill_dir = root / skill_id
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {skill_dir.name}\ndescription: {description}\n{extra}---\nbody\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def env(tmp_path):
+    skills = tmp_path / "skills"
+    _skill(skills, "alpha")
+    _skill(
+        skills,
+        "team/beta",
+        extra="metadata:\n  skillport:\n    category: Dev\n    tags: [A, b]\n    alwaysApply: true\n",
+    )
+    clear_catalog_memo()
+    yield skills, snapshot_path_for(tmp_path / "meta", skills)
+    clear_catalog_memo()
+
+
+def _parses(monkeypatch):
+    parsed = []
+    real = catalog_snapshot.read_frontmatter
+    monkeypatch.setattr(
+        catalog_snapshot, "read_frontmatter", lambda path: parsed.append(path) or real(path)
+    )
+    return parsed
+
+
+def test_entries_carry_catalog_fields(env):
+    skills, snapshot = env
+
+    beta = load_catalog(skills, snapshot)[1]
+
+    assert (beta.id, beta.category, beta.tags, beta.always_apply) == (
+        "team/beta",
+        "dev",
+        ("a", "b"),
+        True,
+    )
+    assert snapshot.exists()
+
+
+def test_unchanged_catalog_is_not_reparsed_across_processes(env, monkeypatch):
+    skills, snapshot = env
+    first = load_catalog(skills, snapshot)
+    clear_catalog_memo()  # as if a new CLI process started
+    parsed = _parses(monkeypatch)
+
+    assert load_catalog(skills, snapshot) == first
+    assert parsed == []
+
+
+def test_only_changed_skills_are_reparsed(env, monkeypatch):
+    skills, snapshot = env
+    load_catalog(skills, snapshot)
+    _skill(skills, "alpha", description="edited description")
+    os.utime(skills / "alpha" / "SKILL.md", ns=(1, 1))
+    _skill(skills, "gamma")
+    parsed = _parses(monkeypatch)
+
+    entries = load_catalog(skills, snapshot)
+
+    assert [e.id for e in entries] == ["alpha", "gamma", "team/beta"]
+    assert entries[0].description == "edited description"
+    assert sorted(p.parent.name for p in parsed) == ["alpha", "gamma"]
+
+
+def test_removed_skill_is_dropped_from_file(env):
+    skills, snapshot = env
+    load_catalog(skills, snapshot)
+    (skills / "alpha" / "SKILL.md").unlink()
+    load_catalog(skills, snapshot)
+    clear_catalog_memo()
+
+    assert [e.id for e in load_catalog(skills, snapshot)] == ["team/beta"]
+    assert "alpha" not in snapshot.read_text(encoding="utf-8")
+
+
+def test_corrupt_snapshot_is_rebuilt(env, capsys):
+    skills, snapshot = env
+    snapshot.parent.mkdir(parents=True)
+    header = json.dumps({"format": 1, "skills_dir": str(skills)})
+    snapshot.write_text(f"{header}\nnot json\n", encoding="utf-8")
+
+    assert [e.id for e in load_catalog(skills, snapshot)] == ["alpha", "team/beta"]
+    assert "Ignoring catalog snapshot" in capsys.readouterr().err
+
+
+def test_config_driven_catalog_uses_meta_dir(env, tmp_path):
+    skills, snapshot = env
+    config = Config(skills_dir=skills, db_path=tmp_path / "db.lancedb", meta_dir=tmp_path / "meta")
+
+    assert [s.id for s in list_skills_fs(config=config).skills] == ["alpha", "team/beta"]
+    assert [row["id"] for row in get_core_skills_fs(config=config)] == ["team/beta"]
+    assert snapshot.exists()
+
+
+def test_snapshot_can_be_disabled(env, tmp_path):
+    skills, _snapshot = env
+    config = Config(
+        skills_dir=skills,
+        db_path=tmp_path / "db.lancedb",
+        meta_dir=tmp_path / "meta",
+        catalog_snapshot=False,
+    )
+
+    assert len(list_skills_fs(config=config).skills) == 2
+    assert not (tmp_path / "meta").exists()
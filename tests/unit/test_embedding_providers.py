@@ -0,0 +1,250 @@
+"""Embedding provider registry: entry-point plugins, batching and the async path."""
+
+import asyncio
+import importlib.metadata
+import threading
+
+import pytest
+
+from skillport.modules.indexing.internal import embeddings, providers
+from skillport.modules.indexing.internal.state import embedding_signature
+from skillport.shared.config import EMBEDDING_PROVIDER_GROUP
+
+
+class FakeProvider(providers.EmbeddingProvider):
+    max_batch_size = 2
+    in_flight = 0
+    peak = 0
+    calls: list[list[str]] = []
+
+    @property
+    def model(self) -> str:
+        return "fake-model"
+
+    @property
+    def dimensions(self) -> int:
+        return 2
+
+    def signature(self):
+        return {**super().signature(), "embedding_normalized": True}
+
+    def embed_batch(self, texts):
+        FakeProvider.calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+    async def aembed_batch(self, texts):
+        FakeProvider.in_flight += 1
+        FakeProvider.peak = max(FakeProvider.peak, FakeProvider.in_flight)
+        await asyncio.sleep(0.01)
+        FakeProvider.in_flight -= 1
+        return self.embed_batch(texts)
+
+
+class NotAProvider:
+    pass
+
+
+class IncompleteProvider(providers.EmbeddingProvider):
+    pass
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    registered = {
+        "fake": f"{__name__}:FakeProvider",
+        "broken": f"{__name__}:NotAProvider",
+        "incomplete": f"{__name__}:IncompleteProvider",
+    }
+
+    def entry_points(group=None, **kwargs):
+        if group != EMBEDDING_PROVIDER_GROUP:
+            return []
+        return [
+            importlib.metadata.EntryPoint(name=name, value=value, group=group)
+            for name, value in registered.items()
+        ]
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+    providers.provider_class.cache_clear()
+    FakeProvider.calls = []
+    FakeProvider.peak = 0
+    yield
+    providers.provider_class.cache_clear()
+
+
+def test_plugin_is_selectable_by_name(make_config, plugins):
+    cfg = make_config(embedding_provider=" Fake ", embedding_cache_size=0)
+
+    assert cfg.embedding_provider == "fake"
+    assert isinstance(providers.get_provider(cfg), FakeProvider)
+    assert providers.get_provider(make_config()) is None
+
+
+def test_batches_follow_provider_max_batch_size(make_config, plugins):
+    cfg = make_config(embedding_provider="fake", embedding_cache_size=0)
+
+    vectors = embeddings.get_embeddings(["a", "bb", "ccc"], cfg)
+
+    assert vectors == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert sorted(len(c) for c in FakeProvider.calls) == [1, 2]
+
+
+def test_signature_includes_provider_extras(make_config, plugins):
+    signature = embedding_signature(make_config(embedding_provider="fake"))
+
+    assert signature == {
+        "embedding_provider": "fake",
+        "embedding_model": "fake-model",
+        "embedding_normalized": True,
+    }
+
+
+async def test_async_batches_run_concurrently_in_order(make_config, plugins, monkeypatch):
+    monkeypatch.setattr(embeddings, "EMBEDDING_MAX_CONCURRENCY", 3)
+    cfg = make_config(embedding_provider="fake")
+    texts = [f"text-{'x' * i}" for i in range(10)]
+
+    vectors = await embeddings.aget_embeddings(texts, cfg)
+
+    assert [v[0] for v in vectors] == [float(len(t)) for t in texts]
+    assert FakeProvider.peak == 3
+    # Second call is served from the embedding cache.
+    FakeProvider.calls = []
+    assert await embeddings.aget_embedding(texts[4], cfg) == vectors[4]
+    assert FakeProvider.calls == []
+
+
+def test_wrong_vector_length_is_rejected(make_config, plugins, monkeypatch):
+    monkeypatch.setattr(FakeProvider, "embed_batch", lambda self, texts: [[1.0] for _ in texts])
+    cfg = make_config(embedding_provider="fake", embedding_cache_size=0)
+
+    with pytest.raises(ValueError, match="length 2"):
+        embeddings.get_embeddings(["a"], cfg)
+
+
+def test_entry_point_must_subclass_provider(make_config, plugins):
+    with pytest.raises(TypeError, match="EmbeddingProvider"):
+        providers.get_provider(make_config(embedding_provider="broken"))
+
+
+def test_entry_point_must_implement_embed_batch(make_config, plugins):
+    with pytest.raises(TypeError, match="does not implement: embed_batch"):
+        providers.get_provider(make_config(embedding_provider="incomplete"))
+
+
+def test_openai_compatible_server_needs_no_key(make_config, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    cfg = make_config(embedding_provider="openai", openai_base_url="http://localhost:8080/v1")
+
+    provider = providers.get_provider(cfg)
+
+    assert isinstance(provider, embeddings.OpenAIEmbeddingProvider)
+    assert provider.signature()["embedding_model"] == cfg.openai_embedding_model
+
+
+def test_index_builds_against_a_keyless_openai_compatible_server(
+    make_config, write_skill, monkeypatch
+):
+    from types import SimpleNamespace
+
+    from skillport.modules.indexing import build_index
+
+    class Embeddings:
+        def create(self, input, model):
+            return SimpleNamespace(
+                data=[SimpleNamespace(index=i, embedding=[1.0, 0.0]) for i in range(len(input))]
+            )
+
+    clients = []
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(
+        embeddings,
+        "_openai_client",
+        lambda *args: clients.append(args) or SimpleNamespace(embeddings=Embeddings()),
+    )
+    cfg = make_config(
+        embedding_provider="openai",
+        openai_base_url="http://localhost:8080/v1",
+        embedding_cache_size=0,
+    )
+    write_skill(cfg.skills_dir, "alpha")
+
+    result = build_index(config=cfg, force=True)
+
+    assert result.success, result.message
+    assert result.skill_count == 1
+    assert clients == [("unused", "http://localhost:8080/v1")]
+
+
+class _EmptyTable:
+    def search(self, *args, **kwargs):
+        return self
+
+    def distance_type(self, _metric):
+        return self
+
+    def limit(self, _n):
+        return self
+
+    def to_list(self):
+        return []
+
+
+@pytest.fixture
+def async_only_openai(monkeypatch):
+    from types import SimpleNamespace
+
+    class AsyncEmbeddings:
+        async def create(self, input, model):
+            return SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[0.5, 0.5])])
+
+    def sync_client(*args):
+        raise AssertionError("the query was embedded again on the sync client")
+
+    monkeypatch.setattr(
+        embeddings, "_async_openai_client", lambda *a: SimpleNamespace(embeddings=AsyncEmbeddings())
+    )
+    monkeypatch.setattr(embeddings, "_openai_client", sync_client)
+
+
+@pytest.mark.parametrize("cache_size", [0, 100])
+async def test_query_vector_from_async_client_is_reused(make_config, async_only_openai, cache_size):
+    from skillport.modules.indexing import aembed_query
+    from skillport.modules.indexing.internal.search_service import SearchService
+
+    cfg = make_config(
+        embedding_provider="openai",
+        openai_api_key="sk-test",
+        embedding_cache_size=cache_size,
+    )
+    vector = await aembed_query("  pdf   tools ", config=cfg)
+    embedded = []
+    service = SearchService(search_threshold=0.0, embed_fn=embedded.append)
+
+    assert vector == [0.5, 0.5]
+    service.search(
+        _EmptyTable(), "pdf tools", limit=5, prefilter="", normalize_query=str, query_vector=vector
+    )
+    assert embedded == []
+
+
+async def test_async_embedding_keeps_cache_io_off_the_event_loop(
+    make_config, async_only_openai, monkeypatch
+):
+    from skillport.modules.indexing.internal.embedding_cache import EmbeddingCache
+
+    loop_thread = threading.get_ident()
+    threads = []
+    for name in ("get_many", "put_many"):
+        real = getattr(EmbeddingCache, name)
+
+        def spy(self, arg, _real=real):
+            threads.append(threading.get_ident())
+            return _real(self, arg)
+
+        monkeypatch.setattr(EmbeddingCache, name, spy)
+    cfg = make_config(embedding_provider="openai", openai_api_key="sk-test")
+
+    assert await embeddings.aget_embedding("pdf tools", cfg) == [0.5, 0.5]
+    assert len(threads) == 2
+    assert loop_thread not in threads
@@ -0,0 +1,151 @@
+"""Unit tests for the batched embedding pipeline."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from skillport.modules.indexing.internal import embedding_cache, embeddings
+from skillport.shared.config import Config
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeEmbeddingsAPI:
+    def __init__(self, fail_first: int = 0):
+        self.calls: list[list[str]] = []
+        self.fail_first = fail_first
+        self.fail_status = 429
+
+    def create(self, input, model):
+        self.calls.append(list(input))
+        if self.fail_first:
+            self.fail_first -= 1
+            raise StatusError(self.fail_status)
+        data = [SimpleNamespace(index=i, embedding=[float(len(t))]) for i, t in enumerate(input)]
+        # Providers may return items out of order; results must follow `index`.
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+@pytest.fixture
+def openai_config(tmp_path) -> Config:
+    return Config(
+        skills_dir=tmp_path / "skills",
+        db_path=tmp_path / "db.lancedb",
+        embedding_provider="openai",
+        openai_api_key="sk-test",
+    )
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    api = FakeEmbeddingsAPI()
+    monkeypatch.setattr(embeddings, "_openai_client", lambda *args: SimpleNamespace(embeddings=api))
+    monkeypatch.setattr(embeddings, "EMBEDDING_RETRY_BASE_DELAY", 0.0)
+    return api
+
+
+def test_none_provider_returns_none(tmp_path):
+    cfg = Config(skills_dir=tmp_path / "skills", db_path=tmp_path / "db.lancedb")
+    assert embeddings.get_embeddings(["a"], cfg) is None
+    assert embeddings.get_embedding("a", cfg) is None
+
+
+def test_batches_preserve_input_order(openai_config, fake_api, monkeypatch):
+    monkeypatch.setattr(embeddings, "EMBEDDING_BATCH_SIZE", 2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    vectors = embeddings.get_embeddings(texts, openai_config)
+
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(len(c) for c in fake_api.calls) == [1, 2, 2]
+
+
+def test_failed_batch_is_retried(openai_config, fake_api):
+    fake_api.fail_first = 2
+    assert embeddings.get_embedding("line\nbreak", openai_config) == [10.0]
+    assert fake_api.calls[-1] == ["line break"]
+    assert len(fake_api.calls) == 3
+
+
+def test_retries_exhausted_raises(openai_config, fake_api):
+    fake_api.fail_first = embeddings.EMBEDDING_MAX_ATTEMPTS
+    with pytest.raises(StatusError, match="HTTP 429"):
+        embeddings.get_embeddings(["a"], openai_config)
+
+
+@pytest.mark.parametrize("status", [400, 401, 404])
+def test_permanent_errors_are_not_retried(openai_config, fake_api, status):
+    fake_api.fail_first = 1
+    fake_api.fail_status = status
+
+    with pytest.raises(StatusError):
+        embeddings.get_embeddings(["a"], openai_config)
+    assert len(fake_api.calls) == 1
+
+
+def test_transient_errors_are_recognized(openai_config):
+    from openai import APITimeoutError
+
+    provider = embeddings.OpenAIEmbeddingProvider(openai_config)
+
+    assert provider.is_transient(StatusError(503))
+    assert provider.is_transient(ConnectionResetError())
+    assert provider.is_transient(APITimeoutError(request=None))
+    assert not provider.is_transient(StatusError(401))
+    assert not provider.is_transient(ValueError("bad input"))
+
+
+def test_cache_hit_skips_provider(openai_config, fake_api):
+    first = embeddings.get_embeddings(["hello  world", "again"], openai_config)
+    second = embeddings.get_embeddings(["again", "hello world", "new"], openai_config)
+
+    assert second == [first[1], first[0], [3.0]]
+    assert fake_api.calls == [["hello world", "again"], ["new"]]
+
+
+def test_cache_disabled_always_calls_provider(openai_config, fake_api):
+    cfg = openai_config.with_overrides(embedding_cache_size=0)
+    embeddings.get_embedding("same", cfg)
+    embeddings.get_embedding("same", cfg)
+    assert len(fake_api.calls) == 2
+
+
+def test_cache_persists_and_evicts_least_recently_used(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = embeddings.EmbeddingCache(path, max_entries=2, memory_entries=0)
+    cache.put_many({"a": [1.0]})
+    cache.put_many({"b": [2.0]})
+    assert cache.get_many(["a"]) == {"a": [1.0]}  # refreshes "a"
+    cache.put_many({"c": [3.0]})
+
+    reopened = embeddings.EmbeddingCache(path, max_entries=2)
+    assert len(reopened) == 2
+    assert set(reopened.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+def test_cache_is_keyed_by_endpoint(openai_config, fake_api):
+    local = openai_config.with_overrides(openai_base_url="http://localhost:8080/v1")
+
+    embeddings.get_embedding("same", openai_config)
+    embeddings.get_embedding("same", local)
+    embeddings.get_embedding("same", local)
+
+    assert len(fake_api.calls) == 2
+
+
+def test_memory_hits_keep_entries_fresh_on_disk(tmp_path, monkeypatch):
+    clock = iter(range(1, 100))
+    monkeypatch.setattr(embedding_cache, "time", SimpleNamespace(time=lambda: next(clock)))
+    path = tmp_path / "cache.sqlite"
+    cache = embeddings.EmbeddingCache(path, max_entries=2, memory_entries=2)
+    cache.put_many({"a": [1.0]})
+    cache.put_many({"b": [2.0]})
+    assert cache.get_many(["a"]) == {"a": [1.0]}  # served from memory
+    cache.put_many({"c": [3.0]})
+
+    reopened = embeddings.EmbeddingCache(path, max_entries=2)
+    assert set(reopened.get_many(["a", "b", "c"])) == {"a", "c"}
@@ -0,0 +1,92 @@
+"""read_skill_file payload cache and ETag validation."""
+
+import pytest
+
+from skillport.modules.skills.internal.file_cache import FileCache, etag_matches
+from skillport.modules.skills.public import read
+from skillport.modules.skills.public.read import read_file_in_skill_dir
+
+
+def test_repeat_read_is_served_from_cache(tmp_path, make_config, monkeypatch):
+    (tmp_path / "tpl.yaml").write_text("key: value\n", encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path)
+    first = read_file_in_skill_dir(tmp_path, "tpl.yaml", config=cfg)
+
+    def fail(*args):
+        raise AssertionError("cached payload should not re-open the file")
+
+    monkeypatch.setattr(read, "_open_view", fail)
+    second = read_file_in_skill_dir(tmp_path, "tpl.yaml", config=cfg)
+
+    assert second == first
+    assert first.etag and not first.not_modified
+
+
+def test_if_none_match_returns_not_modified(tmp_path, make_config):
+    (tmp_path / "tpl.yaml").write_text("key: value\n", encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path)
+    etag = read_file_in_skill_dir(tmp_path, "tpl.yaml", config=cfg).etag
+
+    result = read_file_in_skill_dir(tmp_path, "tpl.yaml", config=cfg, if_none_match=f'"{etag}"')
+
+    assert result.not_modified
+    assert (result.content, result.etag) == ("", etag)
+
+
+def test_changed_file_gets_new_etag_and_content(tmp_path, make_config):
+    target = tmp_path / "tpl.yaml"
+    target.write_text("key: value\n", encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path)
+    old = read_file_in_skill_dir(tmp_path, "tpl.yaml", config=cfg)
+
+    target.write_text("key: other value\n", encoding="utf-8")
+    new = read_file_in_skill_dir(tmp_path, "tpl.yaml", config=cfg, if_none_match=old.etag)
+
+    assert not new.not_modified
+    assert new.content == "key: other value\n"
+    assert new.etag != old.etag
+
+
+def test_disabled_cache_still_validates(tmp_path, make_config, monkeypatch):
+    (tmp_path / "blob.bin").write_bytes(b"\x00\x01\x02")
+    cfg = make_config(skills_dir=tmp_path, file_cache_bytes=0)
+    first = read_file_in_skill_dir(tmp_path, "blob.bin", config=cfg)
+
+    assert read_file_in_skill_dir(
+        tmp_path, "blob.bin", config=cfg, if_none_match=first.etag
+    ).not_modified
+    # The ETag memo answers without touching the file; payloads are not cached.
+    monkeypatch.setattr(read, "_open_view", lambda *args: pytest.fail("file was re-opened"))
+    assert read_file_in_skill_dir(
+        tmp_path, "blob.bin", config=cfg, if_none_match=first.etag
+    ).not_modified
+
+
+def test_lru_is_bounded_by_payload_bytes():
+    cache = FileCache(max_bytes=10)
+    cache.put("a", "aaaa", 4)
+    cache.put("b", "bbbb", 4)
+    cache.get("a")
+    cache.put("c", "cccc", 4)
+    cache.put("huge", "x" * 11, 11)
+
+    assert cache.get("a") == "aaaa"
+    assert cache.get("b") is None
+    assert cache.get("huge") is None
+    assert cache.size_bytes == 8
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("abc", True),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"x", "abc"', True),
+        ("*", True),
+        ("abd", False),
+        (None, False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, "abc") is expected
@@ -0,0 +1,160 @@
+"""Frontmatter parsing: header-only reads, lazily loaded bodies and the stat-keyed cache."""
+
+import os
+
+import pytest
+
+from skillport.shared import frontmatter
+from skillport.shared.frontmatter import (
+    clear_frontmatter_cache,
+    load_frontmatter_cache,
+    save_frontmatter_cache,
+    split_frontmatter,
+)
+from skillport.shared.utils import parse_frontmatter, read_frontmatter
+
+CASES = {
+    "standard": "---\nname: a\ndescription: d\n---\n\n# Body\ntext\n",
+    "dashes_in_value": "---\nname: a\ndescription: before --- after\n---\nbody\n",
+    "crlf": "---\r\nname: a\r\n---\r\nbody\r\n",
+    "no_frontmatter": "# Just markdown\n---\nnot: meta\n",
+    "unclosed": "---\nname: a\nbody without closing delimiter\n",
+    "invalid_yaml": "---\nname: [unclosed\n---\nbody\n",
+    "not_a_mapping": "---\n- a\n- b\n---\nbody\n",
+    "empty_header": "---\n---\nbody\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_header_parser_matches_full_parse(tmp_path, name):
+    path = tmp_path / "SKILL.md"
+    path.write_bytes(CASES[name].encode("utf-8"))
+
+    meta, body = parse_frontmatter(path)
+    header = read_frontmatter(path)
+
+    assert header.meta == meta
+    assert header.body == body
+    assert split_frontmatter(CASES[name].encode("utf-8")) == (meta, body)
+
+
+def test_values(tmp_path):
+    path = tmp_path / "SKILL.md"
+    for name, expected_meta, expected_body in [
+        ("standard", {"name": "a", "description": "d"}, "# Body\ntext\n"),
+        ("dashes_in_value", {"name": "a", "description": "before --- after"}, "body\n"),
+        ("no_frontmatter", {}, CASES["no_frontmatter"]),
+        ("unclosed", {}, CASES["unclosed"]),
+        ("invalid_yaml", {}, "body\n"),
+        ("crlf", {"name": "a"}, "body\n"),
+    ]:
+        path.write_bytes(CASES[name].encode("utf-8"))
+        assert parse_frontmatter(path) == (expected_meta, expected_body), name
+
+
+def test_crlf_body_uses_unix_newlines(tmp_path):
+    path = tmp_path / "SKILL.md"
+    path.write_bytes(b"---\r\nname: a\r\n---\r\n\r\nline1\r\nline2\rline3\r\n")
+
+    assert read_frontmatter(path).body == "line1\nline2\nline3\n"
+    assert split_frontmatter(b"# Title\r\ntext\r\n") == ({}, "# Title\ntext\n")
+
+
+def test_header_read_stops_at_closing_delimiter(tmp_path):
+    path = tmp_path / "SKILL.md"
+    # The body is not valid UTF-8: only a full read would notice.
+    path.write_bytes(b"---\nname: a\n---\n" + b"\xff" * 100_000)
+
+    header = read_frontmatter(path)
+
+    assert header.meta == {"name": "a"}
+    with pytest.raises(UnicodeDecodeError):
+        header.body
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_frontmatter(tmp_path / "missing.md")
+
+
+def test_repeat_parses_hit_the_cache(tmp_path, monkeypatch):
+    path = tmp_path / "SKILL.md"
+    path.write_text(CASES["standard"], encoding="utf-8")
+    clear_frontmatter_cache()
+    first = parse_frontmatter(path)
+
+    def fail(header):
+        raise AssertionError("frontmatter was parsed again")
+
+    monkeypatch.setattr(frontmatter, "_load_meta", fail)
+
+    assert parse_frontmatter(path) == first
+    assert read_frontmatter(path).meta == first[0]
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    path = tmp_path / "SKILL.md"
+    path.write_text("---\nname: a\n---\nbody\n", encoding="utf-8")
+    assert read_frontmatter(path).meta == {"name": "a"}
+
+    path.write_text("---\nname: bb\n---\nbody\n", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+
+    assert read_frontmatter(path).meta == {"name": "bb"}
+
+
+def test_cached_metadata_is_not_shared(tmp_path):
+    path = tmp_path / "SKILL.md"
+    path.write_text("---\nmetadata:\n  tags: [a]\n---\nbody\n", encoding="utf-8")
+
+    read_frontmatter(path).meta["metadata"]["tags"].append("b")
+
+    assert parse_frontmatter(path)[0] == {"metadata": {"tags": ["a"]}}
+
+
+def test_disk_cache_round_trip(tmp_path, monkeypatch):
+    plain = tmp_path / "plain.md"
+    plain.write_text(CASES["standard"], encoding="utf-8")
+    dated = tmp_path / "dated.md"
+    dated.write_text("---\ncreated: 2024-01-01\n---\nbody\n", encoding="utf-8")
+    cache_file = tmp_path / "meta" / "frontmatter_cache.json"
+    clear_frontmatter_cache()
+    read_frontmatter(plain)
+    read_frontmatter(dated)
+    save_frontmatter_cache(cache_file)
+
+    clear_frontmatter_cache()
+    load_frontmatter_cache(cache_file)
+    parsed = []
+    real_load_meta = frontmatter._load_meta
+    monkeypatch.setattr(
+        frontmatter, "_load_meta", lambda header: parsed.append(header) or real_load_meta(header)
+    )
+
+    assert parse_frontmatter(plain) == ({"name": "a", "description": "d"}, "# Body\ntext\n")
+    assert parsed == []
+    # Dates do not survive JSON, so that entry was not persisted and is parsed again.
+    assert str(read_frontmatter(dated).meta["created"]) == "2024-01-01"
+    assert len(parsed) == 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"format": 1, "entries": [["a", 1]]}',
+        '{"format": 1, "entries": [["a", 1, 2, 3, "not a dict"]]}',
+        '{"format": 1, "entries": 5}',
+        "not json",
+    ],
+)
+def test_corrupt_disk_cache_is_ignored(tmp_path, capsys, content):
+    path = tmp_path / "SKILL.md"
+    path.write_text(CASES["standard"], encoding="utf-8")
+    cache_file = tmp_path / "frontmatter_cache.json"
+    cache_file.write_text(content, encoding="utf-8")
+    clear_frontmatter_cache()
+
+    load_frontmatter_cache(cache_file)
+
+    assert "Ignoring frontmatter cache" in capsys.readouterr().err
+    assert parse_frontmatter(path)[0] == {"name": "a", "description": "d"}
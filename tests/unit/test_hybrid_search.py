@@ -0,0 +1,234 @@
+"""Hybrid (vector + FTS) search with reciprocal rank fusion."""
+
+import threading
+
+import pytest
+
+from skillport.modules.indexing.internal import search_service
+from skillport.modules.indexing.internal.search_service import RRF_K, SearchService
+
+
+class _Query:
+    def __init__(self, rows):
+        self.rows = rows
+        self._limit = None
+
+    def where(self, *_args, **_kwargs):
+        return self
+
+    def distance_type(self, _metric):
+        return self
+
+    def select(self, _columns):
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def to_list(self):
+        return list(self.rows[: self._limit])
+
+
+class RankedTable:
+    """Returns a fresh builder per search so concurrent queries don't share state."""
+
+    def __init__(self, vector_rows, fts_rows, *, fail_fts=False):
+        self.vector_rows = vector_rows
+        self.fts_rows = fts_rows
+        self.fail_fts = fail_fts
+        self.threads: dict[str, str] = {}
+
+    def search(self, query=None, query_type=None):
+        if query_type == "fts":
+            self.threads["fts"] = threading.current_thread().name
+            if self.fail_fts:
+                raise RuntimeError("fts failure")
+            return _Query(self.fts_rows)
+        if isinstance(query, list):
+            self.threads["vector"] = threading.current_thread().name
+            return _Query(self.vector_rows)
+        return _Query(self.vector_rows + self.fts_rows)
+
+
+def _service(vec=(0.1, 0.2), mode="hybrid"):
+    return SearchService(
+        search_threshold=0.0, embed_fn=lambda q: list(vec) if vec else None, mode=mode
+    )
+
+
+def _run(service, table, limit=5):
+    return service.search(table, "pdf", limit=limit, prefilter="", normalize_query=lambda q: q)
+
+
+def test_rows_found_by_both_sources_rank_first():
+    table = RankedTable(
+        vector_rows=[
+            {"id": "a", "_distance": 0.1},
+            {"id": "b", "_distance": 0.2},
+            {"id": "c", "_distance": 0.3},
+        ],
+        fts_rows=[{"id": "c", "_score": 9.0}, {"id": "d", "_score": 4.0}],
+    )
+
+    hits = _service()._hybrid_search(table, "pdf", "", 5, None)
+    results = _run(_service(), table)
+
+    assert max(hits, key=lambda h: h.score).score == 1 / (RRF_K + 3) + 1 / (RRF_K + 1)
+    assert [r["id"] for r in results][0] == "c"
+    assert results[0]["_source"] == "hybrid"
+    # Fused hits report similarity, not the RRF score they are ordered by.
+    assert {r["id"]: r["_score"] for r in results} == pytest.approx(
+        {"a": 0.9, "b": 0.8, "c": 0.7, "d": 4.0}
+    )
+
+
+def test_fts_runs_concurrently_with_vector_search():
+    table = RankedTable([{"id": "a", "_distance": 0.1}], [{"id": "a", "_score": 1.0}])
+    _run(_service(), table)
+    assert table.threads["fts"] != table.threads["vector"]
+
+
+def test_without_embeddings_hybrid_uses_fts_scores():
+    table = RankedTable([], [{"id": "x", "_score": 3.0}, {"id": "y", "_score": 1.0}])
+    results = _run(_service(vec=None), table)
+    assert [(r["id"], r["_source"], r["_score"]) for r in results] == [
+        ("x", "fts", 3.0),
+        ("y", "fts", 1.0),
+    ]
+
+
+def test_fts_failure_fuses_vector_with_substring_hits():
+    table = RankedTable(
+        vector_rows=[{"id": "a", "_distance": 0.1, "name": "PDF tools", "description": ""}],
+        fts_rows=[],
+        fail_fts=True,
+    )
+    results = _run(_service(), table)
+    assert [(r["id"], r["_source"]) for r in results] == [("a", "hybrid")]
+
+
+def test_fallback_mode_skips_fts_when_vector_succeeds():
+    table = RankedTable([{"id": "a", "_distance": 0.1}], [{"id": "b", "_score": 5.0}])
+    results = _run(_service(mode="fallback"), table)
+    assert [r["id"] for r in results] == ["a"]
+    assert "fts" not in table.threads
+
+
+def test_weak_matches_are_dropped_per_source_before_fusion():
+    # Cosine distance: 1 - cosine similarity.
+    table = RankedTable(
+        vector_rows=[
+            {"id": "a", "_distance": 0.1},  # cosine 0.9
+            {"id": "weak", "_distance": 0.9},  # cosine 0.1
+        ],
+        fts_rows=[{"id": "a", "_score": 10.0}, {"id": "weak", "_score": 1.0}],
+    )
+    service = SearchService(search_threshold=0.2, embed_fn=lambda q: [0.1, 0.2])
+
+    results = _run(service, table)
+
+    # RRF alone would keep "weak": it ranks second in both lists.
+    assert [r["id"] for r in results] == ["a"]
+
+
+def test_vector_hits_below_threshold_do_not_survive_without_fts_matches():
+    table = RankedTable(
+        vector_rows=[{"id": f"s{i}", "_distance": 1.9} for i in range(5)],
+        fts_rows=[],
+    )
+    service = SearchService(search_threshold=0.2, embed_fn=lambda q: [0.1, 0.2])
+
+    assert _run(service, table) == []
+
+
+def test_vector_scores_are_cosine_for_unnormalized_vectors(tmp_path):
+    import lancedb
+
+    table = lancedb.connect(tmp_path / "db").create_table(
+        "skills",
+        data=[{"id": "same", "vector": [3.0, 0.0]}, {"id": "orthogonal", "vector": [0.0, 0.5]}],
+    )
+    service = SearchService(search_threshold=0.2, embed_fn=lambda q: [2.0, 0.0])
+
+    hits = service._vector_search(table, [2.0, 0.0], "", 5, None)
+
+    assert [(h.row["id"], round(h.score, 6)) for h in hits] == [("same", 1.0)]
+
+
+def test_fallback_mode_keeps_weak_vector_hits():
+    table = RankedTable([{"id": "a", "_distance": 1.9}], [{"id": "b", "_score": 5.0}])
+    service = SearchService(search_threshold=0.2, embed_fn=lambda q: [0.1], mode="fallback")
+
+    assert [(r["id"], r["_source"]) for r in _run(service, table)] == [("a", "vector")]
+
+
+def _count(service, table):
+    return service.count(table, "pdf", prefilter="", normalize_query=lambda q: q)
+
+
+def test_count_follows_the_strategy_that_produced_the_results():
+    table = RankedTable(
+        vector_rows=[
+            {"id": "a", "_distance": 0.1},
+            {"id": "b", "_distance": 0.2},
+            {"id": "weak", "_distance": 0.9},
+        ],
+        fts_rows=[{"id": "b", "_score": 9.0}, {"id": "c", "_score": 8.0}],
+    )
+    hybrid = SearchService(search_threshold=0.2, embed_fn=lambda q: [0.1, 0.2])
+    fallback = SearchService(search_threshold=0.2, embed_fn=lambda q: [0.1], mode="fallback")
+
+    # Hybrid: thresholded vector hits fused with FTS hits.
+    assert _count(hybrid, table) == 3
+    # Fallback: vector search answered, so FTS-only matches are not counted.
+    assert _count(fallback, table) == 3
+    assert len(_run(fallback, table, limit=1)) == 1
+
+
+def test_count_uses_substring_matches_when_fts_fails():
+    rows = [{"id": f"s{i}", "name": "pdf tool", "description": ""} for i in range(4)]
+    table = RankedTable(vector_rows=rows, fts_rows=[], fail_fts=True)
+    service = _service(vec=None, mode="fallback")
+
+    assert len(_run(service, table, limit=2)) == 2
+    assert _count(service, table) == 4
+
+
+def test_page_and_count_embed_the_query_once():
+    calls = []
+    service = SearchService(search_threshold=0.0, embed_fn=lambda q: calls.append(q) or [0.1, 0.2])
+    table = RankedTable([{"id": "a", "_distance": 0.1}], [{"id": "a", "_score": 1.0}])
+
+    _run(service, table)
+    _count(service, table)
+
+    assert calls == ["pdf"]
+
+
+def test_concurrent_first_searches_share_one_pool(monkeypatch):
+    search_service.shutdown_search_pool()
+    created = []
+    real_executor = search_service.ThreadPoolExecutor
+
+    def counting(*args, **kwargs):
+        created.append(kwargs)
+        return real_executor(*args, **kwargs)
+
+    monkeypatch.setattr(search_service, "ThreadPoolExecutor", counting)
+    table = RankedTable([{"id": "a", "_distance": 0.1}], [{"id": "a", "_score": 1.0}])
+    barrier = threading.Barrier(8)
+
+    def first_search():
+        barrier.wait()
+        _run(_service(), table)
+
+    threads = [threading.Thread(target=first_search) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    search_service.shutdown_search_pool()
+    assert search_service._pool is None
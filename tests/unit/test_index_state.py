@@ -59,3 +59,83 @@ def test_state_detects_change(tmp_path):
     decision2 = store.should_reindex()
     assert decision2["need"] is True
     assert decision2["reason"] == "hash_changed"
+
+
+def test_state_diff_reports_changed_and_removed_skills(tmp_path):
+    for name in ("alpha", "beta", "gamma"):
+        skill_dir = tmp_path / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\n---\nbody\n", encoding="utf-8")
+
+    store = _make_store(tmp_path)
+    decision = store.should_reindex()
+    store.persist_state(decision["state"])
+
+    (tmp_path / "skills" / "alpha" / "SKILL.md").write_text(
+        "---\nname: alpha\n---\nnew body\n", encoding="utf-8"
+    )
+    (tmp_path / "skills" / "beta" / "SKILL.md").unlink()
+    (tmp_path / "skills" / "beta").rmdir()
+    new_dir = tmp_path / "skills" / "ns" / "delta"
+    new_dir.mkdir(parents=True)
+    (new_dir / "SKILL.md").write_text("---\nname: delta\n---\nbody\n", encoding="utf-8")
+
+    decision2 = store.should_reindex()
+    changed, removed = store.state_store.diff_skills(decision2["previous"], decision2["state"])
+    assert changed == {"alpha", "ns/delta"}
+    assert removed == {"beta"}
+
+
+def test_state_diff_requires_fingerprints(tmp_path):
+    store = _make_store(tmp_path)
+    current = store.state_store.build_current_state({"embedding_provider": "none"})
+    assert store.state_store.diff_skills(None, current) is None
+    assert store.state_store.diff_skills({"skills_hash": "sha256:x"}, current) is None
+
+
+def test_unchanged_files_are_not_reread(tmp_path, monkeypatch):
+    for name in ("alpha", "beta"):
+        skill_dir = tmp_path / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\n---\nbody\n", encoding="utf-8")
+
+    store = _make_store(tmp_path)
+    store.persist_state(store.should_reindex()["state"])
+
+    reads: list[Path] = []
+    original = Path.read_bytes
+
+    def _counting_read_bytes(self):
+        reads.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _counting_read_bytes)
+
+    assert store.should_reindex()["reason"] == "unchanged"
+    assert reads == []
+
+    (tmp_path / "skills" / "beta" / "SKILL.md").write_text(
+        "---\nname: beta\n---\nchanged body\n", encoding="utf-8"
+    )
+    decision = store.should_reindex()
+    assert decision["reason"] == "hash_changed"
+    assert [p.parent.name for p in reads] == ["beta"]
+
+
+def test_touched_but_identical_file_is_not_a_delta(tmp_path):
+    import os
+
+    skill_dir = tmp_path / "skills" / "alpha"
+    skill_dir.mkdir(parents=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: alpha\n---\nbody\n", encoding="utf-8")
+
+    store = _make_store(tmp_path)
+    store.persist_state(store.should_reindex()["state"])
+
+    st = skill_md.stat()
+    os.utime(skill_md, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+    decision = store.should_reindex()
+    assert decision["reason"] == "hash_changed"
+    assert store.state_store.diff_skills(decision["previous"], decision["state"]) == (set(), set())
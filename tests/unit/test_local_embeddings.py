@@ -0,0 +1,55 @@
+"""Offline hashed n-gram embeddings (embedding_provider='local')."""
+
+import math
+
+from skillport.modules.indexing.internal import embeddings
+from skillport.modules.indexing.internal.local_embeddings import hashed_ngram_embeddings
+from skillport.modules.indexing.internal.state import embedding_signature
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+def test_vectors_are_deterministic_unit_length():
+    first, empty = hashed_ngram_embeddings(["Extract text from PDF files", ""], 64)
+    again = hashed_ngram_embeddings(["Extract text from PDF files"], 64)[0]
+
+    assert len(first) == 64
+    assert first == again
+    assert math.isclose(math.fsum(v * v for v in first), 1.0, rel_tol=1e-5)
+    assert empty == [0.0] * 64
+
+
+def test_related_texts_are_closer():
+    query, plural, unrelated = hashed_ngram_embeddings(
+        ["merge pdf file", "merge pdf files together", "schedule calendar meetings"], 256
+    )
+    assert _cosine(query, plural) > 0.5
+    assert _cosine(query, plural) > _cosine(query, unrelated)
+
+
+def test_local_provider_skips_cache_and_network(make_config, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("local provider must not touch the cache or OpenAI")
+
+    monkeypatch.setattr(embeddings, "_cache_for", fail)
+    monkeypatch.setattr(embeddings, "_openai_client", fail)
+    cfg = make_config(embedding_provider="local", local_embedding_dimensions=32)
+
+    vectors = embeddings.get_embeddings(["pdf  tools", "git"], cfg)
+
+    assert [len(v) for v in vectors] == [32, 32]
+    assert vectors[0] == hashed_ngram_embeddings(["pdf tools"], 32)[0]
+
+
+def test_signature_tracks_dimensions(make_config):
+    small = embedding_signature(
+        make_config(embedding_provider="local", local_embedding_dimensions=64)
+    )
+    large = embedding_signature(
+        make_config(embedding_provider="local", local_embedding_dimensions=128)
+    )
+
+    assert small["embedding_provider"] == "local"
+    assert small["embedding_model"] != large["embedding_model"]
@@ -0,0 +1,64 @@
+"""In-memory BM25 engine used by index_backend='memory'."""
+
+import pytest
+
+from skillport.modules.indexing.internal.memory import MemoryIndex, tokenize
+from skillport.shared.config import Config
+
+
+def _row(skill_id, name=None, description="", tags=(), category=""):
+    return {
+        "id": skill_id,
+        "name": name or skill_id.split("/")[-1],
+        "description": description,
+        "tags": list(tags),
+        "category": category,
+    }
+
+
+ROWS = [
+    _row("pdf-tools", description="Extract text and tables from PDF documents", tags=["pdf"]),
+    _row("ns/report-writer", description="Write reports; can attach a pdf export"),
+    _row("git-helper", description="Draft commit messages", category="dev"),
+]
+
+
+def _ids(index, query, allowed=lambda row: True):
+    return [index.rows[doc]["id"] for doc, _ in index.search(query, allowed=allowed)]
+
+
+def test_tokenize_splits_ids_and_punctuation():
+    assert tokenize("ns/Report-Writer_v2: PDF!") == ["ns", "report", "writer", "v2", "pdf"]
+
+
+def test_name_and_tag_matches_outrank_description_matches():
+    assert _ids(MemoryIndex(ROWS), "pdf") == ["pdf-tools", "ns/report-writer"]
+
+
+def test_prefix_terms_match_at_reduced_weight():
+    index = MemoryIndex(ROWS)
+    assert _ids(index, "comm") == ["git-helper"]
+    exact = index.search("commit", allowed=lambda row: True)[0][1]
+    prefix = index.search("comm", allowed=lambda row: True)[0][1]
+    assert 0 < prefix < exact
+
+
+def test_single_character_queries_do_not_expand():
+    assert _ids(MemoryIndex(ROWS), "p") == []
+
+
+def test_allowed_predicate_filters_hits():
+    index = MemoryIndex(ROWS)
+    assert _ids(index, "pdf", allowed=lambda row: row["id"].startswith("ns/")) == [
+        "ns/report-writer"
+    ]
+
+
+def test_memory_backend_requires_no_embeddings(tmp_path):
+    with pytest.raises(ValueError, match="index_backend='memory'"):
+        Config(
+            skills_dir=tmp_path,
+            index_backend="memory",
+            embedding_provider="openai",
+            openai_api_key="sk-test",
+        )
@@ -0,0 +1,121 @@
+"""Ranged, line-based and chunked reads in read_file_in_skill_dir."""
+
+import base64
+
+import pytest
+
+from skillport.modules.skills.public import read
+from skillport.modules.skills.public.read import read_file_in_skill_dir
+
+
+def _read_all(tmp_path, name, cfg, **kwargs):
+    chunks = [read_file_in_skill_dir(tmp_path, name, config=cfg, **kwargs)]
+    while chunks[-1].next_token:
+        chunks.append(
+            read_file_in_skill_dir(
+                tmp_path, name, config=cfg, continuation_token=chunks[-1].next_token
+            )
+        )
+    return chunks
+
+
+def test_byte_range(tmp_path, make_config):
+    (tmp_path / "data.txt").write_text("0123456789", encoding="utf-8")
+
+    result = read_file_in_skill_dir(
+        tmp_path, "data.txt", config=make_config(skills_dir=tmp_path), offset=2, length=5
+    )
+
+    assert (result.content, result.offset, result.length, result.size) == ("23456", 2, 5, 10)
+    assert result.next_token is None
+
+
+def test_line_range(tmp_path, make_config):
+    (tmp_path / "lines.md").write_text("a\nb\nc\nd\n", encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path)
+
+    assert (
+        read_file_in_skill_dir(tmp_path, "lines.md", config=cfg, start_line=2, end_line=3).content
+        == "b\nc\n"
+    )
+    assert read_file_in_skill_dir(tmp_path, "lines.md", config=cfg, start_line=4).content == "d\n"
+    assert read_file_in_skill_dir(tmp_path, "lines.md", config=cfg, start_line=9).content == ""
+    with pytest.raises(ValueError):
+        read_file_in_skill_dir(tmp_path, "lines.md", config=cfg, start_line=3, end_line=2)
+
+
+@pytest.mark.parametrize("mmap_min_bytes", [0, 1 << 20])
+def test_large_text_file_pages_on_line_breaks(tmp_path, make_config, monkeypatch, mmap_min_bytes):
+    monkeypatch.setattr(read, "MMAP_MIN_BYTES", mmap_min_bytes)
+    text = "".join(f"line {i} — ünïcode\n" for i in range(200))
+    (tmp_path / "big.yaml").write_text(text, encoding="utf-8")
+
+    chunks = _read_all(tmp_path, "big.yaml", make_config(skills_dir=tmp_path, max_file_bytes=100))
+
+    assert len(chunks) > 10
+    assert "".join(c.content for c in chunks) == text
+    assert all(c.encoding == "utf-8" and c.content.endswith("\n") for c in chunks)
+    assert all(c.length <= 100 for c in chunks)
+
+
+def test_long_line_is_cut_on_utf8_boundary(tmp_path, make_config):
+    text = "é" * 100  # two bytes per character, no line breaks
+    (tmp_path / "wide.txt").write_text(text, encoding="utf-8")
+
+    chunks = _read_all(tmp_path, "wide.txt", make_config(skills_dir=tmp_path, max_file_bytes=33))
+
+    assert "".join(c.content for c in chunks) == text
+    assert all(c.encoding == "utf-8" for c in chunks)
+
+
+def test_binary_file_pages_as_base64(tmp_path, make_config):
+    payload = bytes(range(256)) * 4
+    (tmp_path / "blob.bin").write_bytes(payload)
+
+    chunks = _read_all(tmp_path, "blob.bin", make_config(skills_dir=tmp_path, max_file_bytes=300))
+
+    assert [c.offset for c in chunks] == [0, 300, 600, 900]
+    assert b"".join(base64.b64decode(c.content) for c in chunks) == payload
+
+
+def test_continuation_token_rejects_changed_or_other_file(tmp_path, make_config):
+    (tmp_path / "a.txt").write_text("x" * 50, encoding="utf-8")
+    (tmp_path / "b.txt").write_text("y" * 50, encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path, max_file_bytes=20)
+    token = read_file_in_skill_dir(tmp_path, "a.txt", config=cfg).next_token
+
+    with pytest.raises(ValueError, match="another file"):
+        read_file_in_skill_dir(tmp_path, "b.txt", config=cfg, continuation_token=token)
+    with pytest.raises(ValueError, match="Invalid"):
+        read_file_in_skill_dir(tmp_path, "a.txt", config=cfg, continuation_token="garbage")
+
+    (tmp_path / "a.txt").write_text("z" * 60, encoding="utf-8")
+    with pytest.raises(ValueError, match="changed"):
+        read_file_in_skill_dir(tmp_path, "a.txt", config=cfg, continuation_token=token)
+
+
+def test_continuation_token_range_must_be_inside_the_file(tmp_path, make_config):
+    target = tmp_path / "a.txt"
+    target.write_text("x" * 50, encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path, max_file_bytes=20)
+    etag = read_file_in_skill_dir(tmp_path, "a.txt", config=cfg).etag
+
+    for start, end in [(-1, 10), (30, 20), (10, 51)]:
+        token = read._encode_token(target, target.stat(), start, end, etag)
+        with pytest.raises(ValueError, match="outside the file"):
+            read_file_in_skill_dir(tmp_path, "a.txt", config=cfg, continuation_token=token)
+
+
+def test_continuation_reads_do_not_rehash(tmp_path, make_config, monkeypatch):
+    (tmp_path / "a.txt").write_text("x\n" * 50, encoding="utf-8")
+    cfg = make_config(skills_dir=tmp_path, max_file_bytes=20).with_overrides(file_cache_bytes=0)
+    first = read_file_in_skill_dir(tmp_path, "a.txt", config=cfg)
+    read.file_cache(0).clear()  # as if the memoized etag had been evicted
+    hashed = []
+    real_etag = read.content_etag
+    monkeypatch.setattr(read, "content_etag", lambda view: hashed.append(1) or real_etag(view))
+
+    chunks = _read_all(tmp_path, "a.txt", cfg, continuation_token=first.next_token)
+
+    assert hashed == []
+    assert {c.etag for c in chunks} == {first.etag}
@@ -0,0 +1,108 @@
+"""SearchService result cache keyed by index version."""
+
+from skillport.modules.indexing.internal import search_service
+from skillport.modules.indexing.internal.search_service import SearchService
+
+
+class CountingTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def search(self, *_args, **_kwargs):
+        self.calls += 1
+        return self
+
+    def where(self, *_args, **_kwargs):
+        return self
+
+    def select(self, _columns):
+        return self
+
+    def limit(self, _n):
+        return self
+
+    def to_list(self):
+        return [dict(row) for row in self.rows]
+
+
+def _service(embed_calls: list[str], **kwargs) -> SearchService:
+    def _embed(query):
+        embed_calls.append(query)
+        return None
+
+    return SearchService(search_threshold=0.0, embed_fn=_embed, **kwargs)
+
+
+def _search(service, table, query="pdf", token=("v", 1), limit=5):
+    return service.search(
+        table,
+        query,
+        limit=limit,
+        prefilter="",
+        normalize_query=lambda q: " ".join(q.split()),
+        cache_token=token,
+    )
+
+
+def test_repeated_query_skips_table_and_embeddings():
+    embeds: list[str] = []
+    table = CountingTable([{"id": "a", "_score": 1.0}])
+    service = _service(embeds)
+
+    first = _search(service, table)
+    second = _search(service, table, query="  pdf ")
+
+    assert first == second
+    assert table.calls == 1
+    assert embeds == ["pdf"]
+
+
+def test_new_index_version_misses_and_evicts_old_entries():
+    table = CountingTable([{"id": "a", "_score": 1.0}])
+    service = _service([])
+
+    _search(service, table, token=("v", 1))
+    _search(service, table, token=("v", 2))
+    _search(service, table, token=("v", 2))
+
+    assert table.calls == 2
+    assert len(service._cache) == 1
+
+
+def test_limit_is_part_of_the_key():
+    table = CountingTable([{"id": "a", "_score": 1.0}])
+    service = _service([])
+    _search(service, table, limit=5)
+    _search(service, table, limit=6)
+    assert table.calls == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_service.time, "monotonic", lambda: now[0])
+    table = CountingTable([{"id": "a", "_score": 1.0}])
+    service = _service([], cache_ttl=10)
+
+    _search(service, table)
+    now[0] += 11
+    _search(service, table)
+
+    assert table.calls == 2
+
+
+def test_no_token_or_zero_size_disables_cache():
+    table = CountingTable([{"id": "a", "_score": 1.0}])
+    _search(_service([]), table, token=None)
+    _search(_service([]), table, token=None)
+    service = _service([], cache_size=0)
+    _search(service, table)
+    _search(service, table)
+    assert table.calls == 4
+
+
+def test_cached_rows_are_copies():
+    table = CountingTable([{"id": "a", "_score": 1.0}])
+    service = _service([])
+    _search(service, table)[0]["id"] = "mutated"
+    assert _search(service, table)[0]["id"] == "a"
@@ -0,0 +1,90 @@
+"""Shared skills_dir scanner (shared/scan.py) and its reuse by build_index."""
+
+import os
+
+import pytest
+
+from skillport.modules.indexing import build_index
+from skillport.modules.indexing.internal import records, state
+from skillport.shared import scan as scan_module
+from skillport.shared.config import Config
+from skillport.shared.scan import scan_skills
+
+
+def _skill(path, name=None):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "SKILL.md").write_text(
+        f"---\nname: {name or path.name}\ndescription: d\n---\nbody\n", encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "skills"
+    _skill(root / "flat")
+    _skill(root / "ns" / "nested")
+    _skill(root / "ns" / "nested" / "deep")  # third level: ignored
+    _skill(root / ".hidden" / "secret")
+    _skill(root / "flat" / "node_modules" / "pkg")
+    (root / "ns" / "assets" / "SKILL.md").mkdir(parents=True)  # a directory, not a file
+    return root
+
+
+def test_finds_two_levels_and_prunes(tree):
+    snapshot = scan_skills(tree)
+
+    assert [s.id for s in snapshot] == ["flat", "ns/nested"]
+    skill = snapshot.skills[1]
+    st = os.stat(tree / "ns" / "nested" / "SKILL.md")
+    assert (skill.path, skill.mtime_ns, skill.size, skill.inode) == (
+        tree / "ns" / "nested",
+        st.st_mtime_ns,
+        st.st_size,
+        st.st_ino,
+    )
+    assert skill.rel_skill_md == "ns/nested/SKILL.md"
+
+
+def test_never_lists_below_second_level(tree, monkeypatch):
+    listed = []
+    real_scandir = os.scandir
+
+    def spy(path):
+        listed.append(os.path.relpath(path, tree))
+        return real_scandir(path)
+
+    monkeypatch.setattr(scan_module.os, "scandir", spy)
+    scan_skills(tree, workers=1)
+
+    assert sorted(listed) == [".", "flat", "ns"]
+
+
+def test_parallel_scan_matches_serial(tmp_path):
+    root = tmp_path / "skills"
+    for i in range(40):
+        _skill(root / f"ns{i}" / "skill")
+        _skill(root / f"top{i}")
+
+    assert scan_skills(root, workers=8) == scan_skills(root, workers=1)
+    assert len(scan_skills(root)) == 80
+
+
+def test_missing_dir_is_empty(tmp_path):
+    assert len(scan_skills(tmp_path / "missing")) == 0
+
+
+def test_build_index_scans_once(tree, tmp_path, monkeypatch):
+    calls = []
+
+    def counting(skills_dir, **kwargs):
+        calls.append(skills_dir)
+        return scan_skills(skills_dir, **kwargs)
+
+    monkeypatch.setattr(state, "scan_skills", counting)
+    monkeypatch.setattr(records, "scan_skills", counting)
+    config = Config(skills_dir=tree, db_path=tmp_path / "db" / "skills.lancedb")
+
+    result = build_index(config=config, force=True)
+
+    assert result.skill_count == 2
+    assert calls == [tree]
@@ -20,10 +20,10 @@ class TestRegisteredToolsList:
         assert tools == ["search_skills", "load_skill"]
         assert "read_skill_file" not in tools
 
-    def test_remote_mode_three_tools(self):
-        """Remote mode (HTTP) registers 3 tools including read_skill_file."""
+    def test_remote_mode_four_tools(self):
+        """Remote mode (HTTP) registers 4 tools including load_skills and read_skill_file."""
         tools = _get_registered_tools_list(is_remote=True)
-        assert tools == ["search_skills", "load_skill", "read_skill_file"]
+        assert tools == ["search_skills", "load_skill", "load_skills", "read_skill_file"]
 
 
 class TestDynamicInstructions: